@@ -1,16 +1,18 @@
 import dash
 from dash import dcc, html, Output, Input, State
 from pathlib import Path
+import threading
 from plotly import express as px
 import dash_bootstrap_components as dbc
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
-from utility import scoring
+from utility import cache, helpers, scoring
 from utility.scoring import load_config
-from models.auction import (
-    all_players_sorted,
-    compute_values,
-)
+from models.auction import compute_values, weekly_values
+from models.draft_simulation import simulate_config
+from models.inflation import InflationEngine
+from models.roster_solver import RosterSolver
 
 settings_path = Path("assets/settings.json")
 initial_settings = load_config(settings_path)
@@ -23,9 +25,62 @@ TEAM_NAMES = initial_settings.get('league', {}).get(
 )
 NUM_TEAMS = len(TEAM_NAMES)
 INITIAL_BUDGET = initial_settings.get('league', {}).get('initial_budget', 200)
+ROSTER_SIZE = scoring.compile_scoring_config(initial_settings).roster_size
 
 draft_history = []
 
+
+def league_settings(config=None):
+    """Team names, budget and roster size of ``config``.
+
+    Without a config the settings loaded at startup are used.  Team names
+    come from ``league.team_names``, trimmed or padded to ``num_teams``.
+    """
+
+    if not config:
+        return TEAM_NAMES, INITIAL_BUDGET, ROSTER_SIZE
+    plan = scoring.compile_scoring_config(config)
+    names = list((config.get('league') or {}).get('team_names') or [])[:plan.num_teams]
+    names += [f'Team {i}' for i in range(len(names) + 1, plan.num_teams + 1)]
+    return names, plan.initial_budget, plan.roster_size
+
+
+# The draft board's InflationEngine, keyed by league settings and player pool.
+_board = {}
+_board_lock = threading.RLock()
+
+
+def board_engine(df, config=None):
+    """The draft board's :class:`InflationEngine`, in step with ``df``.
+
+    One engine is kept between callbacks and :func:`update_draft` applies
+    picks and undos to it.  It is rebuilt from ``df`` only when the league
+    settings, the player pool or the drafted players no longer match.
+    Callers hold ``_board_lock`` while they use it.
+    """
+
+    settings = league_settings(config)
+    key = (tuple(settings[0]), *settings[1:], cache.data_version(df[['Name', 'VORP']]))
+    drafted = df['Drafted'].eq(True).to_numpy()
+    with _board_lock:
+        engine = _board.get(key)
+        if engine is None or not np.array_equal(engine.drafted, drafted):
+            order = [name for name, _, _ in draft_history]
+            engine = InflationEngine.from_players(df, *settings, order=order)
+            _board.clear()
+            _board[key] = engine
+        return engine
+
+
+def with_live_values(df, config=None):
+    """Add the inflation-adjusted ``LiveValue`` of every undrafted player."""
+
+    df = df.copy()
+    with _board_lock:
+        df['LiveValue'] = board_engine(df, config).live_values().round(2)
+    return df
+
+
 app = dash.Dash(
     __name__,
     use_pages=True,
@@ -80,7 +135,7 @@ def update_player_data(config, current_data):
         new_players['Drafted'] = False
         new_players['DraftedBy'] = ''
         new_players['PricePaid'] = 0
-    return new_players.to_dict('records')
+    return with_live_values(new_players, cfg).to_dict('records')
 
 
 @app.callback(
@@ -90,23 +145,30 @@ def update_player_data(config, current_data):
     [State('draft-name', 'value'),
      State('draft-team', 'value'),
      State('draft-price', 'value'),
-     State('player-data', 'data')],
+     State('player-data', 'data'),
+     State('scoring-config', 'data')],
     prevent_initial_call=True,
 )
-def update_draft(draft_clicks, undo_clicks, draft_name, draft_team, draft_price, data):
+def update_draft(draft_clicks, undo_clicks, draft_name, draft_team, draft_price, data, config=None):
     ctx = dash.callback_context
     if data is None:
         raise dash.exceptions.PreventUpdate
     df = pd.DataFrame(data)
-    if ctx.triggered and ctx.triggered[0]['prop_id'] == 'draft-button.n_clicks':
-        if draft_name and draft_team and draft_price is not None:
-            player = df[df['Name'] == draft_name]
-            if not player.empty and not player.iloc[0]['Drafted']:
-                draft_history.append((draft_name, draft_team, draft_price))
-                df.loc[df['Name'] == draft_name, ['Drafted', 'DraftedBy', 'PricePaid']] = [True, draft_team, draft_price]
-    elif ctx.triggered and ctx.triggered[0]['prop_id'] == 'undo-button.n_clicks' and draft_history:
-        last_draft = draft_history.pop()
-        df.loc[df['Name'] == last_draft[0], ['Drafted', 'DraftedBy', 'PricePaid']] = [False, '', 0]
+    with _board_lock:
+        engine = board_engine(df, config)
+        if ctx.triggered and ctx.triggered[0]['prop_id'] == 'draft-button.n_clicks':
+            if draft_name and draft_team and draft_price is not None:
+                player = df[df['Name'] == draft_name]
+                if not player.empty and not player.iloc[0]['Drafted']:
+                    engine.pick(draft_name, draft_team if draft_team in engine.budgets else None, float(draft_price))
+                    draft_history.append((draft_name, draft_team, draft_price))
+                    df.loc[df['Name'] == draft_name, ['Drafted', 'DraftedBy', 'PricePaid']] = [True, draft_team, draft_price]
+        elif ctx.triggered and ctx.triggered[0]['prop_id'] == 'undo-button.n_clicks' and draft_history:
+            last_draft = draft_history.pop()
+            engine.undo()
+            df.loc[df['Name'] == last_draft[0], ['Drafted', 'DraftedBy', 'PricePaid']] = [False, '', 0]
+        # Rebuilt only if the undo did not match the board.
+        df['LiveValue'] = board_engine(df, config).live_values().round(2)
     return df.to_dict('records')
 
 
@@ -123,17 +185,28 @@ def update_table(data):
         Output('team-summary-display', 'children'),
     ],
     [Input('player-data', 'data'), Input('team-selector', 'value')],
+    State('scoring-config', 'data'),
 )
-def update_summaries(data, selected_team):
+def update_summaries(data, selected_team, config=None):
     df = pd.DataFrame(data or [])
     value_dist = px.box(df, x='Position', y='AuctionValue', title='Auction Value Distribution by Position')
     top_players = px.bar(df.head(20), x='Name', y='AuctionValue', color='Position', title='Top 20 Players by Auction Value')
     top_players.update_layout(xaxis={'categoryorder': 'total descending'})
 
+    team_names, budget, _ = league_settings(config)
     drafted_players = df[df['Drafted']]
+    inflation, max_bids = None, {}
+    if 'VORP' in df:
+        with _board_lock:
+            engine = board_engine(df, config)
+            inflation, max_bids = engine.inflation, engine.max_bids()
     summary = [
         html.P(f"Total Players Drafted: {len(drafted_players)}"),
         html.P(f"Total Spend: ${drafted_players['PricePaid'].sum():.2f}"),
+    ]
+    if inflation is not None:
+        summary.append(html.P(f"Inflation: {inflation:.2f}x"))
+    summary += [
         html.P("Top Drafted Players:"),
         html.Ul([
             html.Li(f"{row['Name']} - {row['DraftedBy']} - ${row['PricePaid']}")
@@ -144,14 +217,14 @@ def update_summaries(data, selected_team):
     team_summary_df = (
         drafted_players.groupby('DraftedBy')
         .agg(Players=('Name', 'count'), Spend=('PricePaid', 'sum'))
-        .reindex(TEAM_NAMES, fill_value=0)
+        .reindex(team_names, fill_value=0)
     )
-    team_summary_df['Remaining'] = INITIAL_BUDGET - team_summary_df['Spend']
+    team_summary_df['Remaining'] = budget - team_summary_df['Spend']
 
     if selected_team in team_summary_df.index:
         team_row = team_summary_df.loc[selected_team]
     else:
-        team_row = pd.Series({'Players': 0, 'Spend': 0.0, 'Remaining': INITIAL_BUDGET})
+        team_row = pd.Series({'Players': 0, 'Spend': 0.0, 'Remaining': budget})
 
     position_counts = (
         drafted_players[drafted_players['DraftedBy'] == selected_team]['Position']
@@ -164,6 +237,8 @@ def update_summaries(data, selected_team):
         html.Tr([html.Th('Total Spend'), html.Td(f"${team_row['Spend']:.2f}")]),
         html.Tr([html.Th('Remaining Budget'), html.Td(f"${team_row['Remaining']:.2f}")]),
     ]
+    if selected_team in max_bids:
+        table_rows.append(html.Tr([html.Th('Max Bid'), html.Td(f"${max_bids[selected_team]:.2f}")]))
     for pos, count in position_counts.items():
         table_rows.append(html.Tr([html.Th(pos), html.Td(count)]))
 
@@ -172,6 +247,90 @@ def update_summaries(data, selected_team):
     return value_dist, top_players, summary, team_table
 
 
+@app.callback(
+    [Output('sim-price-graph', 'figure'), Output('sim-team-table', 'children')],
+    Input('simulate-button', 'n_clicks'),
+    [State('sim-drafts', 'value'), State('scoring-config', 'data')],
+    prevent_initial_call=True,
+)
+def run_draft_simulation(n_clicks, n_drafts, config):
+    cfg = config or scoring.SCORING_CONFIG_DEFAULT
+    prices, teams = simulate_config(cfg, n_drafts=int(n_drafts or 10000))
+
+    top = prices.head(30)
+    figure = go.Figure([
+        go.Scatter(
+            x=top['Name'],
+            y=top['P50'],
+            mode='markers',
+            name='Median price',
+            error_y={'type': 'data', 'symmetric': False,
+                     'array': top['P90'] - top['P50'], 'arrayminus': top['P50'] - top['P10']},
+        ),
+        go.Scatter(x=top['Name'], y=top['AuctionValue'], mode='markers', name='Auction value',
+                   marker={'symbol': 'x'}),
+    ])
+    figure.update_layout(title='Simulated Prices (10th-90th percentile)', yaxis_title='Price')
+
+    team_names = league_settings(cfg)[0]
+    if len(teams) == len(team_names):
+        teams['Team'] = team_names
+    team_table = dbc.Table.from_dataframe(teams, bordered=True, hover=True, size='sm')
+    return figure, team_table
+
+
+@app.callback(
+    Output('weekly-value-graph', 'figure'),
+    Input('weekly-position', 'value'),
+    Input('scoring-config', 'data'),
+)
+def update_weekly_value(position, config):
+    weekly = weekly_values(config or scoring.SCORING_CONFIG_DEFAULT)
+    weekly = weekly[weekly['Position'] == position]
+    top = weekly.groupby('Name', observed=True)['VORP'].sum().nlargest(25).index
+    grid = (
+        weekly[weekly['Name'].isin(top)]
+        .pivot_table(index='Name', columns='Week', values='VORP', aggfunc='sum')
+        .reindex(top)
+    )
+    figure = px.imshow(
+        grid.round(1),
+        labels={'x': 'Week', 'y': '', 'color': 'VORP'},
+        color_continuous_scale='RdBu',
+        color_continuous_midpoint=0,
+        aspect='auto',
+        title=f'Weekly VORP: top {len(grid)} {position}s',
+    )
+    figure.update_layout(height=650)
+    return figure
+
+
+@app.callback(
+    Output('roster-plan-table', 'children'),
+    Output('max-bid-message', 'children'),
+    Input('player-data', 'data'),
+    Input('draft-team', 'value'),
+    Input('draft-name', 'value'),
+    State('scoring-config', 'data'),
+)
+def update_roster_plan(data, team, name, config):
+    if not data or not team:
+        return html.Div("Select a team to plan its roster."), ''
+    plan = scoring.compile_scoring_config(config or initial_settings)
+    solver = RosterSolver(with_live_values(pd.DataFrame(data), config), plan, team)
+    roster, points = solver.best_roster()
+    if roster.empty:
+        table = html.Div(f"No affordable roster fills {team}'s open slots.")
+    else:
+        roster = roster[['Name', 'Position', 'ModelPoints', 'Cost']].round({'ModelPoints': 1})
+        table = html.Div([
+            dbc.Table.from_dataframe(roster, bordered=True, hover=True, size='sm'),
+            html.Div(f"Projected starter points: {points:.1f} for ${int(roster['Cost'].sum())}"),
+        ])
+    message = f"Max rational bid for {name}: ${solver.max_bid(name)}" if name else ''
+    return table, message
+
+
 @app.callback(Output('player-table', 'dashGridOptions'), Input('search-input', 'value'))
 def update_quick_filter(text):
     return {'pagination': True, 'paginationAutoPageSize': True, 'quickFilterText': text or ''}
@@ -0,0 +1,76 @@
+"""Time the offense and schedule cleaning against the old row-wise versions.
+
+The legacy functions below are the per-column loop and ``apply(lambda)``
+passes that :func:`utility.helpers.clean_offense_data` and
+:func:`utility.helpers.clean_schedule` used before they were vectorized.
+The old offense loop tested ``x is str``, so it never stripped anything;
+it is timed both as written and with the strip working.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_cleaning
+"""
+
+import time
+import warnings
+
+import pandas as pd
+
+from utility import helpers
+
+REPEATS = 20
+
+
+def _legacy_offense(df, strip=False):
+    df = df.rename(columns={'_position': 'Position', '_team': 'Team', 'Lost': 'Fum'})
+    df = df.drop(columns=['FumTD', 'TwoPt'])
+    main_cols = ['Name', 'Position', 'Team', 'Opp', 'Week']
+    df = df[main_cols + [c for c in df.columns if c not in main_cols + ['Player']]]
+    for c in df.columns:
+        if c not in ['Name', 'Position', 'Team', 'Opp']:
+            df[c] = df[c].astype(float)
+        else:
+            df[c] = df[c].astype(str)
+            if strip:
+                df[c] = df[c].apply(lambda x: x.strip() if isinstance(x, str) else x)
+            else:
+                df[c] = df[c].apply(lambda x: x.strip() if x is str else x)
+    return df
+
+
+def _legacy_schedule(df):
+    df_long = pd.melt(df, id_vars=['TEAM'], var_name='Week', value_name='Opponent')
+    df_long['Week'] = df_long['Week'].apply(lambda x: int(x) if x else x)
+    df_long['Location'] = df_long['Opponent'].apply(lambda x: 'Away' if '@' in x else 'Home')
+    df_long['Opponent'] = df_long['Opponent'].str.replace('@', '').str.strip()
+    df_long['Game_Type'] = df_long['Opponent'].apply(lambda x: 'BYE' if x == 'BYE' else 'Game')
+    df_long['Opponent'] = df_long['Opponent'].replace('BYE', 'None')
+    return df_long.sort_values(by=['TEAM', 'Week'])
+
+
+def _time(fn, df):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn(df.copy())
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    # The legacy loop assigns into a slice.
+    warnings.simplefilter('ignore')
+    offense = helpers.get_offense_data()
+    schedule = helpers.get_schedule()
+
+    print(f'offense {offense.shape}, schedule {schedule.shape}, {REPEATS} runs each')
+    for name, legacy, current, df in [
+        ('clean_offense_data', _legacy_offense, helpers.clean_offense_data, offense),
+        ('  (legacy stripping)', lambda df: _legacy_offense(df, strip=True), helpers.clean_offense_data, offense),
+        ('clean_schedule', _legacy_schedule, helpers.clean_schedule, schedule),
+    ]:
+        before = _time(legacy, df)
+        after = _time(current, df)
+        print(f'{name:<22}{before * 1000:>8.2f} ms -> {after * 1000:>6.2f} ms  ({before / after:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
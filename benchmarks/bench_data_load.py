@@ -0,0 +1,51 @@
+"""Time loading every CSV under ``data/`` through the datastore caches.
+
+* cold: no caches, every file parsed from text (and its Feather copy written);
+* disk: fresh process state, frames read from the Feather files;
+* memory: frames served from the in-process cache.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_data_load
+"""
+
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from utility import datastore
+
+DATA_DIR = Path(__file__).resolve().parents[1] / 'data'
+
+
+def _load_all(paths):
+    start = time.perf_counter()
+    for path in paths:
+        datastore.read_csv(path)
+    return time.perf_counter() - start
+
+
+def main():
+    paths = sorted(DATA_DIR.rglob('*.csv'))
+
+    start = time.perf_counter()
+    for path in paths:
+        pd.read_csv(path)
+    plain = time.perf_counter() - start
+
+    datastore.clear(disk=True, root=DATA_DIR)
+    cold = _load_all(paths)
+    datastore.clear()
+    disk = _load_all(paths)
+    memory = _load_all(paths)
+
+    print(f'files: {len(paths)}  ({datastore.stats})')
+    print(f'pandas.read_csv: {plain * 1000:.1f} ms')
+    print(f'cold (parse + write): {cold * 1000:.1f} ms')
+    print(f'warm from disk: {disk * 1000:.1f} ms')
+    print(f'warm from memory: {memory * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Compare the memory of the projection datasets with and without compact dtypes.
+
+Builds the offense and per-position datasets both ways, prints the
+registry's memory report side by side and times auction values on each.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_dataset_memory
+"""
+
+import time
+
+from models import auction
+from utility import cache, datasets
+
+PROJECTIONS = ['offense'] + [f'position:{pos}' for pos in datasets.POSITIONS]
+
+
+def _build(compact):
+    registry = datasets.registry
+    registry.set_compact(compact)
+    for name in PROJECTIONS:
+        registry.get(name)
+    report = registry.memory_report().set_index('Dataset').loc[PROJECTIONS, 'Bytes']
+
+    cache.results.clear()
+    start = time.perf_counter()
+    auction.AuctionPipeline().values(auction.DEFAULT_CONFIG)
+    return report, time.perf_counter() - start
+
+
+def main():
+    full, full_time = _build(False)
+    compact, compact_time = _build(True)
+
+    print(f'{"dataset":<14}{"default KB":>12}{"compact KB":>12}{"ratio":>8}')
+    for name in PROJECTIONS:
+        print(f'{name:<14}{full[name] / 1024:>12.0f}{compact[name] / 1024:>12.0f}{full[name] / compact[name]:>8.1f}')
+    print(f'{"total":<14}{full.sum() / 1024:>12.0f}{compact.sum() / 1024:>12.0f}{full.sum() / compact.sum():>8.1f}')
+    print(f'auction values: {full_time * 1000:.0f} ms default, {compact_time * 1000:.0f} ms compact')
+
+
+if __name__ == '__main__':
+    main()
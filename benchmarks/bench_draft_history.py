@@ -0,0 +1,152 @@
+"""Time draft-history logging and reads: pooled WAL connections vs. per-call.
+
+The baseline is the old helpers code: a fresh ``sqlite3`` connection per
+call on a rollback-journal database.  Each mode gets its own temporary
+database and is measured twice:
+
+* throughput: a draft of ``PICKS`` picks, saving the board after each
+  pick the way the draft board page does, then re-saving the finished
+  board unchanged;
+* read latency: ``get_draft_history`` in a loop while ``WRITERS`` threads
+  keep logging picks in short transactions.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_draft_history
+"""
+
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utility import database, helpers
+
+PICKS = 150
+BOARD = 300
+WRITERS = 2
+READS = 200
+RESAVES = 20
+SEASON = 2025
+
+
+def _legacy_log(df, season):
+    conn = sqlite3.connect(helpers.DB_FILE)
+    cur = conn.cursor()
+    for _, row in df.iterrows():
+        owner = str(row.get('Owner', '')).strip()
+        if owner:
+            cur.execute('SELECT 1 FROM draft_picks WHERE season=? AND player=?', (season, row['Name']))
+            if not cur.fetchone():
+                cur.execute(
+                    'INSERT INTO draft_picks(timestamp, season, player, position, team, owner, price) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (datetime.utcnow().isoformat(), season, row['Name'], row.get('Position'), row.get('Team'), owner, float(row.get('Price', 0))),
+                )
+    conn.commit()
+    conn.close()
+
+
+def _legacy_read(season=None):
+    conn = sqlite3.connect(helpers.DB_FILE)
+    df = pd.read_sql_query('SELECT * FROM draft_picks WHERE season=?', conn, params=(season,))
+    conn.close()
+    return df
+
+
+def _legacy_insert(name):
+    conn = sqlite3.connect(helpers.DB_FILE)
+    conn.execute("INSERT INTO draft_picks(timestamp, season, player) VALUES ('t', 0, ?)", (name,))
+    conn.commit()
+    conn.close()
+
+
+def _pooled_insert(name):
+    with database.transaction(helpers.DB_FILE) as conn:
+        conn.execute("INSERT INTO draft_picks(timestamp, season, player) VALUES ('t', 0, ?)", (name,))
+
+
+def _create(path, wal):
+    helpers.DB_FILE = str(path)
+    helpers.init_db()
+    helpers.migrate_db()
+    database.close_all()
+    if not wal:
+        # The pool switched the new file to WAL; put it back in rollback mode.
+        conn = sqlite3.connect(path)
+        conn.execute('PRAGMA journal_mode=DELETE')
+        conn.close()
+
+
+def _draft(log):
+    board = pd.DataFrame({
+        'Name': [f'Player {i}' for i in range(BOARD)],
+        'Position': 'WR',
+        'Team': 'KC',
+        'Owner': '',
+        'Price': 0.0,
+    })
+    start = time.perf_counter()
+    for pick in range(PICKS):
+        board.loc[pick, ['Owner', 'Price']] = ['Team 1', 10.0]
+        log(board, SEASON)
+    saves_per_second = PICKS / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for _ in range(RESAVES):
+        log(board, SEASON)
+    return saves_per_second, (time.perf_counter() - start) / RESAVES * 1000
+
+
+def _read_latency(read, insert):
+    stop = threading.Event()
+
+    def writer(n):
+        i = 0
+        while not stop.is_set():
+            insert(f'writer {n} pick {i}')
+            i += 1
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    latencies = []
+    try:
+        for _ in range(READS):
+            start = time.perf_counter()
+            read(SEASON)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    return np.percentile(latencies, [50, 95, 100]) * 1000
+
+
+def main():
+    saved = helpers.DB_FILE
+    root = Path(tempfile.mkdtemp())
+    try:
+        for name, wal, log, read, insert in [
+            ('per-call connections, rollback journal', False, _legacy_log, _legacy_read, _legacy_insert),
+            ('pooled connections, WAL', True, helpers.log_draft_picks, helpers.get_draft_history, _pooled_insert),
+        ]:
+            _create(root / f'{wal}.db', wal)
+            saves_per_second, resave = _draft(log)
+            p50, p95, worst = _read_latency(read, insert)
+            print(
+                f'{name:<40}{saves_per_second:>8.1f} saves/s  unchanged re-save {resave:6.2f} ms   '
+                f'read p50 {p50:6.2f} ms  p95 {p95:6.2f} ms  max {worst:7.2f} ms'
+            )
+            database.close_all()
+    finally:
+        helpers.DB_FILE = saved
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
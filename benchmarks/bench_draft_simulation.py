@@ -0,0 +1,30 @@
+"""Time the Monte Carlo auction simulator for the saved league settings.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_draft_simulation [n_drafts] [workers]
+"""
+
+import os
+import sys
+import time
+
+from models import auction, draft_simulation
+from utility import scoring
+
+
+def main():
+    n_drafts = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    plan = scoring.compile_scoring_config(auction.DEFAULT_CONFIG)
+    players = auction.compute_values(plan)
+
+    start = time.perf_counter()
+    draft_simulation.simulate_drafts(players, plan, n_drafts=n_drafts, workers=workers)
+    elapsed = time.perf_counter() - start
+    print(f'teams: {plan.num_teams}  drafts: {n_drafts}  workers: {workers}')
+    print(f'simulation: {elapsed:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
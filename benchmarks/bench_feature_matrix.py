@@ -0,0 +1,74 @@
+"""Compare training through the feature matrix with the in-memory path.
+
+The baseline is the old ``train_position_model`` body: the full pandas
+feature frame plus an ``np.hstack``-ed intercept copy handed to ``lstsq``.
+The matrix path is timed cold (featurize and write), warm (reuse the
+matrix, rescore and fit in row blocks) and with a changed scoring config.
+Peak Python allocations come from ``tracemalloc``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_feature_matrix
+"""
+
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from utility import helpers  # noqa: F401 - loads before modeling
+from utility import scoring
+from modeling import feature_matrix
+from modeling.features import build_features, load_player_stats, load_prop_history
+
+POSITIONS = ['QB', 'WR']
+RESCORED = {'QB': {'PassTD': {'points': 4}}, 'WR': {'Rec': {'points': 0.5}}}
+
+
+def _in_memory(position):
+    df = load_player_stats('data', position)
+    df['Points'] = scoring.score_frame(df, position)
+    props = load_prop_history()
+    if not props.empty:
+        df = df.merge(props[props['Pos'].str.upper() == position].drop(columns=['Pos']), on='Name', how='left')
+    df = build_features(df)
+    X = df.select_dtypes(include=[float, int]).drop(columns=['Points'])
+    X_mat = np.hstack([np.ones((X.shape[0], 1)), X.values])
+    return np.linalg.lstsq(X_mat, df['Points'].values, rcond=None)[0]
+
+
+def _matrix(position, out_dir, config=None):
+    return feature_matrix.fit(feature_matrix.build(position, 'data', out_dir=out_dir), config)
+
+
+def _measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    out_dir = tempfile.mkdtemp()
+    try:
+        for position in POSITIONS:
+            _in_memory(position)  # warm the datastore and store caches
+            for name, args in [
+                ('in-memory lstsq', (_in_memory, position)),
+                ('matrix, cold build + fit', (_matrix, position, out_dir)),
+                ('matrix, reused', (_matrix, position, out_dir)),
+                ('matrix, reused, new scoring', (_matrix, position, out_dir, RESCORED[position])),
+            ]:
+                seconds, peak = _measure(*args)
+                print(f'{position} {name:<30}{seconds * 1000:>9.1f} ms  peak {peak / 2**20:>7.2f} MiB')
+    finally:
+        shutil.rmtree(out_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Time projection loads through the partitioned store against globbing CSVs.
+
+The baseline is the old ``load_player_stats``: every ``{POS}.csv`` under
+``data/`` read through the datastore and concatenated, timed with its
+in-memory cache warm and cleared (Feather copies only).  The store is
+timed for all seasons, one season, and one season with a week range and a
+column subset.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_projection_store
+"""
+
+import glob
+import os
+import time
+
+import pandas as pd
+
+from utility import datastore, projection_store
+
+REPEATS = 20
+POSITION = 'WR'
+
+
+def _glob_all(position, cold=False):
+    if cold:
+        datastore.clear()
+    files = glob.glob(os.path.join(projection_store.DATA_DIR, '**', f'{position}.csv'), recursive=True)
+    return pd.concat([datastore.read_csv(file) for file in files], ignore_index=True)
+
+
+def _time(fn, *args, **kwargs):
+    fn(*args, **kwargs)
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = fn(*args, **kwargs)
+    return (time.perf_counter() - start) / REPEATS, len(result)
+
+
+def main():
+    start = time.perf_counter()
+    projection_store.sync()
+    print(f'sync: {(time.perf_counter() - start) * 1000:.1f} ms  seasons {projection_store.seasons(POSITION)}')
+
+    latest = projection_store.seasons(POSITION)[-1]
+    for name, fn, kwargs in [
+        ('glob + concat, all seasons', _glob_all, {'position': POSITION}),
+        ('glob + concat, all seasons, cold', _glob_all, {'position': POSITION, 'cold': True}),
+        ('store, all seasons', projection_store.load, {'positions': POSITION}),
+        (f'store, {latest}', projection_store.load, {'seasons': latest, 'positions': POSITION}),
+        (
+            f'store, {latest} weeks 1-4, 3 columns',
+            projection_store.load,
+            {'seasons': latest, 'positions': POSITION, 'weeks': (1, 4), 'columns': ['Name', 'Week', 'Points']},
+        ),
+    ]:
+        seconds, rows = _time(fn, **kwargs)
+        print(f'{name:<38}{seconds * 1000:>8.2f} ms  {rows:>6} rows')
+
+
+if __name__ == '__main__':
+    main()
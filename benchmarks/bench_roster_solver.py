@@ -0,0 +1,37 @@
+"""Time the roster solver on the full player pool for one team.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_roster_solver
+"""
+
+import time
+
+from models import auction
+from models.roster_solver import RosterSolver
+from utility import scoring
+
+
+def _time(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    plan = scoring.compile_scoring_config(auction.DEFAULT_CONFIG)
+    players = auction.default_players()
+    solver = RosterSolver(players, plan, 'Team 1')
+    name = players['Name'].iloc[0]
+
+    print(f'players: {len(solver.pool)}  budget: {solver.budget}  open slots: {solver.open_count}')
+    print(f'build: {_time(lambda: RosterSolver(players, plan, "Team 1")) * 1000:.1f} ms')
+    print(f'best roster: {_time(solver.best_roster) * 1000:.1f} ms')
+    print(f'max bid ({name}): {_time(lambda: solver.max_bid(name)) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
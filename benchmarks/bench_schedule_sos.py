@@ -0,0 +1,73 @@
+"""Time the schedule adjustment and strength-of-schedule queries.
+
+Compares the old merge plus row-wise ``apply`` against the team × week
+gathers of :class:`utility.schedule.ScheduleMatrix` for every player-week of
+the offense projections, then times the cached SOS queries.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_schedule_sos
+"""
+
+import time
+
+from utility import datasets, schedule
+
+REPEATS = 20
+QUERIES = 10_000
+
+
+def _merge_apply(players, sched_df):
+    features = players.merge(
+        sched_df[['TEAM', 'Week'] + schedule.METRICS],
+        left_on=['Team', 'Week'],
+        right_on=['TEAM', 'Week'],
+        how='left',
+    )
+    for col in schedule.METRICS:
+        features[col] = features[col].fillna(0)
+
+    def _adjust(row):
+        multiplier = 1 - row.get('Opp_DVOA', 0) / 100
+        multiplier += row.get('Opp_FantasyPointsAllowed', 0) / 1000
+        return row['Points'] * multiplier
+
+    return features.apply(_adjust, axis=1)
+
+
+def _gather(players, table):
+    return players['Points'].to_numpy() * table.adjustment(players['Team'], players['Week'])
+
+
+def _time(fn, *args, repeats=REPEATS):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn(*args)
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    players = datasets.get('offense')
+    sched_df = datasets.get('schedule')
+
+    start = time.perf_counter()
+    table = schedule.ScheduleMatrix(sched_df)
+    build = time.perf_counter() - start
+
+    merge = _time(_merge_apply, players, sched_df)
+    gather = _time(_gather, players, table)
+    print(f'player-weeks: {len(players)}  matrix {table.opponent.shape} built in {build * 1000:.2f} ms')
+    print(f'merge + apply: {merge * 1000:.2f} ms')
+    print(f'gather:        {gather * 1000:.2f} ms  ({merge / gather:.0f}x)')
+
+    schedule.player_sos(10)
+    schedule.position_sos(10)
+    for name, fn, args in [
+        ('player_sos', schedule.player_sos, (10,)),
+        ('position_sos', schedule.position_sos, (10,)),
+    ]:
+        print(f'{name} (cached): {_time(fn, *args, repeats=QUERIES) * 1e6:.1f} us')
+
+
+if __name__ == '__main__':
+    main()
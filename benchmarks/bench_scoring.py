@@ -0,0 +1,45 @@
+"""Compare row-wise and columnar scoring on the 2025 weekly projections.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_scoring
+"""
+
+import time
+
+from utility import helpers, scoring
+
+
+def _time(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    df = helpers.get_offense_data()
+    df = df.rename(columns={'_position': 'Pos', 'Lost': 'Fum'})
+    df = df[df['Pos'].isin(['QB', 'RB', 'WR', 'TE'])]
+
+    def row_wise():
+        for pos, frame in df.groupby('Pos'):
+            if pos == 'QB':
+                frame.apply(scoring.calculate_qb_points, axis=1)
+            elif pos == 'TE':
+                frame.apply(scoring.calculate_te_points, axis=1)
+            else:
+                frame.apply(scoring.calculate_rb_wr_points, axis=1)
+
+    def columnar():
+        scoring.calculate_prop_points(df)
+
+    print(f'rows: {len(df)}')
+    print(f'row-wise: {_time(row_wise, repeat=1) * 1000:.1f} ms')
+    print(f'columnar: {_time(columnar) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
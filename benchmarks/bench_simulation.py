@@ -0,0 +1,24 @@
+"""Time Monte Carlo scoring of the 2025 weekly projections.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_simulation [n_draws]
+"""
+
+import sys
+import time
+
+from utility import simulation
+
+
+def main():
+    n_draws = int(sys.argv[1]) if len(sys.argv) > 1 else simulation.DEFAULT_DRAWS
+    start = time.perf_counter()
+    result = simulation.simulate_weekly_projections(n_draws=n_draws)
+    elapsed = time.perf_counter() - start
+    print(f'player-weeks: {len(result)}  draws: {n_draws}')
+    print(f'simulation: {elapsed:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
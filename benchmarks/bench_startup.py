@@ -0,0 +1,52 @@
+"""Measure cold import time and peak memory of the project's modules.
+
+Each module is imported in a fresh interpreter so earlier imports cannot
+warm the measurement.  numpy and pandas are imported before the clock
+starts, leaving only the time attributable to the module itself.  Peak
+resident memory is reported for the whole interpreter.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_startup
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MODULES = ['utility.scoring', 'models.auction', 'app']
+PRELOAD = 'import numpy, pandas'
+
+
+def _import_time(module, repeat=5):
+    script = (
+        'import resource, time\n'
+        f'{PRELOAD}\n'
+        'start = time.perf_counter()\n'
+        f'import {module}\n'
+        'print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n'
+    )
+    times, peaks = [], []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed, peak = result.stdout.strip().splitlines()[-1].split()
+        times.append(float(elapsed))
+        peaks.append(int(peak))
+    return min(times), min(peaks)
+
+
+def main():
+    for module in MODULES:
+        elapsed, peak_kb = _import_time(module)
+        print(f'import {module}: {elapsed * 1000:.1f} ms, peak RSS {peak_kb / 1024:.0f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -123,6 +123,13 @@ def create_player_table():
                 "sortable": True,
                 "valueFormatter": {"function": "Number(params.value).toFixed(2)"},
             },
+            {
+                "headerName": "Live Value",
+                "field": "LiveValue",
+                "filter": True,
+                "sortable": True,
+                "valueFormatter": {"function": "Number(params.value).toFixed(2)"},
+            },
             {"headerName": "Drafted", "field": "Drafted", "filter": True, "sortable": True},
             {"headerName": "Drafted By", "field": "DraftedBy", "filter": True, "sortable": True},
             {
@@ -176,6 +183,51 @@ def create_graphs():
         dcc.Graph(id='top-players-graph'),
     ])
 
+def create_weekly_value_panel():
+    return html.Div([
+        html.H3("Weekly Value"),
+        dbc.Row([
+            dbc.Col([
+                dcc.Dropdown(
+                    id='weekly-position',
+                    options=[{'label': pos, 'value': pos} for pos in ['QB', 'RB', 'WR', 'TE']],
+                    value='RB',
+                    clearable=False,
+                ),
+                dbc.Tooltip("Position to chart week by week", target='weekly-position'),
+            ], xs=12, sm=6, md=3),
+        ], className="mb-3 g-2"),
+        dcc.Graph(id='weekly-value-graph'),
+    ], className="mb-4")
+
+
+def create_simulation_panel():
+    return html.Div([
+        html.H3("Draft Simulation"),
+        dbc.Row([
+            dbc.Col([
+                dcc.Input(id='sim-drafts', type='number', min=100, step=100, value=10000, className="form-control"),
+                dbc.Tooltip("Number of auctions to simulate", target='sim-drafts'),
+            ], xs=12, sm=6, md=3),
+            dbc.Col([
+                dbc.Button('Simulate Drafts', id='simulate-button', color="primary"),
+            ], xs=12, sm=6, md=3),
+        ], className="mb-3 g-2"),
+        dcc.Loading([
+            dcc.Graph(id='sim-price-graph'),
+            html.Div(id='sim-team-table'),
+        ]),
+    ], className="mb-4")
+
+
+def create_roster_plan_panel():
+    return html.Div([
+        html.H3("Roster Plan"),
+        html.Div(id='max-bid-message', className="mb-2 font-weight-bold"),
+        html.Div(id='roster-plan-table'),
+    ], className="mb-4")
+
+
 def create_layout(players, team_names, data):
     return dbc.Container([
         dcc.Store(id='player-data', data=data),
@@ -192,5 +244,8 @@ def create_layout(players, team_names, data):
             dbc.Col([create_draft_summary()], width=12)
         ]),
         html.Div(id='draft-message', className="mt-3"),
-        create_graphs()
+        create_roster_plan_panel(),
+        create_graphs(),
+        create_weekly_value_panel(),
+        create_simulation_panel(),
     ], fluid=True)
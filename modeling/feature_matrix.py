@@ -0,0 +1,206 @@
+"""On-disk training matrices.
+
+:func:`build` materializes the training features of one position once, as a
+float32 design matrix that is memory-mapped for training::
+
+    data/features/QB.f32          rows x (1 + features), intercept first
+    data/features/QB.stats.f64    rows x stats, the raw projections
+    data/features/QB.names.npy    player name per row
+    data/features/QB.json         columns, shape and source version
+
+The features do not depend on the scoring settings, so the files are
+reused until the projections or prop lines change; a scoring change only
+recomputes the target from the float64 raw stats.  Seasons are featurized and appended one at a time
+and :func:`fit` reads the matrix in row blocks, so training memory does not
+grow with the number of seasons.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from utility import projection_store, scoring
+from .features import build_features, load_player_stats, load_prop_history
+
+FEATURE_DIR = "features"
+FORMAT_VERSION = 1
+BLOCK_ROWS = 8192
+SCORED_POSITIONS = {"QB", "RB", "WR", "TE"}
+
+
+class FeatureMatrix:
+    """A materialized design matrix and its schema.
+
+    Parameters
+    ----------
+    path : str
+        Path of the ``.f32`` file; the schema and sidecars sit next to it.
+    schema : dict
+        Contents of the ``.json`` schema file.
+    """
+
+    def __init__(self, path: str, schema: dict):
+        self.path = path
+        self.schema = schema
+        self.columns = schema["columns"]
+        self.stat_columns = schema["stat_columns"]
+        self.rows = schema["rows"]
+
+    @property
+    def stem(self) -> str:
+        return self.path[: -len(".f32")]
+
+    def values(self) -> np.ndarray:
+        """Read-only memory map of the matrix, intercept column first."""
+        if not self.rows:
+            return np.zeros((0, len(self.columns) + 1), dtype=np.float32)
+        return np.memmap(self.path, dtype=np.float32, mode="r", shape=(self.rows, len(self.columns) + 1))
+
+    def stats(self) -> np.ndarray:
+        """Read-only memory map of the raw stats, one column per ``stat_columns``."""
+        if not self.rows:
+            return np.zeros((0, len(self.stat_columns)))
+        return np.memmap(f"{self.stem}.stats.f64", dtype=np.float64, mode="r", shape=(self.rows, len(self.stat_columns)))
+
+    def names(self) -> np.ndarray:
+        return np.load(f"{self.stem}.names.npy")
+
+
+def source_version(position: str, data_dir: str = "data", seasons=None, asset_dir: str = "assets") -> str:
+    """Digest of everything the features of ``position`` are built from."""
+    props = []
+    for file in sorted(glob.glob(os.path.join(asset_dir, "season_long_proj_table*.csv"))):
+        info = os.stat(file)
+        props.append([os.path.abspath(file), info.st_mtime_ns, info.st_size])
+    key = {
+        "format": FORMAT_VERSION,
+        "position": position.upper(),
+        "seasons": sorted(int(s) for s in projection_store._as_list(seasons)),
+        "projections": projection_store.version(position, seasons, data_dir),
+        "props": props,
+    }
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def _season_frames(position: str, data_dir: str, seasons, asset_dir: str):
+    """Featurized frames of ``position``, one season at a time."""
+    props = load_prop_history(asset_dir)
+    if not props.empty:
+        props = props[props["Pos"].str.upper() == position.upper()].drop(columns=["Pos"])
+    wanted = projection_store._as_list(seasons) or projection_store.seasons(position, data_dir)
+    for season in wanted:
+        df = load_player_stats(data_dir, position, seasons=season)
+        if df.empty:
+            continue
+        stat_columns = df.select_dtypes(include=[float, int]).columns.tolist()
+        if not props.empty:
+            df = df.merge(props, on="Name", how="left")
+        yield build_features(df), stat_columns
+
+
+def build(
+    position: str,
+    data_dir: str = "data",
+    seasons=None,
+    asset_dir: str = "assets",
+    out_dir: Optional[str] = None,
+) -> FeatureMatrix:
+    """Return the training matrix of ``position``, building it if stale.
+
+    Parameters
+    ----------
+    position : str
+        Position code such as ``QB`` or ``WR``.
+    data_dir : str, optional
+        Directory holding the ``{season}_weekly_proj`` exports.
+    seasons : int | list[int], optional
+        Seasons to include; all available seasons by default.
+    asset_dir : str, optional
+        Directory containing prop history CSV files.
+    out_dir : str, optional
+        Where the matrix files go; ``{data_dir}/features`` by default.
+    """
+    pos = position.upper()
+    out_dir = out_dir or os.path.join(data_dir, FEATURE_DIR)
+    path = os.path.join(out_dir, f"{pos}.f32")
+    version = source_version(pos, data_dir, seasons, asset_dir)
+    try:
+        with open(os.path.join(out_dir, f"{pos}.json")) as fh:
+            schema = json.load(fh)
+        if schema.get("version") == version:
+            return FeatureMatrix(path, schema)
+    except (OSError, ValueError):
+        pass
+
+    os.makedirs(out_dir, exist_ok=True)
+    stem = os.path.join(out_dir, pos)
+    tmp = f".{os.getpid()}.tmp"
+    columns, stat_columns, names, rows = None, None, [], 0
+    with open(f"{stem}.f32{tmp}", "wb") as fh, open(f"{stem}.stats.f64{tmp}", "wb") as stats_fh:
+        for df, season_stats in _season_frames(pos, data_dir, seasons, asset_dir):
+            X = df.select_dtypes(include=[float, int]).drop(columns=["Points"], errors="ignore")
+            if columns is None:
+                columns = X.columns.tolist()
+                stat_columns = season_stats
+            block = np.empty((len(X), len(columns) + 1), dtype=np.float32)
+            block[:, 0] = 1.0
+            block[:, 1:] = X.reindex(columns=columns, fill_value=0).to_numpy(dtype=np.float32)
+            fh.write(block.tobytes())
+            stats = df.reindex(columns=stat_columns, fill_value=0).to_numpy(dtype=np.float64)
+            stats_fh.write(np.ascontiguousarray(stats).tobytes())
+            names.append(df["Name"].to_numpy(dtype=str))
+            rows += len(X)
+
+    with open(f"{stem}.names.npy{tmp}", "wb") as fh:
+        np.save(fh, np.concatenate(names) if names else np.array([], dtype=str))
+    schema = {
+        "version": version,
+        "position": pos,
+        "dtype": "float32",
+        "rows": rows,
+        "columns": columns or [],
+        "stat_columns": stat_columns or [],
+    }
+    with open(f"{stem}.json{tmp}", "w") as fh:
+        json.dump(schema, fh, indent=1)
+    # The schema goes last: it marks the other files as complete.
+    for suffix in (".f32", ".stats.f64", ".names.npy", ".json"):
+        os.replace(f"{stem}{suffix}{tmp}", f"{stem}{suffix}")
+    return FeatureMatrix(path, schema)
+
+
+def _target(matrix: FeatureMatrix, names: np.ndarray, start: int, stop: int, config) -> np.ndarray:
+    stats = pd.DataFrame(np.asarray(matrix.stats()[start:stop]), columns=matrix.stat_columns)
+    pos = matrix.schema["position"]
+    if pos not in SCORED_POSITIONS:
+        return stats["Points"].to_numpy() if "Points" in stats.columns else np.zeros(len(stats))
+    stats["Name"] = names[start:stop]
+    # The exports call fumbles ``Lost``; the scoring rules expect ``Fum``.
+    return scoring.score_frame(stats.rename(columns={"Lost": "Fum"}), pos, config)
+
+
+def fit(matrix: FeatureMatrix, config=None, block_rows: int = BLOCK_ROWS) -> np.ndarray:
+    """Least-squares coefficients (intercept first) for ``matrix``.
+
+    The target is the fantasy score under ``config`` (projected points for
+    unscored positions).  Row blocks of ``[X | y]`` are folded into a
+    running QR factor, so only ``block_rows`` rows are in memory at once;
+    the result matches ``np.linalg.lstsq`` on the full matrix.
+    """
+    values, names = matrix.values(), matrix.names()
+    n, k = values.shape
+    r = np.zeros((0, k + 1))
+    for start in range(0, n, block_rows):
+        block = values[start : start + block_rows]
+        augmented = np.empty((len(block), k + 1))
+        augmented[:, :k] = block
+        augmented[:, k] = _target(matrix, names, start, start + len(block), config)
+        r = np.linalg.qr(np.vstack([r, augmented]), mode="r")
+    rcond = np.finfo(float).eps * max(n, k)
+    coef, *_ = np.linalg.lstsq(r[:, :k], r[:, k], rcond=rcond)
+    return coef
@@ -3,29 +3,21 @@ import glob
 import numpy as np
 import pandas as pd
 from typing import Optional
-from utility import helpers
+from utility import datastore, helpers, projection_store
 
-def load_player_stats(data_dir: str, position: str) -> pd.DataFrame:
-    """Load historical stats for a position from CSV files.
+def load_player_stats(data_dir: str, position: str, seasons=None, weeks=None) -> pd.DataFrame:
+    """Load historical stats for a position from the projection store.
 
-    Searches ``data_dir`` recursively for files matching ``{position}.csv`` and
-    concatenates them into a single ``DataFrame``. Non-numeric columns are left
-    untouched while others are coerced to numeric types.
+    Reads the ``{season}_weekly_proj/{position}.csv`` exports under
+    ``data_dir`` through :mod:`utility.projection_store`, so only the
+    requested ``seasons`` (default all) and ``weeks`` (an inclusive
+    ``(first, last)`` range) are read. Non-numeric columns are left untouched
+    while others are coerced to numeric types.
     """
-    pattern = os.path.join(data_dir, "**", f"{position.upper()}.csv")
-    files = glob.glob(pattern, recursive=True)
-    data_frames = []
-    for file in files:
-        try:
-            df = pd.read_csv(file)
-            data_frames.append(df)
-        except Exception:
-            # Ignore files that fail to parse
-            continue
-    if not data_frames:
+    df = projection_store.load(seasons=seasons, positions=position, weeks=weeks, data_dir=data_dir)
+    if df.empty:
         return pd.DataFrame()
-    df = pd.concat(data_frames, ignore_index=True)
-    return _coerce_numeric(df)
+    return _coerce_numeric(df.drop(columns="Season"))
 
 
 def load_prop_history(asset_dir: str = "assets") -> pd.DataFrame:
@@ -51,7 +43,7 @@ def load_prop_history(asset_dir: str = "assets") -> pd.DataFrame:
     frames = []
     for file in files:
         try:
-            df = pd.read_csv(file)
+            df = datastore.read_csv(file)
             frames.append(df)
         except Exception:
             continue
@@ -150,29 +142,16 @@ def build_player_features(pos: Optional[str] = None) -> pd.DataFrame:
     off_df = helpers.get_offense_data()
     off_df = helpers.clean_offense_data(off_df, pos=pos)
 
-    # Load schedule and defensive metrics
-    sched_df = helpers.get_schedule()
-    def_df = helpers.get_defense_metrics()
-    sched_df = helpers.clean_schedule(sched_df, def_df)
-
-    # Merge player data with schedule metrics
-    features = off_df.merge(
-        sched_df[['TEAM', 'Week', 'Opp_DVOA', 'Opp_FantasyPointsAllowed']],
-        left_on=['Team', 'Week'],
-        right_on=['TEAM', 'Week'],
-        how='left',
-    )
-    features.drop(columns=['TEAM'], inplace=True)
+    # Opponent metrics and adjustment from the team × week schedule arrays;
+    # missing metrics are neutral
+    from utility import schedule
 
-    # Replace missing metrics with neutral values
-    for col in ['Opp_DVOA', 'Opp_FantasyPointsAllowed']:
-        features[col] = features[col].fillna(0)
+    table = schedule.matrix()
+    features = off_df.reset_index(drop=True)
+    teams, weeks = features['Team'], features['Week']
+    for col in schedule.METRICS:
+        features[col] = table.metric(col, teams, weeks)
 
     # Compute adjusted fantasy points using opponent strength
-    def _adjust(row: pd.Series) -> float:
-        multiplier = 1 - row.get('Opp_DVOA', 0) / 100
-        multiplier += row.get('Opp_FantasyPointsAllowed', 0) / 1000
-        return row['ModelPoints'] * multiplier
-
-    features['AdjustedPoints'] = features.apply(_adjust, axis=1)
+    features['AdjustedPoints'] = features['ModelPoints'] * table.adjustment(teams, weeks)
     return features
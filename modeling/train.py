@@ -1,15 +1,23 @@
 import os
 import json
 from typing import List
-import numpy as np
-import pandas as pd
-from .features import load_player_stats, build_features, load_prop_history
-from utility import scoring
+from . import feature_matrix
 
 
-def train_position_model(position: str, data_dir: str = "data", models_dir: str = "models") -> str:
+def train_position_model(
+    position: str,
+    data_dir: str = "data",
+    models_dir: str = "models",
+    seasons=None,
+    config=None,
+) -> str:
     """Train and persist a model for a single position.
 
+    The features come from the memory-mapped matrix of
+    :mod:`modeling.feature_matrix`, built on first use and reused until the
+    projections change, so retraining under new scoring only rescores the
+    target.
+
     Parameters
     ----------
     position : str
@@ -18,34 +26,19 @@ def train_position_model(position: str, data_dir: str = "data", models_dir: str
         Directory containing historical CSV files.
     models_dir : str, optional
         Directory to store the trained model.
+    seasons : int | list[int], optional
+        Seasons to train on; all available seasons by default.
+    config : dict, optional
+        League scoring configuration for the target; the default scoring
+        when omitted.
     """
-    df = load_player_stats(data_dir, position)
-    if df.empty:
+    matrix = feature_matrix.build(position, data_dir, seasons=seasons)
+    if not matrix.rows:
         raise ValueError(f"No data found for position {position}")
-
-    # Recompute fantasy points using scoring formulas for the given position
-    pos = position.upper()
-    if pos == "QB":
-        df["Points"] = df.apply(scoring.calculate_qb_points, axis=1)
-    elif pos in {"RB", "WR"}:
-        df["Points"] = df.apply(scoring.calculate_rb_wr_points, axis=1)
-    elif pos == "TE":
-        df["Points"] = df.apply(scoring.calculate_te_points, axis=1)
-
-    props = load_prop_history()
-    if not props.empty:
-        props_pos = props[props["Pos"].str.upper() == position.upper()]
-        df = df.merge(props_pos.drop(columns=["Pos"]), on="Name", how="left")
-
-    df = build_features(df)
-    if "Points" not in df.columns:
+    if position.upper() not in feature_matrix.SCORED_POSITIONS and "Points" not in matrix.stat_columns:
         raise ValueError("Required target column 'Points' not present")
-    y = df["Points"].values
-    X = df.select_dtypes(include=[float, int]).drop(columns=["Points"], errors="ignore")
-    # Add intercept term
-    X_mat = np.hstack([np.ones((X.shape[0], 1)), X.values])
-    coef, *_ = np.linalg.lstsq(X_mat, y, rcond=None)
-    model_data = {"coef": coef.tolist(), "columns": X.columns.tolist()}
+    coef = feature_matrix.fit(matrix, config)
+    model_data = {"coef": coef.tolist(), "columns": matrix.columns}
     os.makedirs(models_dir, exist_ok=True)
     path = os.path.join(models_dir, f"{position.lower()}.json")
     with open(path, "w") as fh:
@@ -53,13 +46,13 @@ def train_position_model(position: str, data_dir: str = "data", models_dir: str
     return path
 
 
-def train_all_positions(positions: List[str] = None, data_dir: str = "data", models_dir: str = "models"):
+def train_all_positions(positions: List[str] = None, data_dir: str = "data", models_dir: str = "models", seasons=None):
     """Train models for a list of positions."""
     positions = positions or ["QB", "RB", "WR", "TE"]
     paths = {}
     for pos in positions:
         try:
-            paths[pos] = train_position_model(pos, data_dir, models_dir)
+            paths[pos] = train_position_model(pos, data_dir, models_dir, seasons)
         except Exception as exc:
             print(f"Could not train {pos}: {exc}")
     return paths
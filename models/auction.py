@@ -1,161 +1,402 @@
+"""Auction valuation pipeline.
+
+Nothing is loaded or scored at import.  :class:`AuctionPipeline` builds its
+stages on first use and keeps them for the life of the process:
+
+load -> clean -> score -> season totals -> VORP -> values
+
+with a weekly branch (score -> weekly VORP and rank) for the week-by-week
+view.
+
+The data stages (load, clean and the per-stat contribution caches) are
+stored on the pipeline.  The config-dependent stages are cached in
+:data:`utility.cache.results` under the plan digest and the pipeline's data
+version.  The CSV artifacts that used to be written on import are now
+produced on demand with::
+
+    python -m models.auction [--config PATH] [--out-dir DIR]
+"""
+
+import argparse
+import threading
+
+import numpy as np
 import pandas as pd
 import warnings
 from pathlib import Path
-from utility import helpers, scoring
-from utility.scoring import load_config, LEAGUE_SETTINGS_DEFAULT
+from utility import cache, datasets, helpers, scoring
+from utility.scoring import load_config
 
 warnings.filterwarnings('ignore', category=pd.errors.SettingWithCopyWarning)
 
 
-def load_position_data(pos: str) -> pd.DataFrame:
-    data = helpers.get_position_data(pos)
-    data = helpers.clean_offense_data(data, pos=pos)
-    scoring_map = {
-        'QB': scoring.calculate_qb_points,
-        'RB': scoring.calculate_rb_wr_points,
-        'WR': scoring.calculate_rb_wr_points,
-        'TE': scoring.calculate_te_points,
+positions = ['QB', 'RB', 'WR', 'TE']
+
+DEFAULT_CONFIG = load_config(Path("config/settings.json"))
+
+SEASON_STATS = ['PassYds', 'PassTD', 'Int', 'RushYds', 'RushTD', 'Rec', 'RecYds', 'RecTD', 'Fum']
+
+
+def _remainder(values: np.ndarray, k: int) -> np.ndarray:
+    """``values`` without its ``k`` largest entries, in no particular order."""
+
+    if k <= 0:
+        return values
+    if k >= len(values):
+        return values[:0]
+    return np.partition(values, len(values) - k)[:len(values) - k]
+
+
+def replacement_counts(points: dict, plan) -> dict:
+    """Number of players at each position that start in the league.
+
+    Dedicated slots take the best players at their position.  Each flexible
+    slot in :data:`~utility.scoring.FLEX_ELIGIBILITY` then takes the best of
+    the players left over across its eligible positions, so FLEX demand lands
+    on whichever of RB/WR/TE has the deepest remaining pool.  Selection uses
+    ``np.partition``; nothing is fully sorted.
+
+    Parameters
+    ----------
+    points:
+        Season points per position, as arrays.
+    plan:
+        Compiled :class:`~utility.scoring.ScoringPlan` supplying the roster
+        slots and league size.
+    """
+
+    slots = plan.slots
+    counts = {
+        pos: min(slots.get(pos, 0) * plan.num_teams, len(values))
+        for pos, values in points.items()
     }
-    score_func = scoring_map.get(pos)
-    if score_func:
-        data['ModelPoints'] = data.apply(score_func, axis=1)
-    else:
-        data['ModelPoints'] = 0.0
-    return data
+    for flex, eligible in scoring.FLEX_ELIGIBILITY.items():
+        pools = [(pos, _remainder(points[pos], counts[pos])) for pos in eligible if pos in points]
+        pool = np.concatenate([left for _, left in pools]) if pools else np.empty(0)
+        take = min(slots.get(flex, 0) * plan.num_teams, len(pool))
+        if not take:
+            continue
+        cutoff = np.partition(pool, len(pool) - take)[len(pool) - take]
+        ties = take - sum(int((left > cutoff).sum()) for _, left in pools)
+        for pos, left in pools:
+            tied = min(ties, int((left == cutoff).sum()))
+            counts[pos] += int((left > cutoff).sum()) + tied
+            ties -= tied
+    return counts
 
 
-positions = ['QB', 'RB', 'WR', 'TE']
+def replacement_baselines(points: dict, plan) -> dict:
+    """Season points of the replacement-level player at each position.
 
-position_data = {pos: load_position_data(pos) for pos in positions}
-merge_all = pd.concat(position_data.values(), ignore_index=True)
-merge_all.to_csv('data/all_data.csv', index=False)
-
-grouped_data = merge_all.groupby('Name').agg({'ModelPoints': ['sum', 'count']})
-grouped_data.to_csv('data/grouped_data.csv', index=True)
-
-
-def calculate_vorp_and_rank(group: pd.DataFrame) -> pd.DataFrame:
-    position = group['Position'].iloc[0]
-    if position == 'QB':
-        baseline = group['ModelPoints'].nlargest(14).iloc[-1]
-    elif position in ['RB', 'WR']:
-        baseline = group['ModelPoints'].nlargest(48).iloc[-1]
-    elif position == 'TE':
-        baseline = group['ModelPoints'].nlargest(14).iloc[-1]
-    else:
-        baseline = 0
-
-    group['VORP'] = group['ModelPoints'] - baseline
-    group['Rank'] = group['ModelPoints'].rank(method='min', ascending=False)
-    return group
-
-
-grouped_vorp_and_rank_data = (
-    merge_all.groupby(['Week', 'Position'])
-    .apply(calculate_vorp_and_rank)
-    .reset_index(drop=True)
-)
-
-grouped_vorp_and_rank_data = grouped_vorp_and_rank_data.sort_values(
-    ['Week', 'Position', 'Rank']
-)
-
-
-df = grouped_vorp_and_rank_data.copy(deep=True)
-
-season_totals = df.groupby(['Name', 'Position', 'Team']).agg({
-    'PassYds': 'sum',
-    'PassTD': 'sum',
-    'Int': 'sum',
-    'RushYds': 'sum',
-    'RushTD': 'sum',
-    'Rec': 'sum',
-    'RecYds': 'sum',
-    'RecTD': 'sum',
-    'Fum': 'sum',
-    'ModelPoints': 'sum',
-}).reset_index()
-
-base_data = {
-    pos: helpers.clean_offense_data(helpers.get_position_data(pos), pos=pos)
-    for pos in positions
-}
+    The baseline is the last starter from :func:`replacement_counts`, so that
+    player and everyone below have zero VORP.  Positions with no starters use
+    their best player, and positions with fewer players than starters use
+    their worst.
+    """
 
-DEFAULT_CONFIG = load_config(Path("config/settings.json"))
-LEAGUE_CFG = DEFAULT_CONFIG.get('league', LEAGUE_SETTINGS_DEFAULT)
-NUM_TEAMS = LEAGUE_CFG.get('num_teams', LEAGUE_SETTINGS_DEFAULT['num_teams'])
-INITIAL_BUDGET = LEAGUE_CFG.get('initial_budget', LEAGUE_SETTINGS_DEFAULT['initial_budget'])
+    baselines = {}
+    for pos, k in replacement_counts(points, plan).items():
+        values = points[pos]
+        if not len(values):
+            baselines[pos] = 0.0
+        elif k == 0:
+            baselines[pos] = float(values.max())
+        else:
+            baselines[pos] = float(np.partition(values, len(values) - k)[len(values) - k])
+    return baselines
 
 
-def compute_values(config):
-    cfg = config or DEFAULT_CONFIG
-    league_cfg = cfg.get('league', LEAGUE_SETTINGS_DEFAULT)
-    num_teams = league_cfg.get('num_teams', LEAGUE_SETTINGS_DEFAULT['num_teams'])
-    initial_budget = league_cfg.get('initial_budget', LEAGUE_SETTINGS_DEFAULT['initial_budget'])
-    total_budget = num_teams * initial_budget
-    min_spend = num_teams * 17
-    auction_budget = total_budget - min_spend
-
-    qb = base_data['QB'].copy()
-    qb_cfg = cfg.get('QB', scoring.QB_SCORING_DEFAULT)
-    qb['ModelPoints'] = qb.apply(
-        lambda r: scoring.calculate_qb_points(r, qb_cfg), axis=1
-    )
-    rb = base_data['RB'].copy()
-    rb['ModelPoints'] = rb.apply(scoring.calculate_rb_wr_points, axis=1)
-    wr = base_data['WR'].copy()
-    wr['ModelPoints'] = wr.apply(scoring.calculate_rb_wr_points, axis=1)
-    te = base_data['TE'].copy()
-    te_cfg = cfg.get('TE', scoring.TE_SCORING_DEFAULT)
-    te['ModelPoints'] = te.apply(
-        lambda r: scoring.calculate_te_points(r, te_cfg), axis=1
+def weekly_vorp_and_rank(weekly: pd.DataFrame, counts: dict) -> pd.DataFrame:
+    """Add weekly ``VORP`` and ``Rank`` within each week and position.
+
+    The replacement player in a week is the ``counts[pos]``-th best scorer at
+    that position (the best if no one starts there, the worst if fewer play).
+    One sort orders every week/position group; baselines and ranks are
+    grouped transforms, so no Python runs per group.
+
+    Parameters
+    ----------
+    weekly:
+        Weekly projections with ``Week``, ``Position`` and ``ModelPoints``.
+    counts:
+        Starters per position, as from :func:`replacement_counts`.
+    """
+
+    keys = ['Week', 'Position']
+    df = weekly.sort_values(keys + ['ModelPoints'], ascending=[True, True, False], kind='stable')
+    groups = df.groupby(keys, sort=False, observed=True)['ModelPoints']
+    order = groups.cumcount()
+    target = (df['Position'].map(counts).fillna(0).astype(int) - 1).clip(lower=0)
+    target = target.clip(upper=groups.transform('size') - 1)
+    baseline = (
+        df['ModelPoints'].where(order == target)
+        .groupby([df['Week'], df['Position']], sort=False, observed=True).transform('max')
     )
+    df['VORP'] = df['ModelPoints'] - baseline
+    df['Rank'] = groups.rank(method='min', ascending=False)
+    return df.reset_index(drop=True)
+
+
+class AuctionPipeline:
+    """Lazily built auction valuation stages for a set of positions.
+
+    Parameters
+    ----------
+    positions:
+        Positions to value.
+    loader:
+        Callable returning the raw weekly projections for a position.  By
+        default the cleaned projections are shared with the rest of the app
+        through :mod:`utility.datasets`.
+    """
+
+    def __init__(self, positions=positions, loader=None):
+        self.positions = list(positions)
+        self.loader = loader
+        self._stages = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_base_data(cls, base_data: dict):
+        """Pipeline over already-cleaned projections, skipping load and clean."""
+
+        pipeline = cls(positions=list(base_data), loader=None)
+        pipeline._stages['clean'] = dict(base_data)
+        return pipeline
+
+    def _stage(self, name, build):
+        with self._lock:
+            if name not in self._stages:
+                self._stages[name] = build()
+            return self._stages[name]
+
+    def _cached(self, stage, plan, build):
+        key = ('auction', stage, plan.digest, self.data_version)
+        return cache.results.get_or_compute(key, build)
+
+    def raw_data(self) -> dict:
+        """Load stage: raw weekly projections per position."""
+
+        loader = self.loader or helpers.get_position_data
+        return self._stage('load', lambda: {pos: loader(pos) for pos in self.positions})
+
+    def base_data(self) -> dict:
+        """Clean stage: cleaned weekly projections per position (read-only)."""
+
+        if self.loader is None:
+            return self._stage('clean', lambda: {pos: datasets.position(pos) for pos in self.positions})
+        return self._stage('clean', lambda: {
+            pos: helpers.clean_offense_data(frame, pos=pos)
+            for pos, frame in self.raw_data().items()
+        })
+
+    def contribution_caches(self) -> dict:
+        """Per-stat contribution columns for each position, so a settings
+        change only rescores the stats whose rules changed."""
+
+        return self._stage('contributions', lambda: {
+            pos: scoring.ContributionCache(frame, pos)
+            for pos, frame in self.base_data().items()
+        })
+
+    @property
+    def data_version(self) -> str:
+        return self._stage('version', lambda: cache.data_version(
+            tuple(cache.data_version(frame) for frame in self.base_data().values())
+        ))
 
-    merge_all = pd.concat([qb, rb, wr, te], ignore_index=True)
-    season_totals = merge_all.groupby(['Name', 'Position', 'Team']).agg({
-        'PassYds': 'sum',
-        'PassTD': 'sum',
-        'Int': 'sum',
-        'RushYds': 'sum',
-        'RushTD': 'sum',
-        'Rec': 'sum',
-        'RecYds': 'sum',
-        'RecTD': 'sum',
-        'Fum': 'sum',
-        'ModelPoints': 'sum',
-    }).reset_index()
-
-    position_dfs = {
-        pos: season_totals[season_totals['Position'] == pos].sort_values(
-            'ModelPoints', ascending=False
+    def scored(self, config=None) -> pd.DataFrame:
+        """Score stage: weekly projections with ``ModelPoints`` under ``config``."""
+
+        plan = scoring.compile_scoring_config(config or DEFAULT_CONFIG)
+        caches = self.contribution_caches()
+        scored = []
+        for pos, frame in self.base_data().items():
+            pos_df = frame.copy()
+            pos_df['ModelPoints'] = caches[pos].points(plan)
+            scored.append(pos_df)
+        return pd.concat(scored, ignore_index=True)
+
+    def season_totals(self, config=None) -> pd.DataFrame:
+        """Season totals stage: summed stats and points per player."""
+
+        plan = scoring.compile_scoring_config(config or DEFAULT_CONFIG)
+        return self._cached('season_totals', plan, lambda: (
+            self.scored(plan)
+            .groupby(['Name', 'Position', 'Team'], observed=True)
+            .agg({col: 'sum' for col in SEASON_STATS + ['ModelPoints']})
+            .reset_index()
+        ))
+
+    def vorp(self, config=None) -> dict:
+        """VORP stage: season totals per position, best first, with ``VORP``
+        over the replacement-level player."""
+
+        plan = scoring.compile_scoring_config(config or DEFAULT_CONFIG)
+        season_totals = self.season_totals(plan)
+        position_dfs = {
+            pos: season_totals[season_totals['Position'] == pos].sort_values(
+                'ModelPoints', ascending=False
+            )
+            for pos in self.positions
+        }
+        baselines = replacement_baselines(
+            {pos: df_pos['ModelPoints'].to_numpy() for pos, df_pos in position_dfs.items()}, plan
         )
-        for pos in positions
-    }
-    baselines = {'QB': 14, 'RB': 48, 'WR': 48, 'TE': 14}
-    for pos in positions:
-        df_pos = position_dfs[pos]
-        if len(df_pos) >= baselines[pos]:
-            baseline_value = df_pos.iloc[baselines[pos] - 1]['ModelPoints']
-        else:
-            baseline_value = df_pos['ModelPoints'].min()
-        df_pos['VORP'] = df_pos['ModelPoints'] - baseline_value
-        position_dfs[pos] = df_pos
+        for pos, df_pos in position_dfs.items():
+            df_pos['VORP'] = df_pos['ModelPoints'] - baselines[pos]
+        return position_dfs
+
+    def weekly_values(self, config=None) -> pd.DataFrame:
+        """Weekly ``VORP`` and ``Rank`` for every player, by week and position.
+
+        Weekly baselines use the same starter counts as the season VORP, so
+        flex demand is split across positions the same way every week.
+        """
+
+        plan = scoring.compile_scoring_config(config or DEFAULT_CONFIG)
+
+        def build():
+            counts = replacement_counts(
+                {pos: df_pos['ModelPoints'].to_numpy() for pos, df_pos in self.vorp(plan).items()}, plan
+            )
+            weekly = self.scored(plan)[['Name', 'Position', 'Team', 'Opp', 'Week', 'ModelPoints']]
+            return weekly_vorp_and_rank(weekly, counts)
+
+        return self._cached('weekly_values', plan, build)
+
+    def values(self, config=None) -> pd.DataFrame:
+        """Values stage: every player with ``AuctionValue``, most valuable first."""
+
+        plan = scoring.compile_scoring_config(config or DEFAULT_CONFIG)
+        return self._cached('values', plan, lambda: self._values(plan))
+
+    def _values(self, plan):
+        total_budget = plan.num_teams * plan.initial_budget
+        min_spend = plan.num_teams * plan.roster_size
+        auction_budget = total_budget - min_spend
+
+        position_dfs = self.vorp(plan)
+        total_vorp = sum(df['VORP'].clip(lower=0).sum() for df in position_dfs.values())
+        price_per_point = auction_budget / total_vorp if total_vorp else 0
+
+        for pos in self.positions:
+            position_dfs[pos]['AuctionValue'] = (
+                position_dfs[pos]['VORP'].clip(lower=0) * price_per_point
+            ).round(2)
+
+        all_players = pd.concat(position_dfs.values())
+        return all_players.sort_values('AuctionValue', ascending=False)
+
+    def write_artifacts(self, out_dir='data', config=None) -> list[Path]:
+        """Write ``all_data.csv`` (weekly points) and ``grouped_data.csv``
+        (season points and games per player) to ``out_dir``."""
+
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        merge_all = self.scored(config)
+        grouped_data = merge_all.groupby('Name', observed=True).agg({'ModelPoints': ['sum', 'count']})
+
+        paths = [out_dir / 'all_data.csv', out_dir / 'grouped_data.csv']
+        merge_all.to_csv(paths[0], index=False)
+        grouped_data.to_csv(paths[1], index=True)
+        return paths
+
+
+pipeline = AuctionPipeline()
+
+
+def compute_values(config):
+    return pipeline.values(config)
+
+
+def weekly_values(config):
+    return pipeline.weekly_values(config)
+
+
+def default_players() -> pd.DataFrame:
+    """Values under the saved settings, with empty draft columns.
+
+    Before any picks the live value equals the auction value.
+    """
+
+    players = compute_values(DEFAULT_CONFIG)
+    players['Drafted'] = False
+    players['DraftedBy'] = ''
+    players['PricePaid'] = 0
+    players['LiveValue'] = players['AuctionValue']
+    return players
+
+
+def compute_values_batch(configs):
+    """Compute auction values under many scoring configurations at once.
+
+    Every position is scored for all configurations with
+    :func:`utility.scoring.score_frame_batch`, weekly points are summed into
+    season totals with a single ``reduceat`` and replacement baselines are
+    taken per configuration with :func:`replacement_baselines`.
+
+    Returns
+    -------
+    tuple[pandas.DataFrame, numpy.ndarray]
+        The ``Name``/``Position``/``Team`` of each player and an
+        ``N x players`` matrix of auction values, where row ``i`` matches
+        ``compute_values(configs[i])``.
+    """
+
+    plans = [scoring.compile_scoring_config(cfg or DEFAULT_CONFIG) for cfg in configs]
+    num_teams = np.array([plan.num_teams for plan in plans], dtype=float)
+    budgets = np.array([plan.initial_budget for plan in plans], dtype=float)
+    roster_sizes = np.array([plan.roster_size for plan in plans], dtype=float)
+    auction_budget = num_teams * budgets - num_teams * roster_sizes
+
+    base_data = pipeline.base_data()
+    weekly = pd.concat([base_data[pos] for pos in positions], ignore_index=True)
+    points = np.hstack([
+        scoring.score_frame_batch(base_data[pos], pos, plans) for pos in positions
+    ])
+
+    keys = ['Name', 'Position', 'Team']
+    codes = weekly.groupby(keys, sort=True, observed=True).ngroup().to_numpy()
+    order = np.argsort(codes, kind='stable')
+    starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+    totals = np.add.reduceat(points[:, order], starts, axis=1)
+    players = weekly.iloc[order[starts]][keys].reset_index(drop=True)
+
+    columns = {pos: np.flatnonzero(players['Position'].to_numpy() == pos) for pos in positions}
+    vorp = np.zeros_like(totals)
+    for i, plan in enumerate(plans):
+        pos_points = {pos: totals[i, cols] for pos, cols in columns.items()}
+        baselines = replacement_baselines(pos_points, plan)
+        for pos, cols in columns.items():
+            vorp[i, cols] = pos_points[pos] - baselines[pos]
+
+    positive = vorp.clip(min=0)
+    total_vorp = positive.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price_per_point = np.where(total_vorp > 0, auction_budget / total_vorp, 0)
+    values = (positive * price_per_point[:, None]).round(2)
+    return players, values
+
 
-    total_vorp = sum(df['VORP'].clip(lower=0).sum() for df in position_dfs.values())
-    price_per_point = auction_budget / total_vorp if total_vorp else 0
+def __getattr__(name):
+    # ``all_players_sorted`` used to be computed at import; keep the name
+    # working for callers that still import it.
+    if name == 'all_players_sorted':
+        return default_players()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    for pos in positions:
-        position_dfs[pos]['AuctionValue'] = (
-            position_dfs[pos]['VORP'].clip(lower=0) * price_per_point
-        ).round(2)
 
-    all_players = pd.concat(position_dfs.values())
-    all_players_sorted = all_players.sort_values('AuctionValue', ascending=False)
-    return all_players_sorted
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write the auction CSV artifacts.')
+    parser.add_argument('--config', type=Path, help='league settings JSON (default: scoring defaults)')
+    parser.add_argument('--out-dir', type=Path, default=Path('data'))
+    args = parser.parse_args(argv)
 
+    config = load_config(args.config) if args.config else scoring.SCORING_CONFIG_DEFAULT
+    for path in pipeline.write_artifacts(args.out_dir, config):
+        print(f'wrote {path}')
 
-all_players_sorted = compute_values(DEFAULT_CONFIG)
-all_players_sorted['Drafted'] = False
-all_players_sorted['DraftedBy'] = ''
-all_players_sorted['PricePaid'] = 0
 
+if __name__ == '__main__':
+    main()
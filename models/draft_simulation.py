@@ -0,0 +1,275 @@
+"""Monte Carlo auction draft simulator.
+
+Plays out many complete auctions from the output of
+:func:`models.auction.compute_values` and summarises what each player sold
+for and how each team's roster turned out.
+
+Every simulated draft follows the same rules:
+
+* Nomination order is the players' auction values perturbed by lognormal
+  noise, so stars usually go early but not always in the same order.
+* Each team's willingness to pay is the player's value times its own
+  lognormal noise, scaled by need.  A team with an open starting slot the
+  player can fill bids at full value.  A team with only bench room bids at
+  :data:`BENCH_FACTOR`.  A team with no eligible room does not bid.
+* Bids are capped by the team's max bid (budget less $1 for each other open
+  slot).  The player goes to the highest bidder at one dollar over the
+  second-highest bid, English-auction style.
+
+Drafts are simulated in lockstep: every step sells one nomination in each of
+a block of drafts with array operations over ``drafts x teams``.  Blocks of
+drafts run in a process pool whose workers read the player arrays from
+shared memory.
+"""
+
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from utility import cache, scoring
+
+SLOTS = list(scoring.ROSTER_SLOTS_DEFAULT)
+POSITIONS = ['QB', 'RB', 'WR', 'TE']
+BENCH_FACTOR = 0.5
+NOMINATION_SIGMA = 0.35
+BID_SIGMA = 0.2
+BLOCK_SIZE = 1000
+# Processes per simulation started from a web request.
+SERVER_WORKERS = 2
+
+# Slot eligibility by position code, in fill order (dedicated, FLEX,
+# SUPERFLEX, bench).
+ELIGIBLE = np.array([
+    [slot == pos or pos in scoring.FLEX_ELIGIBILITY.get(slot, ()) or slot == 'BENCH' for slot in SLOTS]
+    for pos in POSITIONS
+])
+BENCH = SLOTS.index('BENCH')
+
+_FIELDS = ('value', 'points', 'position')
+_shared = {}
+
+
+def _simulate_block(value, points, position, slots, num_teams, budget, seed, n_drafts):
+    """Simulate ``n_drafts`` auctions in lockstep.
+
+    Returns ``(prices, owners, spend, team_points)`` where ``prices`` and
+    ``owners`` are ``drafts x players`` (unsold players have price 0 and
+    owner -1) and the team arrays are ``drafts x teams``.
+    """
+
+    rng = np.random.default_rng(seed)
+    n_players = len(value)
+    rows = np.arange(n_drafts)
+
+    priority = (value + 1) * rng.lognormal(0, NOMINATION_SIGMA, (n_drafts, n_players))
+    order = np.argsort(-priority, axis=1)
+
+    open_slots = np.broadcast_to(slots, (n_drafts, num_teams, len(slots))).astype(np.int16)
+    slots_left = open_slots.sum(axis=2)
+    budgets = np.full((n_drafts, num_teams), float(budget))
+    prices = np.zeros((n_drafts, n_players), dtype=np.float32)
+    owners = np.full((n_drafts, n_players), -1, dtype=np.int16)
+    team_points = np.zeros((n_drafts, num_teams))
+
+    # Next nomination in each draft.  Players nobody can roster are passed
+    # over for good, since open slots only ever shrink.
+    cursor = np.zeros(n_drafts, dtype=np.intp)
+    for _ in range(int(slots.sum()) * num_teams):
+        slot_open = (open_slots > 0).any(axis=1)
+        while True:
+            player = order[rows, np.minimum(cursor, n_players - 1)]
+            rosterable = (slot_open & ELIGIBLE[position[player]]).any(axis=1)
+            stuck = ~rosterable & (cursor < n_players)
+            if not stuck.any():
+                break
+            cursor[stuck] += 1
+        live = np.flatnonzero(cursor < n_players)
+        if not len(live):
+            break
+        cursor[live] += 1
+        _sell(live, player[live], value, points, position, open_slots, slots_left,
+              budgets, prices, owners, team_points, rng)
+
+    return prices, owners, budget - budgets, team_points
+
+
+def _sell(rows, player, value, points, position, open_slots, slots_left, budgets, prices,
+          owners, team_points, rng):
+    """Auction ``player[i]`` in draft ``rows[i]`` and update the draft state."""
+
+    n_drafts, num_teams = len(rows), open_slots.shape[1]
+    index = np.arange(n_drafts)
+    eligible = ELIGIBLE[position[player]]
+    room = (open_slots[rows] > 0) & eligible[:, None, :]
+    starter_room = room[:, :, :BENCH].any(axis=2)
+    need = np.where(starter_room, 1.0, np.where(room[:, :, BENCH], BENCH_FACTOR, 0.0))
+
+    max_bid = budgets[rows] - (slots_left[rows] - 1)
+    noise = rng.lognormal(0, BID_SIGMA, (n_drafts, num_teams))
+    bids = np.minimum(np.maximum(value[player][:, None] * noise * need, 1.0), max_bid)
+    # Small jitter breaks ties between $1 bids at random.
+    bids = np.where(need > 0, bids + rng.random((n_drafts, num_teams)) * 1e-3, -np.inf)
+
+    winner = bids.argmax(axis=1)
+    top = bids[index, winner]
+    if num_teams > 1:
+        second = np.partition(bids, num_teams - 2, axis=1)[:, num_teams - 2]
+    else:
+        second = np.full(n_drafts, -np.inf)
+    price = np.where(np.isfinite(second), np.minimum(np.floor(second) + 1, np.floor(top)), 1.0)
+    price = np.maximum(price, 1.0)
+
+    slot = room[index, winner].argmax(axis=1)
+    open_slots[rows, winner, slot] -= 1
+    slots_left[rows, winner] -= 1
+    budgets[rows, winner] -= price
+    prices[rows, player] = price
+    owners[rows, player] = winner
+    team_points[rows, winner] += points[player]
+
+
+def _init_worker(names, shape):
+    for field in _FIELDS:
+        block = shared_memory.SharedMemory(name=names[field])
+        _shared[field] = (block, np.ndarray(shape, dtype=np.float64, buffer=block.buf))
+
+
+def _run_shared_block(args):
+    slots, num_teams, budget, seed, n_drafts = args
+    value, points, position = (_shared[field][1] for field in _FIELDS)
+    return _simulate_block(
+        value, points, position.astype(np.intp), slots, num_teams, budget, seed, n_drafts
+    )
+
+
+def _run_blocks(arrays, slots, num_teams, budget, seeds, sizes, workers):
+    if workers <= 1 or len(sizes) == 1:
+        value, points, position = (arrays[field] for field in _FIELDS)
+        return [
+            _simulate_block(value, points, position.astype(np.intp), slots, num_teams, budget, seed, n)
+            for seed, n in zip(seeds, sizes)
+        ]
+
+    blocks = {}
+    try:
+        for field in _FIELDS:
+            block = shared_memory.SharedMemory(create=True, size=max(arrays[field].nbytes, 1))
+            np.ndarray(arrays[field].shape, dtype=np.float64, buffer=block.buf)[:] = arrays[field]
+            blocks[field] = block
+        names = {field: block.name for field, block in blocks.items()}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(names, arrays['value'].shape),
+        ) as pool:
+            jobs = [(slots, num_teams, budget, seed, n) for seed, n in zip(seeds, sizes)]
+            return list(pool.map(_run_shared_block, jobs))
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+def simulate_drafts(
+    players: pd.DataFrame,
+    plan,
+    n_drafts: int = 10_000,
+    seed: int = 0,
+    workers: int | None = None,
+    block_size: int = BLOCK_SIZE,
+):
+    """Simulate full auctions and summarise prices and team outcomes.
+
+    Parameters
+    ----------
+    players:
+        Output of :func:`models.auction.compute_values`.
+    plan:
+        Compiled :class:`~utility.scoring.ScoringPlan` for the league.
+    n_drafts:
+        Number of auctions to play out.
+    seed:
+        Seed for the random generator.  Results do not depend on
+        ``workers``.
+    workers:
+        Processes to use; defaults to the number of CPUs.
+    block_size:
+        Drafts simulated together in one array pass.
+
+    Returns
+    -------
+    tuple[pandas.DataFrame, pandas.DataFrame]
+        Per-player ``MeanPrice``, ``P10``/``P50``/``P90`` price when sold and
+        ``DraftRate``, and per-team mean ``Spend`` and ``Points``.
+    """
+
+    players = players[players['Position'].isin(POSITIONS)].reset_index(drop=True)
+    arrays = {
+        'value': players['AuctionValue'].to_numpy(dtype=np.float64),
+        'points': players['ModelPoints'].to_numpy(dtype=np.float64),
+        'position': players['Position'].map(POSITIONS.index).to_numpy(dtype=np.float64),
+    }
+    slots = np.array([plan.slots[slot] for slot in SLOTS])
+    sizes = [min(block_size, n_drafts - start) for start in range(0, n_drafts, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = workers or os.cpu_count() or 1
+
+    results = _run_blocks(
+        arrays, slots, plan.num_teams, plan.initial_budget, seeds, sizes, workers
+    )
+    prices = np.vstack([r[0] for r in results])
+    spend = np.vstack([r[2] for r in results])
+    team_points = np.vstack([r[3] for r in results])
+
+    sold = prices > 0
+    draft_rate = sold.mean(axis=0)
+    sold_prices = np.where(sold, prices, np.nan)
+    with warnings.catch_warnings():
+        # Players never sold make nanpercentile warn about all-NaN slices;
+        # their summary is reported as zeros instead.
+        warnings.simplefilter('ignore', RuntimeWarning)
+        p10, p50, p90 = np.nanpercentile(sold_prices, [10, 50, 90], axis=0)
+        mean_price = np.nanmean(sold_prices, axis=0)
+
+    price_summary = players[['Name', 'Position', 'Team', 'AuctionValue']].assign(
+        MeanPrice=np.nan_to_num(mean_price).round(2),
+        P10=np.nan_to_num(p10),
+        P50=np.nan_to_num(p50),
+        P90=np.nan_to_num(p90),
+        DraftRate=draft_rate.round(3),
+    ).sort_values('MeanPrice', ascending=False)
+
+    team_summary = pd.DataFrame({
+        'Team': np.arange(1, plan.num_teams + 1),
+        'Spend': spend.mean(axis=0).round(2),
+        'Points': team_points.mean(axis=0).round(1),
+        'PointsP10': np.percentile(team_points, 10, axis=0).round(1),
+        'PointsP90': np.percentile(team_points, 90, axis=0).round(1),
+    })
+    return price_summary, team_summary
+
+
+def simulate_config(
+    config=None, n_drafts: int = 10_000, seed: int = 0, workers: int | None = SERVER_WORKERS
+):
+    """Simulate drafts for a league config, caching the summaries per config.
+
+    The app calls this from its request threads, so by default it uses at
+    most :data:`SERVER_WORKERS` processes; pass ``workers=None`` for one per
+    CPU.
+    """
+
+    from models import auction
+
+    if workers:
+        workers = min(workers, os.cpu_count() or 1)
+
+    plan = scoring.compile_scoring_config(config or auction.DEFAULT_CONFIG)
+    key = ('draft_simulation', plan.digest, auction.pipeline.data_version, n_drafts, seed)
+    return cache.results.get_or_compute(
+        key, lambda: simulate_drafts(auction.compute_values(plan), plan, n_drafts, seed, workers)
+    )
@@ -0,0 +1,146 @@
+"""Live auction inflation.
+
+Pre-draft auction values spread the league's spendable dollars over the
+positive VORP of every player.  Once the draft starts, teams over- or
+under-spend and the ratio of dollars left to value left drifts away from
+that starting price.  :class:`InflationEngine` keeps running totals of the
+dollars, roster slots and positive VORP that remain, so each pick or undo
+is O(1) and the live price of any undrafted player is a single multiply.
+"""
+
+import numpy as np
+import pandas as pd
+
+MIN_BID = 1
+
+
+class InflationEngine:
+    """Track remaining dollars, roster slots and VORP during a draft.
+
+    Parameters
+    ----------
+    players:
+        Frame with ``Name`` and ``VORP`` for every player in the pool.
+    team_names:
+        Teams in the league.
+    budget:
+        Starting budget of each team.
+    roster_size:
+        Players each team must roster.
+    min_bid:
+        Smallest legal bid; one of these is reserved for every open slot.
+    """
+
+    def __init__(self, players: pd.DataFrame, team_names, budget: float, roster_size: int, min_bid: float = MIN_BID):
+        self.names = players['Name'].tolist()
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self.vorp = players['VORP'].clip(lower=0).to_numpy(dtype=float)
+        self.drafted = np.zeros(len(self.names), dtype=bool)
+        self.min_bid = min_bid
+        self.roster_size = roster_size
+        self.budgets = {team: float(budget) for team in team_names}
+        self.slots = {team: roster_size for team in team_names}
+        self.picks = []
+
+        self.remaining_vorp = float(self.vorp.sum())
+        self.remaining_dollars = float(budget) * len(self.budgets)
+        self.remaining_slots = roster_size * len(self.slots)
+        self.base_price = self.price_per_point
+
+    @classmethod
+    def from_players(
+        cls,
+        players: pd.DataFrame,
+        team_names,
+        budget: float,
+        roster_size: int,
+        min_bid: float = MIN_BID,
+        order=(),
+    ):
+        """Build an engine and replay the picks recorded in ``players``.
+
+        Rows with ``Drafted`` set are applied using ``DraftedBy`` and
+        ``PricePaid``.  Picks by owners not in ``team_names`` (a renamed or
+        removed team) take the player, the dollars and a roster slot out of
+        the pool without charging any team.  Players named in ``order`` are
+        replayed last and in that order, so :meth:`undo` reverses them
+        newest first.
+        """
+
+        drafted = players[players.get('Drafted', pd.Series(False, index=players.index)).eq(True)]
+        if len(order):
+            rank = drafted['Name'].map({name: i for i, name in enumerate(order)}).fillna(-1)
+            drafted = drafted.iloc[np.argsort(rank.to_numpy(), kind='stable')]
+        engine = cls(players, team_names, budget, roster_size, min_bid)
+        for name, team, price in zip(drafted['Name'], drafted['DraftedBy'], drafted['PricePaid']):
+            engine.pick(name, team if team in engine.budgets else None, float(price or 0))
+        return engine
+
+    @property
+    def price_per_point(self) -> float:
+        """Dollars per point of VORP across the undrafted pool."""
+
+        spendable = self.remaining_dollars - self.min_bid * self.remaining_slots
+        if self.remaining_vorp <= 0 or spendable <= 0:
+            return 0.0
+        return spendable / self.remaining_vorp
+
+    @property
+    def inflation(self) -> float:
+        """Current price per point relative to the pre-draft price."""
+
+        return self.price_per_point / self.base_price if self.base_price else 0.0
+
+    def pick(self, name: str, team: str | None, price: float) -> None:
+        """Record ``team`` buying ``name``; ``team=None`` charges only the pool."""
+
+        if name not in self._index:
+            raise ValueError(f'unknown player {name!r}')
+        if team is not None and team not in self.budgets:
+            raise ValueError(f'unknown team {team!r}')
+        i = self._index[name]
+        if self.drafted[i]:
+            raise ValueError(f'{name} has already been drafted')
+
+        self.drafted[i] = True
+        if team is not None:
+            self.budgets[team] -= price
+            self.slots[team] -= 1
+        self.remaining_vorp -= self.vorp[i]
+        self.remaining_dollars -= price
+        self.remaining_slots -= 1
+        self.picks.append((i, team, price))
+
+    def undo(self) -> tuple | None:
+        """Reverse the most recent pick and return ``(name, team, price)``."""
+
+        if not self.picks:
+            return None
+        i, team, price = self.picks.pop()
+        self.drafted[i] = False
+        if team is not None:
+            self.budgets[team] += price
+            self.slots[team] += 1
+        self.remaining_vorp += self.vorp[i]
+        self.remaining_dollars += price
+        self.remaining_slots += 1
+        return self.names[i], team, price
+
+    def live_value(self, name: str) -> float:
+        i = self._index[name]
+        return 0.0 if self.drafted[i] else self.vorp[i] * self.price_per_point
+
+    def live_values(self) -> np.ndarray:
+        """Inflation-adjusted value of every player; drafted players are 0."""
+
+        return np.where(self.drafted, 0.0, self.vorp * self.price_per_point)
+
+    def max_bid(self, team: str) -> float:
+        """Most ``team`` can bid while keeping a minimum bid for each other open slot."""
+
+        if self.slots[team] <= 0:
+            return 0.0
+        return max(self.budgets[team] - self.min_bid * (self.slots[team] - 1), 0.0)
+
+    def max_bids(self) -> dict:
+        return {team: self.max_bid(team) for team in self.budgets}
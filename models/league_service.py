@@ -0,0 +1,168 @@
+"""Auction values for several leagues at once.
+
+:func:`value_leagues` takes a list of league configs and computes each
+league's value table in a process pool.  The cleaned projections are built
+once in the parent and published to the workers through shared memory:
+numeric columns are stored as one float64 matrix per position and text
+columns as integer codes into small category lists, so a worker rebuilds
+the frames without re-reading or re-cleaning any CSVs.
+
+Leagues can also be valued headlessly::
+
+    python -m models.league_service league_a.json league_b.json --out-dir values
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from models import auction
+from utility import scoring
+from utility.scoring import load_config
+
+_shared = {}
+
+
+def pack_frame(frame: pd.DataFrame) -> tuple[dict, np.ndarray]:
+    """Split ``frame`` into a layout and a float64 matrix.
+
+    Non-numeric columns (object, string or categorical) are factorised;
+    their codes go in the matrix (``-1`` for missing) and their categories
+    in the layout.  :func:`unpack_frame` reverses this, dtypes included.
+    """
+
+    layout = {'columns': list(frame.columns), 'dtypes': {}, 'categories': {}}
+    matrix = np.empty((len(frame), len(frame.columns)), dtype=np.float64)
+    for j, col in enumerate(frame.columns):
+        values = frame[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            layout['dtypes'][col] = 'category'
+            layout['categories'][col] = values.cat.categories.tolist()
+            matrix[:, j] = values.cat.codes
+        elif not pd.api.types.is_numeric_dtype(values):
+            layout['dtypes'][col] = str(values.dtype)
+            codes, categories = pd.factorize(values)
+            layout['categories'][col] = categories.tolist()
+            matrix[:, j] = codes
+        else:
+            layout['dtypes'][col] = values.dtype.str
+            matrix[:, j] = values.to_numpy(dtype=np.float64)
+    return layout, matrix
+
+
+def unpack_frame(layout: dict, matrix: np.ndarray) -> pd.DataFrame:
+    columns = {}
+    for j, col in enumerate(layout['columns']):
+        dtype = layout['dtypes'][col]
+        if col in layout['categories']:
+            codes = matrix[:, j].astype(np.intp)
+            if dtype == 'category':
+                columns[col] = pd.Categorical.from_codes(codes, categories=layout['categories'][col])
+                continue
+            categories = np.asarray(layout['categories'][col], dtype=object)
+            values = np.where(codes >= 0, categories[codes], np.nan)
+            columns[col] = values if dtype == 'object' else pd.array(values, dtype=dtype)
+        else:
+            columns[col] = matrix[:, j].astype(dtype, copy=False)
+    return pd.DataFrame(columns)
+
+
+def _init_worker(layouts):
+    base_data = {}
+    for pos, (name, layout, shape) in layouts.items():
+        block = shared_memory.SharedMemory(name=name)
+        _shared[pos] = block
+        base_data[pos] = unpack_frame(layout, np.ndarray(shape, dtype=np.float64, buffer=block.buf))
+    _shared['pipeline'] = auction.AuctionPipeline.from_base_data(base_data)
+
+
+def _value_league(config):
+    return _shared['pipeline'].values(config)
+
+
+def value_leagues(configs, workers: int | None = None, pipeline=None) -> list[pd.DataFrame]:
+    """Compute the auction value table of every league in ``configs``.
+
+    Parameters
+    ----------
+    configs:
+        League config dicts (or compiled plans).  Identical leagues are only
+        computed once.
+    workers:
+        Processes to use; defaults to the number of CPUs.  With one worker
+        (or one distinct league) everything runs in this process.
+    pipeline:
+        Source of the cleaned projections; defaults to
+        :data:`models.auction.pipeline`.
+
+    Returns
+    -------
+    list[pandas.DataFrame]
+        One table per config, in order, as from
+        :func:`models.auction.compute_values`.  Results are stored in the
+        shared result cache, so later calls for the same leagues are hits.
+    """
+
+    pipeline = pipeline or auction.pipeline
+    plans = [scoring.compile_scoring_config(cfg or auction.DEFAULT_CONFIG) for cfg in configs]
+    unique = list({plan.digest: plan for plan in plans}.values())
+    workers = min(workers or os.cpu_count() or 1, len(unique))
+
+    if workers <= 1:
+        tables = {plan.digest: pipeline.values(plan) for plan in unique}
+        return [tables[plan.digest].copy() for plan in plans]
+
+    blocks = []
+    try:
+        layouts = {}
+        for pos, frame in pipeline.base_data().items():
+            layout, matrix = pack_frame(frame)
+            block = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1))
+            blocks.append(block)
+            np.ndarray(matrix.shape, dtype=np.float64, buffer=block.buf)[:] = matrix
+            layouts[pos] = (block.name, layout, matrix.shape)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(layouts,)) as pool:
+            tables = dict(zip((plan.digest for plan in unique), pool.map(_value_league, unique)))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    for plan in unique:
+        pipeline._cached('values', plan, lambda table=tables[plan.digest]: table)
+    return [tables[plan.digest].copy() for plan in plans]
+
+
+def _output_names(paths) -> list[str]:
+    """File stems for each config, suffixed where two configs share one."""
+
+    stems = [Path(path).stem for path in paths]
+    return [
+        stem if stems.count(stem) == 1 else f'{stem}_{i}'
+        for i, stem in enumerate(stems)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write auction values for several leagues.')
+    parser.add_argument('configs', nargs='+', type=Path, help='league settings JSON files')
+    parser.add_argument('--out-dir', type=Path, default=Path('data/leagues'))
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    configs = [load_config(path) for path in args.configs]
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    tables = value_leagues(configs, workers=args.workers)
+    for name, table in zip(_output_names(args.configs), tables):
+        path = args.out_dir / f'{name}_values.csv'
+        table.to_csv(path, index=False)
+        print(f'wrote {path}')
+
+
+if __name__ == '__main__':
+    main()
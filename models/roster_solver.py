@@ -0,0 +1,255 @@
+"""Budget-constrained roster optimisation for live bidding.
+
+:class:`RosterSolver` answers two questions for one team mid-auction:
+
+* What is the points-maximising roster it can still build from the
+  undrafted pool with the money it has left?
+* How much can it rationally bid for a nominated player, i.e. the highest
+  price at which winning the player still leaves a roster at least as good
+  as the best roster without them?
+
+Both come from a dynamic program over whole budget dollars.  Each position
+gets a cardinality knapsack table (best points from exactly ``k`` players
+costing at most ``b``), and the tables are merged with max-plus
+convolutions for every way the open FLEX and SUPERFLEX slots can be split
+across positions.  Bench slots are filled with minimum-bid players that
+score nothing, so a dollar is reserved for each.
+"""
+
+from itertools import combinations_with_replacement
+
+import numpy as np
+import pandas as pd
+
+from utility import scoring
+
+POSITIONS = ['QB', 'RB', 'WR', 'TE']
+SLOTS = list(scoring.ROSTER_SLOTS_DEFAULT)
+STARTER_SLOTS = [slot for slot in SLOTS if slot != 'BENCH']
+MIN_BID = 1
+
+
+def _eligible(slot: str, pos: str) -> bool:
+    return slot == pos or slot == 'BENCH' or pos in scoring.FLEX_ELIGIBILITY.get(slot, ())
+
+
+def fill_slot(open_slots: dict, pos: str) -> str | None:
+    """Slot a player at ``pos`` takes: dedicated, then FLEX, SUPERFLEX, bench."""
+
+    for slot in SLOTS:
+        if open_slots.get(slot, 0) > 0 and _eligible(slot, pos):
+            return slot
+    return None
+
+
+def _count_vectors(open_slots: dict) -> set:
+    """Every per-position starter count the open starting slots allow."""
+
+    base = {pos: open_slots.get(pos, 0) for pos in POSITIONS}
+    options = [base]
+    for flex, eligible in scoring.FLEX_ELIGIBILITY.items():
+        extra = open_slots.get(flex, 0)
+        if not extra:
+            continue
+        options = [
+            {pos: counts[pos] + combo.count(pos) for pos in POSITIONS}
+            for counts in options
+            for combo in combinations_with_replacement(eligible, extra)
+        ]
+    return {tuple(counts[pos] for pos in POSITIONS) for counts in options}
+
+
+def _maxplus(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """``c[x] = max over y <= x of a[y] + b[x - y]``, with the best ``y``."""
+
+    n = len(a)
+    y = np.arange(n)[:, None]
+    shift = np.arange(n)[None, :] - y
+    sums = np.where(shift >= 0, a[:, None] + b[np.clip(shift, 0, None)], -np.inf)
+    split = sums.argmax(axis=0)
+    return sums[split, np.arange(n)], split
+
+
+class _PositionTable:
+    """Best points from exactly ``k`` players of one position costing at most ``b``."""
+
+    def __init__(self, points: np.ndarray, costs: np.ndarray, k_max: int, budget: int):
+        n = len(points)
+        k_max = min(k_max, n)
+        self.points, self.costs = points, costs
+        self.best = np.full((k_max + 1, budget + 1), -np.inf)
+        self.best[0] = 0.0
+        self.keep = np.zeros((n, k_max + 1, budget + 1), dtype=bool)
+        for i in range(n):
+            c = costs[i]
+            if c > budget:
+                continue
+            candidate = self.best[:-1, :budget + 1 - c] + points[i]
+            improved = candidate > self.best[1:, c:]
+            self.best[1:, c:] = np.where(improved, candidate, self.best[1:, c:])
+            self.keep[i, 1:, c:] = improved
+
+    def row(self, k: int) -> np.ndarray:
+        if k < len(self.best):
+            return self.best[k]
+        return np.full(self.best.shape[1], -np.inf)
+
+    def players(self, k: int, b: int) -> list[int]:
+        """Indices of the players behind ``best[k, b]``."""
+
+        chosen = []
+        for i in range(len(self.points) - 1, -1, -1):
+            if k == 0:
+                break
+            if self.keep[i, k, b]:
+                chosen.append(i)
+                k -= 1
+                b -= self.costs[i]
+        return chosen
+
+
+class RosterSolver:
+    """Optimal remaining roster and rational max bids for one team.
+
+    Parameters
+    ----------
+    players:
+        Player pool in the shape of the ``player-data`` store: ``Name``,
+        ``Position``, ``ModelPoints``, ``AuctionValue`` (and ``LiveValue`` if
+        present) plus the ``Drafted``/``DraftedBy``/``PricePaid`` columns.
+    plan:
+        Compiled :class:`~utility.scoring.ScoringPlan` for the league.
+    team:
+        The team to plan for.
+    budget:
+        Starting budget; defaults to the plan's ``initial_budget``.
+
+    Players are priced at their ``LiveValue`` (or ``AuctionValue``), rounded
+    up to whole dollars and never below the minimum bid.
+    """
+
+    def __init__(self, players: pd.DataFrame, plan, team: str, budget: float | None = None):
+        drafted = players['Drafted'].eq(True) if 'Drafted' in players else pd.Series(False, index=players.index)
+        mine = players[drafted & (players.get('DraftedBy') == team)]
+
+        self.open = dict(plan.slots)
+        for pos in mine['Position']:
+            slot = fill_slot(self.open, pos)
+            if slot is not None:
+                self.open[slot] -= 1
+        spent = float(mine['PricePaid'].sum()) if len(mine) else 0.0
+        self.budget = int(np.floor((plan.initial_budget if budget is None else budget) - spent))
+
+        pool = players[~drafted & players['Position'].isin(POSITIONS)].reset_index(drop=True)
+        price = pool['LiveValue'] if 'LiveValue' in pool else pool['AuctionValue']
+        self.pool = pool.assign(Cost=np.maximum(np.ceil(price.fillna(0).to_numpy() - 1e-9), MIN_BID).astype(int))
+        self._rows = {}
+        self._tables = {pos: self._table(pos) for pos in POSITIONS}
+
+    @property
+    def open_count(self) -> int:
+        return sum(max(count, 0) for count in self.open.values())
+
+    def _starter_budget(self, open_slots: dict) -> int:
+        return max(self.budget - MIN_BID * max(open_slots.get('BENCH', 0), 0), 0)
+
+    def _k_max(self, pos: str) -> int:
+        return sum(max(self.open.get(slot, 0), 0) for slot in STARTER_SLOTS if _eligible(slot, pos))
+
+    def _table(self, pos: str, exclude: int | None = None) -> _PositionTable:
+        rows = self.pool.index[self.pool['Position'] == pos]
+        if exclude is not None:
+            rows = rows[rows != exclude]
+        self._rows[pos, exclude] = rows
+        return _PositionTable(
+            self.pool.loc[rows, 'ModelPoints'].to_numpy(dtype=float),
+            self.pool.loc[rows, 'Cost'].to_numpy(),
+            self._k_max(pos),
+            self.budget,
+        )
+
+    def _values(self, tables: dict, open_slots: dict) -> tuple[np.ndarray, tuple | None]:
+        """Best starter points for every budget, and the count vector used at the top budget."""
+
+        best = np.full(self.budget + 1, -np.inf)
+        best_counts = None
+        top = self._starter_budget(open_slots)
+        for counts in _count_vectors({slot: max(n, 0) for slot, n in open_slots.items()}):
+            total = np.zeros(self.budget + 1)
+            for pos, k in zip(POSITIONS, counts):
+                if k:
+                    total, _ = _maxplus(total, tables[pos].row(k))
+            if best_counts is None or total[top] > best[top]:
+                best_counts = counts
+            best = np.maximum(best, total)
+        return best, best_counts
+
+    def best_roster(self) -> tuple[pd.DataFrame, float]:
+        """Points-maximising starters the team can still afford.
+
+        Returns the chosen players (with their ``Cost``) and their total
+        ``ModelPoints``; an empty frame with ``-inf`` if no roster fits.
+        """
+
+        values, counts = self._values(self._tables, self.open)
+        top = self._starter_budget(self.open)
+        if counts is None or not np.isfinite(values[top]):
+            return self.pool.iloc[:0], float('-inf')
+
+        # Replay the convolutions for the winning count vector to recover how
+        # the budget was split across positions.
+        total = np.zeros(self.budget + 1)
+        splits = []
+        for pos, k in zip(POSITIONS, counts):
+            if k:
+                total, split = _maxplus(total, self._tables[pos].row(k))
+                splits.append((pos, k, split))
+        chosen = []
+        b = top
+        for pos, k, split in reversed(splits):
+            before = split[b]
+            table = self._tables[pos]
+            rows = self._rows[pos, None]
+            chosen += [rows[i] for i in table.players(k, b - before)]
+            b = before
+        roster = self.pool.loc[chosen].sort_values('ModelPoints', ascending=False)
+        return roster, float(values[top])
+
+    def max_bid(self, name: str) -> int:
+        """Highest whole-dollar price at which buying ``name`` is no worse than passing.
+
+        Returns 0 if the player is not in the pool or the team has no room.
+        """
+
+        match = self.pool.index[self.pool['Name'] == name]
+        if not len(match) or self.open_count == 0:
+            return 0
+        idx = match[0]
+        pos = self.pool.at[idx, 'Position']
+        points = float(self.pool.at[idx, 'ModelPoints'])
+        cap = self.budget - MIN_BID * (self.open_count - 1)
+        if cap < MIN_BID:
+            return 0
+
+        tables = {**self._tables, pos: self._table(pos, exclude=idx)}
+        without, _ = self._values(tables, self.open)
+        target = without[self._starter_budget(self.open)]
+
+        best = 0
+        for slot in SLOTS:
+            if self.open.get(slot, 0) <= 0 or not _eligible(slot, pos):
+                continue
+            after = {**self.open, slot: self.open[slot] - 1}
+            values, _ = self._values(tables, after)
+            gain = 0.0 if slot == 'BENCH' else points
+            prices = np.arange(MIN_BID, cap + 1)
+            # Money left for the other starters after paying ``price`` and
+            # keeping a dollar for every remaining bench slot.
+            remaining = self.budget - prices - MIN_BID * max(after.get('BENCH', 0), 0)
+            ok = remaining >= 0
+            totals = np.full(len(prices), -np.inf)
+            totals[ok] = gain + values[remaining[ok]]
+            affordable = prices[totals >= target - 1e-9]
+            if len(affordable):
+                best = max(best, int(affordable.max()))
+        return best
@@ -1,7 +1,7 @@
 import dash
 from pathlib import Path
 from layout import create_layout
-from models.auction import all_players_sorted
+from models.auction import default_players
 from utility.scoring import load_config
 
 
@@ -16,8 +16,13 @@ team_names = settings.get('league', {}).get(
     ],
 )
 
-layout = create_layout(
-    all_players_sorted['Name'].tolist(),
-    team_names,
-    all_players_sorted.to_dict('records'),
-)
+
+
+def layout():
+    # Values are built on the first visit rather than at import.
+    players = default_players()
+    return create_layout(
+        players['Name'].tolist(),
+        team_names,
+        players.to_dict('records'),
+    )
@@ -6,7 +6,9 @@ from pathlib import Path
 
 from layout import create_scoring_controls
 from utility.scoring import (
+    ROSTER_SLOTS_DEFAULT,
     SCORING_CONFIG_DEFAULT,
+    compile_scoring_config,
     save_config,
     load_config,
 )
@@ -36,6 +38,8 @@ def layout():
                         ], xs=12, sm=6, md=4),
                     ], className="g-2"),
                     html.Div(id='team-names-container', className="mt-3"),
+                    html.H5("Roster Slots", className="mt-3"),
+                    html.Div(id='roster-slots-container'),
                 ],
                 className="mb-4",
             ),
@@ -69,6 +73,24 @@ def render_team_names(num_teams, config):
     return dbc.Row(inputs, className='g-2')
 
 
+@callback(
+    Output('roster-slots-container', 'children'),
+    Input('scoring-config', 'data'),
+)
+def render_roster_slots(config):
+    cfg = config or SCORING_CONFIG_DEFAULT
+    slots = {**ROSTER_SLOTS_DEFAULT, **cfg.get('league', {}).get('roster_slots', {})}
+    inputs = [
+        dbc.Col([
+            dbc.Label(slot.title() if slot in ('FLEX', 'SUPERFLEX', 'BENCH') else slot),
+            dcc.Input(id={'type': 'roster-slot', 'index': slot}, type='number', min=0, step=1,
+                      value=slots[slot], className='form-control'),
+        ], xs=6, sm=4, md=2)
+        for slot in ROSTER_SLOTS_DEFAULT
+    ]
+    return dbc.Row(inputs, className='g-2')
+
+
 @callback(
     Output("scoring-config", "data"),
     Input("save-config", "n_clicks"),
@@ -84,15 +106,20 @@ def render_team_names(num_teams, config):
     State("rec-yds-pt", "value"),
     State("rec-per", "value"),
     State("rec-td-pts", "value"),
+    State({"type": "roster-slot", "index": ALL}, "id"),
+    State({"type": "roster-slot", "index": ALL}, "value"),
     prevent_initial_call=True,
 )
 def save_settings(n_clicks, num_teams, initial_budget, team_names, pass_yds_pt, pass_td_pts, int_pen,
-                  rush_yds_pt, rush_td_pts, fum_pen, rec_yds_pt, rec_per, rec_td_pts):
+                  rush_yds_pt, rush_td_pts, fum_pen, rec_yds_pt, rec_per, rec_td_pts,
+                  slot_ids=None, slot_counts=None):
     """Persist scoring settings and update the store."""
 
     config = deepcopy(SCORING_CONFIG_DEFAULT)
     config["league"]["num_teams"] = num_teams
     config["league"]["initial_budget"] = initial_budget
+    for slot_id, count in zip(slot_ids or [], slot_counts or []):
+        config["league"]["roster_slots"][slot_id["index"]] = count
     names = team_names or []
     if len(names) < num_teams:
         names += [f"Team {i}" for i in range(len(names) + 1, num_teams + 1)]
@@ -116,6 +143,11 @@ def save_settings(n_clicks, num_teams, initial_budget, team_names, pass_yds_pt,
         if "RecTD" in config.get(pos, {}):
             config[pos]["RecTD"]["points"] = rec_td_pts
 
+    try:
+        compile_scoring_config(config)
+    except ValueError:
+        # Leave the saved settings untouched until every field is valid.
+        raise dash.exceptions.PreventUpdate
     save_config(SETTINGS_PATH, config)
     return config
 
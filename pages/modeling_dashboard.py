@@ -4,23 +4,17 @@ from dash_ag_grid import AgGrid
 import dash_bootstrap_components as dbc
 from copy import deepcopy
 
-from utility.helpers import get_offense_data, clean_offense_data
+from utility import cache, datasets
 from modeling.predict import predict_position
-from utility.scoring import SCORING_CONFIG_DEFAULT, calculate_prop_points, load_config
+from utility.scoring import SCORING_CONFIG_DEFAULT, calculate_prop_points, compile_scoring_config, load_config
 from pathlib import Path
 
 # Register page
 
 dash.register_page(__name__, path="/modeling")
 
-# Load and clean offensive data
-_base_df = get_offense_data()
-_base_df = clean_offense_data(_base_df)
-_positions = sorted(_base_df["Position"].dropna().unique())
-_teams = sorted(_base_df["Team"].dropna().unique())
 
-
-def _compute_projections(df, config=None):
+def _predict(df):
     df = df.copy()
 
     # Add model projections for each position
@@ -32,17 +26,34 @@ def _compute_projections(df, config=None):
         except Exception:
             df.loc[pos_df.index, "Projection"] = 0.0
 
-    cfg = config or deepcopy(SCORING_CONFIG_DEFAULT)
+    return df
+
+
+def _score(df, plan):
     scoring_df = df.rename(columns={"Position": "Pos"})
-    scoring_df = calculate_prop_points(scoring_df, config=cfg)
+    scoring_df = calculate_prop_points(scoring_df, config=plan)
     df["FantasyPoints"] = scoring_df["ModelPoints"]
-
     return df
 
 
+def _compute_projections(df=None, config=None):
+    plan = compile_scoring_config(config or deepcopy(SCORING_CONFIG_DEFAULT))
+    if df is None:
+        df, version = datasets.get("offense"), datasets.registry.version("offense")
+    else:
+        version = cache.data_version(df)
+
+    # Model projections do not depend on the scoring settings.
+    predicted = cache.results.get_or_compute(("model_projections", version), lambda: _predict(df))
+    return cache.results.get_or_compute(
+        ("model_points", plan.digest, version), lambda: _score(predicted, plan)
+    )
+
+
 def layout():
     initial_cfg = load_config(Path("config/settings.json"))
-    initial_df = _compute_projections(_base_df, config=initial_cfg)
+    initial_df = _compute_projections(config=initial_cfg)
+    base_df = datasets.get("offense")
 
     return dbc.Container(
         [
@@ -52,7 +63,7 @@ def layout():
                     dbc.Col(
                         dcc.Dropdown(
                             id="model-pos-filter",
-                            options=[{"label": p, "value": p} for p in _positions],
+                            options=[{"label": p, "value": p} for p in sorted(base_df["Position"].dropna().unique())],
                             multi=True,
                             placeholder="Filter by position",
                         ),
@@ -61,7 +72,7 @@ def layout():
                     dbc.Col(
                         dcc.Dropdown(
                             id="model-team-filter",
-                            options=[{"label": t, "value": t} for t in _teams],
+                            options=[{"label": t, "value": t} for t in sorted(base_df["Team"].dropna().unique())],
                             multi=True,
                             placeholder="Filter by team",
                         ),
@@ -110,7 +121,7 @@ def layout():
     State("scoring-config", "data"),
 )
 def update_grid(pos_filter, team_filter, config):
-    df = _compute_projections(_base_df, config=config)
+    df = _compute_projections(config=config)
 
     if pos_filter:
         df = df[df["Position"].isin(pos_filter)]
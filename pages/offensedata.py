@@ -3,16 +3,14 @@ from dash import dcc, html, Input, Output, callback
 import dash_bootstrap_components as dbc
 from dash_ag_grid import AgGrid
 import pandas as pd
-from utility import helpers
+from utility import datasets
 
 dash.register_page(__name__, 
                    path='/offensedata')
 
-df = helpers.get_offense_data()
-df = helpers.clean_offense_data(df)
-
 # Layout
 def layout():
+    df = datasets.get('offense')
     component = dbc.Container(
         [
             dbc.Row(
@@ -99,7 +97,7 @@ def layout():
     Input('offdata-view-mode', 'value'),
 )
 def update_table(selected_names, selected_positions, selected_teams, view_mode):
-    filtered_df = df
+    filtered_df = datasets.get('offense')
 
     if selected_names:
         filtered_df = filtered_df[filtered_df['Name'].isin(selected_names)]
@@ -112,7 +110,7 @@ def update_table(selected_names, selected_positions, selected_teams, view_mode):
 
     if view_mode == 'season':
         filtered_df = filtered_df.drop(columns=[c for c in ['Week', 'Opponent'] if c in filtered_df.columns])
-        filtered_df = filtered_df.groupby(['Name', 'Position', 'Team'], as_index=False).sum(numeric_only=True)
+        filtered_df = filtered_df.groupby(['Name', 'Position', 'Team'], as_index=False, observed=True).sum(numeric_only=True)
 
     column_defs = [
         {
@@ -3,36 +3,38 @@ from dash import html, dcc, Input, Output, callback
 import dash_bootstrap_components as dbc
 import dash_table
 import plotly.express as px
-from utility import helpers
+from utility import datasets
 
 
 dash.register_page(__name__, path='/playground')
 
-# Load data used in this playground
+
 # Transform the schedule into a grid where each team occupies a row and each
 # week is a column.  Cells show the opponent and are prefixed with '@' when the
 # game is on the road.
-_sched_long = helpers.clean_schedule(helpers.get_schedule())
-_sched_long['Opponent_Display'] = _sched_long.apply(
-    lambda r: (
-        'BYE'
-        if r['Game_Type'] == 'BYE'
-        else ('@' + r['Opponent'] if r['Location'] == 'Away' else r['Opponent'])
-    ),
-    axis=1,
-)
-sched_data = (
-    _sched_long
-    .pivot(index='TEAM', columns='Week', values='Opponent_Display')
-    .reset_index()
-    .rename_axis(None, axis=1)
-)
-sched_data.columns = sched_data.columns.map(str)
-
-qb_data = helpers.clean_offense_data(helpers.get_position_data('QB'), pos='QB')
+def _schedule_grid():
+    sched_long = datasets.get('schedule')
+    sched_long['Opponent_Display'] = sched_long.apply(
+        lambda r: (
+            'BYE'
+            if r['Game_Type'] == 'BYE'
+            else ('@' + r['Opponent'] if r['Location'] == 'Away' else r['Opponent'])
+        ),
+        axis=1,
+    )
+    sched_data = (
+        sched_long
+        .pivot(index='TEAM', columns='Week', values='Opponent_Display')
+        .reset_index()
+        .rename_axis(None, axis=1)
+    )
+    sched_data.columns = sched_data.columns.map(str)
+    return sched_data
 
 
 def layout():
+    sched_data = _schedule_grid()
+    qb_data = datasets.position('QB')
     return dbc.Container(
         [
             html.H1("Playground"),
@@ -57,6 +59,7 @@ def layout():
 
 @callback(Output('qb-passing-hist', 'figure'), Input('qb-playground-dropdown', 'value'))
 def update_qb_hist(name):
+    qb_data = datasets.position('QB')
     filtered = qb_data[qb_data['Name'] == name]
     fig = px.histogram(filtered, x='PassYds', nbins=20, title=f'Passing Yards for {name}')
     return fig
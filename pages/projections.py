@@ -13,7 +13,7 @@ from dash import html, dcc, Input, Output, callback, State
 from dash_ag_grid import AgGrid
 import dash_bootstrap_components as dbc
 
-from utility.helpers import get_sportsbook_props
+from utility import datasets
 from utility.scoring import calculate_prop_points, SCORING_CONFIG_DEFAULT, load_config
 from pathlib import Path
 
@@ -21,10 +21,6 @@ from pathlib import Path
 
 dash.register_page(__name__, path='/projections')
 
-# Load prop projection data
-proj_df = get_sportsbook_props()
-proj_df = calculate_prop_points(proj_df)
-
 
 def layout():
     """Layout for the prop based projections page.
@@ -34,6 +30,7 @@ def layout():
     prop data are scored as zero.
     """
 
+    proj_df = calculate_prop_points(datasets.get('props'), config=load_config(Path("config/settings.json")))
     positions = sorted(proj_df['Pos'].dropna().unique())
 
     info = dbc.Alert(
@@ -76,7 +73,7 @@ def layout():
                         "valueFormatter": {"function": "Number(params.value).toFixed(2)"},
                     },
                 ],
-                rowData=calculate_prop_points(proj_df, config=load_config(Path("config/settings.json"))).to_dict("records"),
+                rowData=proj_df.to_dict("records"),
                 defaultColDef={"resizable": True, "filter": True, "sortable": True},
                 dashGridOptions={"pagination": True, "paginationAutoPageSize": True, "rowBuffer": 0},
                 columnSize="autoSize",
@@ -97,7 +94,7 @@ def update_grid(selected_positions, config):
     """Recalculate scores and filter grid based on user selections."""
 
     cfg = config or SCORING_CONFIG_DEFAULT
-    df = calculate_prop_points(proj_df, config=cfg)
+    df = calculate_prop_points(datasets.get('props'), config=cfg)
 
     if selected_positions:
         df = df[df["Pos"].isin(selected_positions)]
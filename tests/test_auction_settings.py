@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 import sys
 import pathlib
@@ -8,9 +10,13 @@ from models.auction import compute_values
 from utility import scoring
 
 
-def _base_config(num_teams=12, budget=200):
+def _base_config(num_teams=12, budget=200, roster_slots=None):
     return {
-        'league': {'num_teams': num_teams, 'initial_budget': budget},
+        'league': {
+            'num_teams': num_teams,
+            'initial_budget': budget,
+            'roster_slots': roster_slots or scoring.ROSTER_SLOTS_DEFAULT,
+        },
         'QB': scoring.QB_SCORING_DEFAULT,
         'RB': scoring.RB_WR_SCORING_DEFAULT,
         'WR': scoring.RB_WR_SCORING_DEFAULT,
@@ -20,7 +26,11 @@ def _base_config(num_teams=12, budget=200):
 
 def test_values_scale_with_num_teams():
     cfg_default = _base_config(num_teams=12, budget=200)
-    cfg_half = _base_config(num_teams=6, budget=200)
+    # Half the teams with twice the starters keeps replacement level fixed
+    # (and the roster size at 17), so only the money changes.
+    cfg_half = _base_config(num_teams=6, budget=200, roster_slots={
+        'QB': 2, 'RB': 4, 'WR': 4, 'TE': 2, 'FLEX': 2, 'SUPERFLEX': 0, 'BENCH': 3,
+    })
 
     df_default = compute_values(cfg_default)
     df_half = compute_values(cfg_half)
@@ -29,7 +39,8 @@ def test_values_scale_with_num_teams():
     val_default = df_default[df_default['Name'] == player]['AuctionValue'].iloc[0]
     val_half = df_half[df_half['Name'] == player]['AuctionValue'].iloc[0]
 
-    assert val_half == pytest.approx(val_default * 0.5, rel=1e-6)
+    # AuctionValue is rounded to cents, so allow a cent of rounding slack.
+    assert val_half == pytest.approx(val_default * 0.5, abs=0.01)
 
 
 def test_values_scale_with_budget():
@@ -44,4 +55,131 @@ def test_values_scale_with_budget():
     val_low = df_low[df_low['Name'] == player]['AuctionValue'].iloc[0]
 
     expected_ratio = (12 * 100 - 12 * 17) / (12 * 200 - 12 * 17)
-    assert val_low == pytest.approx(val_default * expected_ratio, rel=1e-6)
+    assert val_low == pytest.approx(val_default * expected_ratio, abs=0.01)
+
+
+def test_compute_values_batch_matches_compute_values():
+    from models.auction import compute_values_batch
+
+    configs = [_base_config(num_teams=12), _base_config(num_teams=10, budget=150)]
+    configs[1]['QB'] = {**scoring.QB_SCORING_DEFAULT, 'PassTD': {'points': 4}}
+
+    players, values = compute_values_batch(configs)
+    assert values.shape == (2, len(players))
+    keys = ['Name', 'Position', 'Team']
+    for row, cfg in zip(values, configs):
+        expected = compute_values(cfg).set_index(keys)['AuctionValue']
+        actual = players.assign(AuctionValue=row).set_index(keys)['AuctionValue']
+        pd.testing.assert_series_equal(
+            actual.reindex(expected.index), expected, check_dtype=False
+        )
+
+
+def test_import_builds_nothing_and_writes_nothing():
+    import subprocess
+
+    root = pathlib.Path(__file__).resolve().parents[1]
+    script = (
+        'from models import auction\n'
+        'print(sorted(auction.pipeline._stages))\n'
+    )
+    before = {p: p.stat().st_mtime_ns for p in (root / 'data').glob('*.csv')}
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=root, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == '[]'
+    assert {p: p.stat().st_mtime_ns for p in (root / 'data').glob('*.csv')} == before
+
+
+def test_write_artifacts(tmp_path):
+    from models.auction import pipeline
+
+    paths = pipeline.write_artifacts(tmp_path, scoring.SCORING_CONFIG_DEFAULT)
+    all_data = pd.read_csv(paths[0])
+    grouped = pd.read_csv(paths[1], header=[0, 1], index_col=0)
+
+    assert len(all_data) == sum(len(df) for df in pipeline.base_data().values())
+    assert grouped[('ModelPoints', 'sum')].sum() == pytest.approx(all_data['ModelPoints'].sum())
+
+
+def _plan(num_teams, **slots):
+    roster = {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'FLEX': 0, 'SUPERFLEX': 0, 'BENCH': 0, **slots}
+    return scoring.compile_scoring_config(_base_config(num_teams=num_teams, roster_slots=roster))
+
+
+def test_flex_demand_goes_to_the_deepest_remaining_pool():
+    from models.auction import replacement_baselines, replacement_counts
+
+    points = {
+        'RB': np.array([100.0, 90, 80, 70, 20]),
+        'WR': np.array([95.0, 85, 75, 60, 50]),
+        'TE': np.array([65.0, 30, 10]),
+    }
+    # Two teams: 2 RB + 2 WR + 2 TE dedicated, then 2 FLEX from what is left
+    # (RB 80/70/20, WR 75/60/50, TE 10) -> RB 80 and WR 75.
+    plan = _plan(2, RB=1, WR=1, TE=1, FLEX=1)
+    assert replacement_counts(points, plan) == {'RB': 3, 'WR': 3, 'TE': 2}
+    assert replacement_baselines(points, plan) == {'RB': 80.0, 'WR': 75.0, 'TE': 30.0}
+
+    # Three teams and no TE slot: FLEX takes RB 70, TE 65 and WR 60.
+    plan = _plan(3, RB=1, WR=1, FLEX=1)
+    assert replacement_counts(points, plan) == {'RB': 4, 'WR': 4, 'TE': 1}
+
+    superflex = _plan(1, RB=1, SUPERFLEX=1)
+    with_qb = {**points, 'QB': np.array([120.0, 40])}
+    assert replacement_counts(with_qb, superflex) == {'RB': 1, 'WR': 0, 'TE': 0, 'QB': 1}
+
+
+def test_weekly_vorp_and_rank_per_week_and_position():
+    from models.auction import weekly_vorp_and_rank
+
+    weekly = pd.DataFrame({
+        'Name': ['A', 'B', 'C', 'D', 'A', 'B', 'C', 'D', 'E'],
+        'Position': ['RB', 'RB', 'RB', 'TE', 'RB', 'RB', 'RB', 'TE', 'TE'],
+        'Week': [1, 1, 1, 1, 2, 2, 2, 2, 2],
+        'ModelPoints': [10.0, 20, 15, 8, 12, 12, 30, 9, 4],
+    })
+    out = weekly_vorp_and_rank(weekly, {'RB': 2, 'TE': 3}).set_index(['Week', 'Name'])
+
+    # Week 1 RB baseline is the 2nd best (15); TE has fewer players than
+    # starters, so its worst player is the baseline.
+    assert out.loc[(1, 'B'), 'VORP'] == 5
+    assert out.loc[(1, 'A'), 'VORP'] == -5
+    assert out.loc[(1, 'D'), 'VORP'] == 0
+    assert out.loc[(2, 'D'), 'VORP'] == 5
+    # Ties share the higher rank.
+    assert out.loc[(2, 'C'), 'Rank'] == 1
+    assert out.loc[(2, 'A'), 'Rank'] == out.loc[(2, 'B'), 'Rank'] == 2
+    assert out.loc[(2, 'A'), 'VORP'] == 0
+
+
+def test_weekly_values_cover_every_scored_row():
+    from models.auction import pipeline, weekly_values
+
+    cfg = _base_config()
+    weekly = weekly_values(cfg)
+    assert len(weekly) == len(pipeline.scored(cfg))
+    assert {'VORP', 'Rank', 'Week'} <= set(weekly.columns)
+    assert (weekly.groupby(['Week', 'Position'])['Rank'].min() == 1).all()
+
+
+def test_more_teams_lower_replacement_level():
+    small = compute_values(_base_config(num_teams=8))
+    large = compute_values(_base_config(num_teams=14))
+    for df in (small, large):
+        assert (df['AuctionValue'] >= 0).all()
+    # Deeper leagues push replacement level down, so more players have value.
+    assert (large['AuctionValue'] > 0).sum() > (small['AuctionValue'] > 0).sum()
+
+
+@pytest.mark.parametrize('slots', [
+    {'QB': -1},
+    {'RB': 1.5},
+    {'KICKER': 1},
+    {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'FLEX': 0, 'SUPERFLEX': 0},
+])
+def test_invalid_roster_slots_rejected(slots):
+    cfg = _base_config()
+    cfg['league']['roster_slots'] = slots
+    with pytest.raises(ValueError, match='roster_slots'):
+        scoring.compile_scoring_config(cfg)
@@ -0,0 +1,64 @@
+import sys
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from utility import cache, scoring
+
+
+def test_result_cache_evicts_least_recently_used_within_budget():
+    results = cache.ResultCache(max_bytes=2000)
+    results.put('a', np.zeros(100))
+    results.put('b', np.zeros(100))
+    assert results.get('a') is not None
+    results.put('c', np.zeros(100))
+
+    assert 'b' not in results
+    assert 'a' in results and 'c' in results
+    assert results.nbytes <= results.max_bytes
+    stats = results.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 0, 1)
+
+
+def test_result_cache_returns_copies():
+    results = cache.ResultCache()
+    frame = pd.DataFrame({'x': [1, 2]})
+    value = results.get_or_compute('k', lambda: frame)
+    value.loc[0, 'x'] = 99
+    frame.loc[1, 'x'] = 99
+    assert results.get('k')['x'].tolist() == [1, 2]
+
+
+def test_prop_points_computed_once_for_equivalent_configs(monkeypatch):
+    monkeypatch.setattr(cache, 'results', cache.ResultCache())
+    calls = []
+    real = scoring._score_props
+    monkeypatch.setattr(scoring, '_score_props', lambda *a: calls.append(1) or real(*a))
+
+    df = pd.DataFrame({'Name': ['A'], 'Pos': ['QB'], 'PassYds': [300.0], 'PassTD': [2.0]})
+    first = scoring.calculate_prop_points(df)
+    # Same settings spelled differently (string thresholds, plan object).
+    cfg = {'QB': {**scoring.QB_SCORING_DEFAULT, 'PassTD': {'points': '6'}}}
+    second = scoring.calculate_prop_points(df, config=cfg)
+    third = scoring.calculate_prop_points(df, config=scoring.compile_scoring_config(None))
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(first, third)
+
+    edited = df.assign(PassTD=[3.0])
+    scoring.calculate_prop_points(edited)
+    assert len(calls) == 2
+
+
+def test_data_version_hashes_object_values_not_pointers():
+    names = np.array(['Player A', 'Player B'], dtype=object)
+    copy = np.array([' '.join(['Player', x]) for x in 'AB'], dtype=object)
+    assert cache.data_version(names) == cache.data_version(copy)
+    assert cache.data_version(names) != cache.data_version(np.array(['Player A', 'Player C'], dtype=object))
+
+    frame = pd.DataFrame({'Name': names, 'Pos': pd.Categorical(['QB', 'RB'])})
+    assert cache.data_version(frame) == cache.data_version(frame.copy(deep=True))
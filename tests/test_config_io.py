@@ -4,7 +4,14 @@ import pathlib
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
-from utility.scoring import save_config, load_config, SCORING_CONFIG_DEFAULT
+import pytest
+
+from utility.scoring import (
+    save_config,
+    load_config,
+    compile_scoring_config,
+    SCORING_CONFIG_DEFAULT,
+)
 
 
 def test_save_load_round_trip(tmp_path):
@@ -19,3 +26,41 @@ def test_load_config_default(tmp_path):
     loaded = load_config(path)
     assert loaded == SCORING_CONFIG_DEFAULT
     assert loaded is not SCORING_CONFIG_DEFAULT
+
+
+def test_compile_scoring_config_normalizes_json_round_trip(tmp_path):
+    path = tmp_path / "config.json"
+    save_config(path, SCORING_CONFIG_DEFAULT)
+    plan = compile_scoring_config(load_config(path))
+
+    assert plan == compile_scoring_config(SCORING_CONFIG_DEFAULT)
+    assert hash(plan) == hash(compile_scoring_config(SCORING_CONFIG_DEFAULT))
+    pass_yds = plan.position("QB").rule("PassYds")
+    assert pass_yds.thresholds == (250.0, 350.0, 450.0, 550.0, 650.0)
+    assert pass_yds.points_per == 25.0
+
+
+def test_compile_scoring_config_fills_missing_from_defaults():
+    plan = compile_scoring_config({"QB": {"PassTD": {"points": 4}}})
+    assert plan.position("QB").rule("PassTD").points == 4
+    assert plan.position("QB").rule("Int").points == -3
+    assert plan.position("TE") == compile_scoring_config(None).position("TE")
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"QB": {"PassYds": {"points_per": 25, "bonuses": {"abc": 3}}}},
+        {"QB": {"PassYds": {"points_per": 0}}},
+        {"TE": {"RecTD": {"points": None}}},
+        {"league": {"num_teams": 0}},
+    ],
+)
+def test_malformed_settings_fail_fast(tmp_path, config):
+    with pytest.raises(ValueError):
+        compile_scoring_config(config)
+
+    path = tmp_path / "bad.json"
+    save_config(path, config)
+    with pytest.raises(ValueError):
+        load_config(path)
@@ -0,0 +1,128 @@
+import sys
+import pathlib
+import threading
+
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from utility import database, helpers
+
+
+@pytest.fixture
+def db_file(tmp_path, monkeypatch):
+    path = tmp_path / 'draft_history.db'
+    monkeypatch.setattr(helpers, 'DB_FILE', str(path))
+    helpers._ensure_schema()
+    yield path
+    database.close_all()
+
+
+def test_fresh_database_is_created_on_first_use(tmp_path, monkeypatch):
+    monkeypatch.setattr(helpers, 'DB_FILE', str(tmp_path / 'fresh.db'))
+    assert helpers.get_draft_history().empty
+    assert helpers.get_draft_history(2025).columns[0] == 'id'
+
+    monkeypatch.setattr(helpers, 'DB_FILE', str(tmp_path / 'other.db'))
+    board = pd.DataFrame({'Name': ['A'], 'Owner': ['x'], 'Position': 'QB', 'Team': 'KC', 'Price': [10]})
+    assert helpers.log_draft_picks(board, season=2025) == 1
+    assert helpers.get_draft_history(2025)['player'].tolist() == ['A']
+    database.close_all()
+
+
+def test_legacy_database_is_migrated_before_the_first_upsert(tmp_path, monkeypatch):
+    path = tmp_path / 'legacy.db'
+    monkeypatch.setattr(helpers, 'DB_FILE', str(path))
+    helpers.init_db()
+    with database.transaction(path) as conn:
+        conn.execute("INSERT INTO draft_picks(timestamp, season, player, owner, price) VALUES ('t', 2025, 'A', 'x', 1)")
+
+    board = pd.DataFrame({'Name': ['A', 'B'], 'Owner': ['y', 'x'], 'Position': 'QB', 'Team': 'KC', 'Price': [3, 2]})
+    assert helpers.log_draft_picks(board, season=2025) == 2
+    history = helpers.get_draft_history(2025)
+    assert history[['player', 'owner']].values.tolist() == [['A', 'y'], ['B', 'x']]
+    database.close_all()
+
+
+def test_connections_are_pooled_and_configured(db_file):
+    with database.connection(db_file) as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+    with database.connection(db_file) as again:
+        assert again is conn
+        with database.connection(db_file) as other:
+            assert other is not conn
+
+    with pytest.raises(RuntimeError):
+        with database.transaction(db_file) as conn:
+            conn.execute("INSERT INTO draft_picks(timestamp, season) VALUES ('t', 2025)")
+            raise RuntimeError
+    assert helpers.get_draft_history().empty
+
+
+def test_reader_sees_commits_while_writer_holds_a_transaction(db_file):
+    board = pd.DataFrame({'Name': ['A', 'B'], 'Owner': ['x', ''], 'Position': 'QB', 'Team': 'KC', 'Price': [10, 0]})
+    helpers.log_draft_picks(board, season=2025)
+
+    writing, done = threading.Event(), threading.Event()
+
+    def writer():
+        with database.transaction(db_file) as conn:
+            conn.execute("INSERT INTO draft_picks(timestamp, season, player) VALUES ('t', 2025, 'C')")
+            writing.set()
+            done.wait(5)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    writing.wait(5)
+    try:
+        assert helpers.get_draft_history(2025)['player'].tolist() == ['A']
+    finally:
+        done.set()
+        thread.join()
+    assert helpers.get_draft_history(2025)['player'].tolist() == ['A', 'C']
+
+
+def test_log_draft_picks_upserts_only_changed_rows(db_file):
+    board = pd.DataFrame({
+        'Name': ['A', 'B', 'C', 'D'],
+        'Position': ['QB', 'RB', 'WR', None],
+        'Team': 'KC',
+        'Owner': ['x', 'y', '', None],
+        'Price': [10, 5, 0, 0],
+    })
+    assert helpers.log_draft_picks(board, season=2025) == 2
+    assert helpers.log_draft_picks(board, season=2025) == 0
+
+    board.loc[1, 'Price'] = 7
+    board.loc[2, 'Owner'] = 'z'
+    assert helpers.log_draft_picks(board, season=2025) == 2
+    assert helpers.log_draft_picks(board, season=2024) == 3
+
+    history = helpers.get_draft_history(2025).set_index('player')
+    assert history.index.tolist() == ['A', 'B', 'C']
+    assert history.loc['B', 'price'] == 7
+    assert history.loc['C', 'owner'] == 'z'
+
+
+def test_migrate_db_keeps_latest_pick_and_archives_duplicates(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(helpers, 'DB_FILE', str(tmp_path / 'legacy.db'))
+    helpers.init_db()
+    with database.transaction(helpers.DB_FILE) as conn:
+        conn.executemany(
+            "INSERT INTO draft_picks(timestamp, season, player, owner, price) VALUES ('t', 2025, ?, ?, 1)",
+            [('A', 'first'), ('A', 'second'), ('B', 'x')],
+        )
+
+    assert helpers.migrate_db() == 1
+    assert 'A (first' in capsys.readouterr().out
+    history = helpers.get_draft_history(2025)
+    assert history[['player', 'owner']].values.tolist() == [['A', 'second'], ['B', 'x']]
+    with database.connection(helpers.DB_FILE) as conn:
+        archived = conn.execute('SELECT player, owner FROM draft_picks_duplicates').fetchall()
+    assert archived == [('A', 'first')]
+
+    assert helpers.migrate_db() == 0
+    assert len(helpers.get_draft_history(2025)) == 2
+    database.close_all()
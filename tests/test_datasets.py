@@ -0,0 +1,148 @@
+import sys
+import pathlib
+
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from utility import datasets
+from utility.datasets import DatasetRegistry
+
+
+def _registry():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return pd.DataFrame({'Name': ['A', 'B'], 'Points': [10.0, 20.0]})
+
+    registry = DatasetRegistry()
+    registry.register('players', build)
+    return registry, calls
+
+
+def test_dataset_is_built_once_and_shared():
+    registry, calls = _registry()
+    first = registry.get('players')
+    second = registry.get('players')
+    assert len(calls) == 1
+    assert first['Points'].to_numpy().base is second['Points'].to_numpy().base
+
+    registry.clear('players')
+    registry.get('players')
+    assert len(calls) == 2
+
+
+def test_views_are_read_only_but_columns_can_be_added():
+    registry, _ = _registry()
+    view = registry.get('players')
+    with pytest.raises(ValueError, match='read-only'):
+        view.loc[0, 'Points'] = 99.0
+    with pytest.raises(ValueError, match='read-only'):
+        view['Name'].to_numpy()[0] = 'Z'
+
+    view['Double'] = view['Points'] * 2
+    assert 'Double' not in registry.get('players').columns
+    edited = registry.get('players').copy()
+    edited.loc[0, 'Points'] = 99.0
+    assert registry.get('players').loc[0, 'Points'] == 10.0
+
+
+def test_memory_report_and_version():
+    registry, _ = _registry()
+    assert registry.memory_report().empty
+    version = registry.version('players')
+    assert registry.version('players') == version
+
+    report = registry.memory_report()
+    assert report['Dataset'].tolist() == ['players']
+    assert report.loc[0, 'Rows'] == 2
+    assert report.loc[0, 'Bytes'] > 0
+
+
+def test_unknown_dataset_raises():
+    with pytest.raises(KeyError, match='unknown dataset'):
+        DatasetRegistry().get('nope')
+
+
+def test_default_registry_positions_match_cleaning():
+    qb = datasets.position('qb')
+    assert set(qb['Position'].unique()) <= {'QB', ''}
+    assert {'ModelPoints', 'Projection'} <= set(qb.columns)
+    assert 'position:WR' in datasets.registry.names
+
+
+def test_clean_offense_data_handles_missing_values():
+    from utility import helpers
+
+    raw = pd.DataFrame({
+        'Player': ['a', 'b'],
+        'Opp': [' @BUF', 'KC'],
+        'PassYds': [250.5, None],
+        'Lost': [1, 0],
+        'FumTD': [0, 0],
+        'TwoPt': [0, 0],
+        'Week': [1, 1],
+        'Name': [' Josh Allen ', 'Patrick Mahomes'],
+        '_position': ['QB', None],
+        '_team': ['BUF', 'KC'],
+    })
+    before = raw.copy()
+    cleaned = helpers.clean_offense_data(raw)
+
+    pd.testing.assert_frame_equal(raw, before)
+    assert cleaned.columns.tolist() == ['Name', 'Position', 'Team', 'Opp', 'Week', 'PassYds', 'Fum']
+    assert cleaned['Name'].tolist() == ['Josh Allen', 'Patrick Mahomes']
+    assert cleaned['Position'].tolist() == ['QB', '']
+    assert cleaned['Opp'].tolist() == ['@BUF', 'KC']
+    assert cleaned['PassYds'].tolist() == [250.5, 0.0]
+    assert cleaned['Fum'].dtype == float
+
+
+def test_clean_schedule_parses_weeks_locations_and_byes():
+    from utility import helpers
+
+    raw = pd.DataFrame({'TEAM': ['KC', 'BUF'], '1': ['@BUF', 'KC'], '2': ['BYE', None], '3': [' DEN', '@ MIA']})
+    long = helpers.clean_schedule(raw)
+
+    assert long['Week'].dtype == 'int64'
+    assert long['TEAM'].tolist() == ['BUF'] * 3 + ['KC'] * 3
+    assert long['Week'].tolist() == [1, 2, 3] * 2
+    assert long['Opponent'].tolist() == ['KC', 'None', 'MIA', 'BUF', 'None', 'DEN']
+    assert long['Location'].tolist() == ['Home', 'Home', 'Away', 'Away', 'Home', 'Home']
+    assert long['Game_Type'].tolist() == ['Game', 'BYE', 'Game', 'Game', 'BYE', 'Game']
+
+
+def test_compact_frame_dtypes_and_values():
+    from utility import helpers, scoring
+
+    df = pd.DataFrame({
+        'Name': ['A', 'A', 'B'],
+        'Week': [1.0, 2.0, 1.0],
+        'RecYds': [55.5, 0.0, 101.25],
+        'Rec': [4.0, 0.0, 7.0],
+        'RecTD': [0.5, 0.0, 1.0],
+        'Fum': [0.0, 0.1, 0.0],
+    })
+    compact = helpers.compact_frame(df)
+    assert isinstance(compact['Name'].dtype, pd.CategoricalDtype)
+    assert compact['Week'].dtype == 'int8'
+    assert compact['RecYds'].dtype == 'float32'
+    assert compact['Name'].tolist() == df['Name'].tolist()
+    # The scoring engine reads compact frames directly.
+    assert scoring.score_frame(compact, 'TE') == pytest.approx(scoring.score_frame(df, 'TE'), rel=1e-6)
+
+
+def test_compact_registry_views_stay_read_only():
+    registry = DatasetRegistry()
+    registry.register('players', lambda: pd.DataFrame({'Name': ['A', 'B'], 'Week': [1.0, 2.0]}), compactable=True)
+    assert registry.get('players')['Name'].dtype == object
+
+    registry.set_compact(True)
+    view = registry.get('players')
+    assert isinstance(view['Name'].dtype, pd.CategoricalDtype)
+    assert view['Week'].dtype == 'int8'
+    with pytest.raises(ValueError, match='read-only'):
+        view.loc[0, 'Name'] = 'B'
+    assert registry.memory_report().loc[0, 'Bytes'] > 0
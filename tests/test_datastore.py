@@ -0,0 +1,66 @@
+import os
+import sys
+import pathlib
+
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from utility import datastore
+
+
+def _write(path, text):
+    path.write_text(text)
+    # Bump the mtime explicitly: rewrites within one clock tick keep it.
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+@pytest.fixture
+def csv(tmp_path):
+    path = tmp_path / 'QB.csv'
+    _write(path, 'Name,Team,Week,PassYds\nA,KC,1,250.5\nB,,1,\n')
+    datastore.clear()
+    return path
+
+
+def test_matches_read_csv_from_memory_and_disk(csv):
+    expected = pd.read_csv(csv)
+    pd.testing.assert_frame_equal(datastore.read_csv(csv), expected)
+    assert datastore.cache_path(csv).exists()
+
+    pd.testing.assert_frame_equal(datastore.read_csv(csv), expected)
+    datastore.clear()
+    from_disk = datastore.read_csv(csv)
+    pd.testing.assert_frame_equal(from_disk, expected)
+    # Missing text comes back as NaN, as read_csv gives it.
+    assert isinstance(from_disk.loc[1, 'Team'], float)
+
+
+def test_changed_csv_is_reparsed(csv):
+    datastore.read_csv(csv)
+    _write(csv, 'Name,Team,Week,PassYds\nC,BUF,2,300.0\n')
+    assert datastore.read_csv(csv)['Name'].tolist() == ['C']
+
+    # A stale file on disk is ignored too.
+    datastore.clear()
+    assert datastore.read_csv(csv)['Name'].tolist() == ['C']
+
+
+def test_read_options_are_part_of_the_key(csv):
+    plain = datastore.read_csv(csv)
+    indexed = datastore.read_csv(csv, index_col=0)
+    assert 'Name' in plain.columns
+    assert list(indexed.index) == ['A', 'B']
+
+
+def test_callers_get_independent_copies(csv):
+    first = datastore.read_csv(csv)
+    first.loc[0, 'PassYds'] = -1
+    assert datastore.read_csv(csv).loc[0, 'PassYds'] == 250.5
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        datastore.read_csv(tmp_path / 'nope.csv')
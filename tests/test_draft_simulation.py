@@ -0,0 +1,84 @@
+import sys
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from models import draft_simulation
+from utility import scoring
+
+
+def _league():
+    rng = np.random.default_rng(0)
+    positions = ['QB'] * 6 + ['RB'] * 10 + ['WR'] * 10 + ['TE'] * 6
+    players = pd.DataFrame({
+        'Name': [f'P{i}' for i in range(len(positions))],
+        'Position': positions,
+        'Team': 'FA',
+        'ModelPoints': rng.uniform(50, 300, len(positions)),
+        'AuctionValue': rng.uniform(0, 40, len(positions)).round(2),
+    })
+    plan = scoring.compile_scoring_config({'league': {
+        'num_teams': 3,
+        'initial_budget': 100,
+        'roster_slots': {'QB': 1, 'RB': 1, 'WR': 1, 'TE': 1, 'FLEX': 1, 'SUPERFLEX': 0, 'BENCH': 2},
+    }})
+    return players, plan
+
+
+def test_every_roster_is_filled_within_budget():
+    players, plan = _league()
+    value = players['AuctionValue'].to_numpy()
+    points = players['ModelPoints'].to_numpy()
+    position = players['Position'].map(draft_simulation.POSITIONS.index).to_numpy()
+    slots = np.array([plan.slots[slot] for slot in draft_simulation.SLOTS])
+
+    prices, owners, spend, team_points = draft_simulation._simulate_block(
+        value, points, position, slots, plan.num_teams, plan.initial_budget, 1, 50
+    )
+
+    assert (spend <= plan.initial_budget).all()
+    np.testing.assert_allclose(spend.sum(axis=1), prices.sum(axis=1), rtol=1e-6)
+    for d in range(50):
+        rostered = owners[d] >= 0
+        assert rostered.sum() == plan.num_teams * plan.roster_size
+        assert (prices[d, rostered] >= 1).all()
+        for team in range(plan.num_teams):
+            mine = players['Position'][owners[d] == team]
+            # Every starting slot can be filled by the roster.
+            assert (mine == 'QB').sum() >= 1 and (mine == 'TE').sum() >= 1
+            assert (mine == 'RB').sum() >= 1 and (mine == 'WR').sum() >= 1
+
+
+def test_summaries_are_seeded_and_independent_of_workers():
+    players, plan = _league()
+    serial = draft_simulation.simulate_drafts(players, plan, n_drafts=400, workers=1, block_size=100)
+    pooled = draft_simulation.simulate_drafts(players, plan, n_drafts=400, workers=2, block_size=100)
+    pd.testing.assert_frame_equal(serial[0], pooled[0])
+    pd.testing.assert_frame_equal(serial[1], pooled[1])
+
+    prices, teams = serial
+    assert (prices['P10'] <= prices['P90']).all()
+    # DraftRate is rounded to three places.
+    assert prices['DraftRate'].sum() == pytest.approx(plan.num_teams * plan.roster_size, abs=0.02)
+    assert len(teams) == plan.num_teams
+
+
+def test_simulate_config_bounds_worker_processes(monkeypatch):
+    from models import auction
+    from utility import cache
+
+    players, plan = _league()
+    monkeypatch.setattr(cache, 'results', cache.ResultCache())
+    monkeypatch.setattr(auction, 'compute_values', lambda plan: players)
+    monkeypatch.setattr(draft_simulation.os, 'cpu_count', lambda: 16)
+    used = []
+    real = draft_simulation._run_blocks
+    monkeypatch.setattr(draft_simulation, '_run_blocks', lambda *args: used.append(args[-1]) or real(*args[:-1], 1))
+
+    draft_simulation.simulate_config(plan, n_drafts=10)
+    draft_simulation.simulate_config(plan, n_drafts=20, workers=None)
+    assert used == [draft_simulation.SERVER_WORKERS, 16]
@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from utility import datastore, helpers, scoring  # noqa: F401 - import order
+from modeling import feature_matrix, train
+from modeling.features import build_features, load_player_stats
+
+HEADER = 'Player,Opp,PassYds,PassTD,Int,RushYds,RushTD,Rec,RecYds,RecTD,RetTD,FumTD,TwoPt,Lost,Points,Week,Name,_position,_team\n'
+
+
+def _write(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(HEADER + ''.join(rows))
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _season(seed):
+    rng = np.random.default_rng(seed)
+    return [
+        f'{name}QB,BUF,{rng.integers(150, 400)},{rng.integers(0, 4)},{rng.integers(0, 3)},'
+        f'{rng.integers(0, 60)},{rng.integers(0, 2)},0,0,0,0,0,0,{rng.uniform(0, 1):.2f},{rng.uniform(5, 30):.1f},{week},{name},QB,KC\n'
+        for week in range(1, 7) for name in 'ABCD'
+    ]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    _write(tmp_path / '2024_weekly_proj' / 'QB.csv', _season(0))
+    _write(tmp_path / '2025_weekly_proj' / 'QB.csv', _season(1))
+    datastore.clear()
+    return tmp_path
+
+
+def test_matrix_matches_features_and_is_reused(data_dir, tmp_path):
+    assets = tmp_path / 'assets'
+    matrix = feature_matrix.build('qb', data_dir, seasons=2025, asset_dir=assets)
+    expected = build_features(load_player_stats(str(data_dir), 'QB', seasons=2025))
+    X = expected.select_dtypes(include=[float, int]).drop(columns=['Points'])
+
+    values = matrix.values()
+    assert isinstance(values, np.memmap) and values.dtype == np.float32
+    assert matrix.columns == X.columns.tolist()
+    assert (values[:, 0] == 1).all()
+    np.testing.assert_allclose(values[:, 1:], X.to_numpy(), rtol=1e-6)
+    assert matrix.names().tolist() == expected['Name'].tolist()
+    assert json.loads((data_dir / 'features' / 'QB.json').read_text())['rows'] == len(X)
+
+    stamp = (data_dir / 'features' / 'QB.f32').stat().st_mtime_ns
+    assert feature_matrix.build('QB', data_dir, seasons=2025, asset_dir=assets).schema == matrix.schema
+    assert (data_dir / 'features' / 'QB.f32').stat().st_mtime_ns == stamp
+
+    both = feature_matrix.build('QB', data_dir, asset_dir=assets)
+    assert both.rows == 2 * matrix.rows
+
+
+def test_blocked_fit_matches_lstsq_and_rescoring(data_dir, tmp_path):
+    matrix = feature_matrix.build('QB', data_dir, asset_dir=tmp_path / 'assets')
+    X = np.asarray(matrix.values(), dtype=float)
+    stats = pd.DataFrame(np.asarray(matrix.stats()), columns=matrix.stat_columns)
+    assert stats['Lost'].gt(0).any()
+    stats = stats.rename(columns={'Lost': 'Fum'})
+
+    for config in (None, {'QB': {'PassTD': {'points': 4}}}):
+        y = scoring.score_frame(stats, 'QB', config)
+        np.testing.assert_allclose(feature_matrix._target(matrix, matrix.names(), 0, matrix.rows, config), y)
+        expected = np.linalg.lstsq(X, y, rcond=None)[0]
+        coef = feature_matrix.fit(matrix, config, block_rows=5)
+        np.testing.assert_allclose(X @ coef, X @ expected, atol=1e-6)
+
+
+def test_train_position_model_writes_model(data_dir, tmp_path):
+    path = train.train_position_model('QB', str(data_dir), str(tmp_path / 'models'), seasons=2025)
+    model = json.loads(pathlib.Path(path).read_text())
+    assert len(model['coef']) == len(model['columns']) + 1
+    with pytest.raises(ValueError):
+        train.train_position_model('K', str(data_dir), str(tmp_path / 'models'))
+
+
+def test_scored_positions_train_without_points_column(tmp_path):
+    rows = [line.split(',') for line in (HEADER + ''.join(_season(2))).splitlines()]
+    keep = [i for i, col in enumerate(rows[0]) if col != 'Points']
+    path = tmp_path / '2025_weekly_proj' / 'QB.csv'
+    path.parent.mkdir(parents=True)
+    path.write_text(''.join(','.join(row[i] for i in keep) + '\n' for row in rows))
+    datastore.clear()
+    path = train.train_position_model('QB', str(tmp_path), str(tmp_path / 'models'))
+    assert json.loads(pathlib.Path(path).read_text())['coef']
@@ -0,0 +1,123 @@
+import sys
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from models.inflation import InflationEngine
+
+
+def _players():
+    return pd.DataFrame({
+        'Name': ['A', 'B', 'C', 'D', 'E'],
+        'VORP': [50.0, 30.0, 15.0, 5.0, -4.0],
+    })
+
+
+def _engine():
+    # 2 teams x $100, 3 slots each: $194 spendable over 100 points of VORP.
+    return InflationEngine(_players(), ['T1', 'T2'], 100, roster_size=3)
+
+
+def test_starting_values_spread_budget_over_positive_vorp():
+    engine = _engine()
+    assert engine.inflation == pytest.approx(1.0)
+    np.testing.assert_allclose(engine.live_values(), [97.0, 58.2, 29.1, 9.7, 0.0])
+    assert engine.max_bid('T1') == 98
+
+
+def test_pick_reprices_remaining_players_and_undo_restores():
+    engine = _engine()
+    before = engine.live_values()
+
+    # A bargain leaves more money chasing less value: inflation rises.
+    engine.pick('A', 'T1', 50)
+    assert engine.price_per_point == pytest.approx((200 - 50 - 5) / 50)
+    assert engine.inflation > 1
+    assert engine.live_value('A') == 0
+    assert engine.live_value('B') == pytest.approx(30 * 145 / 50)
+    assert engine.max_bid('T1') == 49
+    assert engine.max_bid('T2') == 98
+
+    assert engine.undo() == ('A', 'T1', 50)
+    np.testing.assert_allclose(engine.live_values(), before)
+    assert engine.undo() is None
+
+
+def test_from_players_replays_recorded_picks():
+    players = _players().assign(
+        Drafted=[True, False, True, False, False],
+        DraftedBy=['T1', '', 'T3', '', ''],
+        PricePaid=[120, 0, 10, 0, 0],
+    )
+    engine = InflationEngine.from_players(players, ['T1', 'T2'], 100, roster_size=3)
+
+    # T3 is not in the league: its pick leaves the pool but no team pays.
+    assert set(engine.budgets) == {'T1', 'T2'}
+    assert engine.remaining_vorp == pytest.approx(35)
+    assert engine.remaining_dollars == 200 - 130
+    assert engine.remaining_slots == 6 - 2
+    assert engine.max_bid('T1') == 0
+    assert engine.max_bid('T2') == 98
+    with pytest.raises(ValueError):
+        engine.pick('A', 'T2', 1)
+    with pytest.raises(ValueError, match='unknown team'):
+        engine.pick('B', 'T3', 1)
+
+    assert engine.undo() == ('C', None, 10)
+    assert engine.remaining_dollars == 200 - 120
+
+
+def test_from_players_replays_ordered_picks_last():
+    players = _players().assign(
+        Drafted=[True, True, True, False, False],
+        DraftedBy=['T1', 'T2', 'T1', '', ''],
+        PricePaid=[50, 30, 10, 0, 0],
+    )
+    engine = InflationEngine.from_players(players, ['T1', 'T2'], 100, roster_size=3, order=['C', 'A'])
+    assert [engine.undo()[0] for _ in range(3)] == ['A', 'C', 'B']
+
+
+def test_app_live_values_follow_league_settings(monkeypatch):
+    from copy import deepcopy
+
+    from dash._callback_context import context_value
+    from dash._utils import AttributeDict
+
+    import app
+    from utility import scoring
+
+    config = deepcopy(scoring.SCORING_CONFIG_DEFAULT)
+    config['league'] = {
+        **config['league'],
+        'num_teams': 10,
+        'initial_budget': 300,
+        'team_names': [f'Owner {i}' for i in range(1, 13)],
+        'roster_slots': {**scoring.ROSTER_SLOTS_DEFAULT, 'BENCH': 5},
+    }
+    assert app.league_settings(config) == ([f'Owner {i}' for i in range(1, 11)], 300, scoring.compile_scoring_config(config).roster_size)
+
+    data = app.update_player_data(config, None)
+    players = pd.DataFrame(data)
+    np.testing.assert_allclose(players['LiveValue'], players['AuctionValue'].round(2), atol=0.01)
+
+    def trigger(prop_id, *args):
+        context_value.set(AttributeDict(triggered_inputs=[{'prop_id': prop_id, 'value': 1}]))
+        return app.update_draft(1, 1, *args, config)
+
+    # Picks and undos update the board's engine instead of replaying the draft.
+    engine = app.board_engine(players, config)
+    monkeypatch.setattr(InflationEngine, 'from_players', None)
+    top = players.loc[players['AuctionValue'].idxmax(), 'Name']
+    drafted = trigger('draft-button.n_clicks', top, 'Owner 2', 1, data)
+    assert pd.DataFrame(drafted)['LiveValue'].max() > players['AuctionValue'].nlargest(2).iloc[1]
+    assert app.board_engine(pd.DataFrame(drafted), config) is engine and engine.picks
+    undone = pd.DataFrame(trigger('undo-button.n_clicks', None, None, None, drafted))
+    np.testing.assert_allclose(undone['LiveValue'], players['LiveValue'])
+    assert app.board_engine(undone, config) is engine and not engine.picks
+
+    *_, team_table = app.update_summaries(data, 'Owner 1', config)
+    assert '$300.00' in str(team_table)
@@ -0,0 +1,86 @@
+import sys
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from models import auction, league_service
+from utility import cache, datasets, scoring
+
+
+def _league(num_teams, budget, rec=1.0):
+    config = scoring.load_config('does-not-exist.json')
+    config['league']['num_teams'] = num_teams
+    config['league']['initial_budget'] = budget
+    for pos in ('RB', 'WR', 'TE'):
+        config[pos]['Rec']['points_per'] = rec
+    return config
+
+
+def test_pack_round_trip_keeps_values_and_dtypes():
+    frame = pd.DataFrame({
+        'Name': ['A', 'B', None, 'A'],
+        'Week': [1.0, 2.0, 3.0, np.nan],
+        'Games': np.array([1, 2, 3, 4], dtype=np.int64),
+    })
+    layout, matrix = league_service.pack_frame(frame)
+    assert matrix.dtype == np.float64
+    pd.testing.assert_frame_equal(league_service.unpack_frame(layout, matrix), frame)
+
+    compact = frame.assign(
+        Name=frame['Name'].astype('category'),
+        Team=pd.array(['KC', None, 'BUF', 'KC'], dtype='string'),
+        Week=frame['Week'].astype(np.float32),
+    )
+    layout, matrix = league_service.pack_frame(compact)
+    pd.testing.assert_frame_equal(league_service.unpack_frame(layout, matrix), compact)
+
+
+def test_pool_matches_in_process_values():
+    leagues = [_league(12, 200), _league(10, 300, rec=0.5), _league(12, 200)]
+    cache.results.clear()
+    expected = league_service.value_leagues(leagues, workers=1)
+    cache.results.clear()
+    pooled = league_service.value_leagues(leagues, workers=2)
+    assert len(pooled) == 3
+    for table, want in zip(pooled, expected):
+        pd.testing.assert_frame_equal(table, want)
+
+    # The pooled results were cached for later single-league lookups.
+    misses = cache.results.stats()['misses']
+    auction.compute_values(leagues[1])
+    assert cache.results.stats()['misses'] == misses
+
+
+def test_pool_handles_compact_datasets():
+    leagues = [_league(12, 200), _league(10, 300, rec=0.5)]
+    datasets.registry.set_compact(True)
+    try:
+        pipeline = auction.AuctionPipeline()
+        assert isinstance(pipeline.base_data()['QB']['Name'].dtype, pd.CategoricalDtype)
+        cache.results.clear()
+        expected = league_service.value_leagues(leagues, workers=1, pipeline=pipeline)
+        cache.results.clear()
+        pooled = league_service.value_leagues(leagues, workers=2, pipeline=pipeline)
+    finally:
+        datasets.registry.set_compact(False)
+        cache.results.clear()
+    for table, want in zip(pooled, expected):
+        pd.testing.assert_frame_equal(table, want)
+
+
+def test_cli_writes_one_file_per_league(tmp_path):
+    paths = []
+    for name, config in [('small', _league(8, 150)), ('large', _league(14, 250))]:
+        path = tmp_path / f'{name}.json'
+        scoring.save_config(path, config)
+        paths.append(str(path))
+
+    league_service.main(paths + ['--out-dir', str(tmp_path / 'out'), '--workers', '1'])
+    for name in ('small', 'large'):
+        table = pd.read_csv(tmp_path / 'out' / f'{name}_values.csv')
+        assert {'Name', 'Position', 'AuctionValue'} <= set(table.columns)
+    small = pd.read_csv(tmp_path / 'out' / 'small_values.csv')
+    assert small['AuctionValue'].sum() <= 8 * 150
@@ -0,0 +1,98 @@
+import os
+import sys
+import pathlib
+
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from utility import datastore, projection_store
+
+LEGACY = 'Player,Opp,Yds,TD,Int,Yds,TD,Rec,Yds,TD,TD,FumTD,2PT,Lost,Points,Week,Name,_position,_team\n'
+CURRENT = 'Player,Opp,PassYds,PassTD,Int,RushYds,RushTD,Rec,RecYds,RecTD,RetTD,FumTD,TwoPt,Lost,Points,Week,Name,_position,_team\n'
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    # Bump the mtime explicitly: rewrites within one clock tick keep it.
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _rows(names, weeks, yds):
+    return ''.join(
+        f'{name}QB,BUF,{yds + w},1,0,10,0,0,0,0,0,0,0,0,{w}.5,{w},{name},QB,KC\n'
+        for w in weeks for name in names
+    )
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    _write(tmp_path / '2024_weekly_proj' / 'QB.csv', LEGACY + _rows(['A'], [1, 2, 3], 200))
+    _write(tmp_path / '2025_weekly_proj' / 'QB.csv', CURRENT + _rows(['A', 'B'], [1, 2, 3], 250))
+    _write(tmp_path / '2025_weekly_proj' / 'off.csv', CURRENT)
+    datastore.clear()
+    return tmp_path
+
+
+def test_matches_source_csv_and_unifies_legacy_headers(data_dir):
+    current = projection_store.load(seasons=2025, positions='qb', data_dir=data_dir)
+    expected = pd.read_csv(data_dir / '2025_weekly_proj' / 'QB.csv')
+    pd.testing.assert_frame_equal(current.drop(columns='Season'), expected, check_dtype=False)
+
+    both = projection_store.load(positions='QB', data_dir=data_dir)
+    assert both['Season'].tolist() == [2024] * 3 + [2025] * 6
+    assert both['PassYds'].tolist()[:3] == [201.0, 202.0, 203.0]
+    assert 'Yds.1' not in both.columns
+    assert projection_store.seasons('QB', data_dir=data_dir) == [2024, 2025]
+
+
+def test_filters_weeks_and_columns(data_dir):
+    df = projection_store.load(positions='QB', weeks=(2, 3), columns=['Name', 'Week'], data_dir=data_dir)
+    assert df.columns.tolist() == ['Name', 'Week', 'Season']
+    assert sorted(df['Week'].unique()) == [2, 3]
+    assert len(df) == 6
+
+    one = projection_store.load(seasons=[2025], positions=['QB'], weeks=1, data_dir=data_dir)
+    assert one['Name'].tolist() == ['A', 'B']
+    assert projection_store.load(positions='K', data_dir=data_dir).empty
+
+
+def test_sync_tracks_changed_and_removed_sources(data_dir):
+    assert projection_store.sync(data_dir) == ['QB']
+    assert projection_store.sync(data_dir) == []
+
+    _write(data_dir / '2024_weekly_proj' / 'QB.csv', LEGACY + _rows(['C'], [1], 100))
+    assert projection_store.sync(data_dir) == ['QB']
+    assert 'C' in projection_store.load(seasons=2024, positions='QB', data_dir=data_dir)['Name'].tolist()
+
+    for season in ('2024', '2025'):
+        (data_dir / f'{season}_weekly_proj' / 'QB.csv').unlink()
+    assert projection_store.sync(data_dir) == ['QB']
+    assert projection_store.load(data_dir=data_dir).empty
+
+
+def test_csv_fallback_matches_store(data_dir):
+    stored = projection_store.load(positions='QB', weeks=(1, 2), data_dir=data_dir)
+    fallback = projection_store._load_csv(projection_store.sources(data_dir), [], ['QB'], (1, 2), None)
+    pd.testing.assert_frame_equal(stored, fallback, check_dtype=False)
+
+
+def test_load_syncs_only_when_directories_change(data_dir, monkeypatch):
+    calls = []
+    real = projection_store.sync
+    monkeypatch.setattr(projection_store, 'sync', lambda *a: calls.append(1) or real(*a))
+    projection_store.load(positions='QB', data_dir=data_dir)
+    projection_store.load(positions='QB', data_dir=data_dir)
+    assert len(calls) == 1
+
+    _write(data_dir / '2026_weekly_proj' / 'QB.csv', CURRENT + _rows(['D'], [1], 300))
+    assert projection_store.load(seasons=2026, data_dir=data_dir)['Name'].tolist() == ['D']
+    assert len(calls) == 2
+
+    # A CSV rewritten in place is picked up once the interval has passed.
+    _write(data_dir / '2026_weekly_proj' / 'QB.csv', CURRENT + _rows(['E'], [1], 300))
+    monkeypatch.setattr(projection_store, 'SYNC_INTERVAL', 0)
+    assert projection_store.load(seasons=2026, data_dir=data_dir)['Name'].tolist() == ['E']
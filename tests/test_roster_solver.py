@@ -0,0 +1,112 @@
+import sys
+import pathlib
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from models import roster_solver
+from models.roster_solver import RosterSolver
+from utility import scoring
+
+POSITIONS = ['QB'] * 3 + ['RB'] * 4 + ['WR'] * 4 + ['TE'] * 3
+
+
+def _players():
+    rng = np.random.default_rng(3)
+    value = rng.uniform(0, 20, len(POSITIONS)).round(2)
+    return pd.DataFrame({
+        'Name': [f'P{i}' for i in range(len(POSITIONS))],
+        'Position': POSITIONS,
+        'AuctionValue': value,
+        'ModelPoints': (50 + 8 * value + rng.normal(0, 20, len(POSITIONS))).round(1),
+        'Drafted': False,
+        'DraftedBy': '',
+        'PricePaid': 0,
+    })
+
+
+def _plan():
+    return scoring.compile_scoring_config({'league': {
+        'num_teams': 2,
+        'initial_budget': 40,
+        'roster_slots': {'QB': 1, 'RB': 1, 'WR': 1, 'TE': 1, 'FLEX': 1, 'SUPERFLEX': 0, 'BENCH': 2},
+    }})
+
+
+def _brute_force(pool, open_slots, budget, exclude=None):
+    """Best starter points by trying every combination of players."""
+
+    vectors = roster_solver._count_vectors(open_slots)
+    n = sum(next(iter(vectors)))
+    positions = pool['Position'].to_numpy()
+    points = pool['ModelPoints'].to_numpy()
+    costs = pool['Cost'].to_numpy()
+    best = -np.inf
+    for combo in combinations([i for i in range(len(pool)) if i != exclude], n):
+        combo = list(combo)
+        counts = tuple(int((positions[combo] == pos).sum()) for pos in roster_solver.POSITIONS)
+        if costs[combo].sum() <= budget and counts in vectors:
+            best = max(best, points[combo].sum())
+    return best
+
+
+def test_best_roster_matches_brute_force():
+    solver = RosterSolver(_players(), _plan(), 'A')
+    roster, points = solver.best_roster()
+
+    starters = {**solver.open, 'BENCH': 0}
+    # Two bench slots reserve $1 each.
+    assert points == pytest.approx(_brute_force(solver.pool, starters, 38))
+    assert roster['ModelPoints'].sum() == pytest.approx(points)
+    assert roster['Cost'].sum() <= 38
+    assert len(roster) == 5
+
+
+def test_max_bid_matches_brute_force():
+    solver = RosterSolver(_players(), _plan(), 'A')
+    pool = solver.pool
+    starters = {**solver.open, 'BENCH': 0}
+
+    for name in ['P0', 'P10']:
+        i = pool.index[pool['Name'] == name][0]
+        position, points = pool.at[i, 'Position'], pool.at[i, 'ModelPoints']
+        target = _brute_force(pool, starters, 38, exclude=i)
+        expected = 0
+        for price in range(1, 35):
+            # Bought as a bench player...
+            if _brute_force(pool, starters, 39 - price, exclude=i) >= target - 1e-9:
+                expected = price
+            # ...or as a starter in any slot the player can fill.
+            for slot in ['QB', 'RB', 'WR', 'TE', 'FLEX']:
+                if roster_solver._eligible(slot, position):
+                    after = {**starters, slot: starters[slot] - 1}
+                    if points + _brute_force(pool, after, 38 - price, exclude=i) >= target - 1e-9:
+                        expected = max(expected, price)
+        assert solver.max_bid(name) == expected
+
+
+def test_drafted_players_fill_slots_and_spend_budget():
+    players = _players()
+    players.loc[0, ['Drafted', 'DraftedBy', 'PricePaid']] = [True, 'A', 15]
+    players.loc[3, ['Drafted', 'DraftedBy', 'PricePaid']] = [True, 'B', 10]
+    solver = RosterSolver(players, _plan(), 'A')
+
+    assert solver.budget == 25
+    assert solver.open['QB'] == 0
+    assert 'P0' not in set(solver.pool['Name'])
+    assert 'P3' not in set(solver.pool['Name'])
+    roster, _ = solver.best_roster()
+    assert (roster['Position'] == 'QB').sum() == 0
+    assert solver.max_bid('P3') == 0
+
+
+def test_fill_slot_prefers_dedicated_then_flex_then_bench():
+    open_slots = {'QB': 0, 'RB': 1, 'WR': 0, 'TE': 0, 'FLEX': 1, 'SUPERFLEX': 1, 'BENCH': 1}
+    assert roster_solver.fill_slot(open_slots, 'RB') == 'RB'
+    assert roster_solver.fill_slot(open_slots, 'WR') == 'FLEX'
+    assert roster_solver.fill_slot(open_slots, 'QB') == 'SUPERFLEX'
+    assert roster_solver.fill_slot({'BENCH': 0}, 'QB') is None
@@ -0,0 +1,79 @@
+import sys
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from utility import helpers, schedule
+from utility.schedule import ScheduleMatrix
+
+
+def _matrix():
+    raw = pd.DataFrame({
+        'TEAM': ['KC', 'WSH', 'BUF'],
+        '1': ['@WSH', 'KC', 'BYE'],
+        '2': ['BUF', 'BYE', '@KC'],
+        '3': ['BYE', '@BUF', 'WSH'],
+    })
+    metrics = pd.DataFrame({
+        'TEAM': ['KC', 'WSH', 'BUF'],
+        'DVOA': [10.0, -5.0, 0.0],
+        'FantasyPointsAllowed': [20.0, 40.0, 30.0],
+    })
+    return ScheduleMatrix(helpers.clean_schedule(raw, metrics))
+
+
+def test_gathers_match_merge_and_row_formula():
+    table = _matrix()
+    players = pd.DataFrame({
+        'Team': ['KC', 'KC', 'KC', 'BUF', 'WAS', 'NYJ', 'KC'],
+        'Week': [1.0, 2.0, 3.0, 2.0, 3.0, 1.0, 19.0],
+    })
+
+    assert table.opponents(players['Team'], players['Week']).tolist() == [
+        'WSH', 'BUF', 'None', 'KC', 'BUF', 'None', 'None',
+    ]
+    dvoa = table.metric('Opp_DVOA', players['Team'], players['Week'])
+    fpa = table.metric('Opp_FantasyPointsAllowed', players['Team'], players['Week'])
+    assert dvoa.tolist() == [-5.0, 0.0, 0.0, 10.0, 0.0, 0.0, 0.0]
+    expected = 1 - dvoa / 100 + fpa / 1000
+    np.testing.assert_array_equal(table.adjustment(players['Team'], players['Week']), expected)
+    assert table.away[table.codes(['KC'])[0], 1]
+
+
+def test_remaining_sos_averages_games_left():
+    table = _matrix()
+    kc = 1 - np.array([-5.0, 0.0]) / 100 + np.array([40.0, 30.0]) / 1000
+
+    sos = table.remaining_sos(1)
+    assert sos['KC'] == pytest.approx(kc.mean())
+    assert table.remaining_sos(2)['KC'] == pytest.approx(kc[1])
+    # No games left is neutral.
+    assert table.remaining_sos(3)['KC'] == 1.0
+    assert table.remaining_sos(99).tolist() == [1.0, 1.0, 1.0]
+
+
+def test_sos_queries_are_cached_and_read_only():
+    first = schedule.player_sos(5, 'QB')
+    second = schedule.player_sos(5, 'qb')
+    assert np.shares_memory(first.to_numpy(), second.to_numpy())
+    with pytest.raises(ValueError, match='read-only'):
+        first.iloc[0] = 0.0
+
+    by_position = schedule.position_sos(5)
+    assert set(by_position.index) <= {'QB', 'RB', 'WR', 'TE'}
+    assert schedule.matrix() is schedule.matrix()
+
+
+def test_defense_metrics_join_the_real_schedule():
+    table = schedule.matrix()
+    assert set(helpers.get_defense_metrics()['TEAM']) <= set(table.teams)
+    assert (table.metrics['Opp_DVOA'] != 0).any()
+    assert (table.metrics['Opp_FantasyPointsAllowed'] != 0).any()
+
+    by_position = schedule.position_sos(1)
+    assert (by_position != 1.0).all()
+    assert by_position.nunique() > 1
@@ -1,22 +1,30 @@
-import importlib
+import json
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
 
-def _load_scoring():
+@pytest.fixture
+def adv_stats(monkeypatch):
+    from utility import scoring
+
     qb_df = pd.DataFrame({'Player': []})
     rb_df = pd.DataFrame({'Player': ['Test Player'], 'YBC/Att': [5], 'YAC/Att': [3]})
     wr_df = pd.DataFrame({'Player': ['Test Player'], 'ADOT': [12], 'YAC/R': [6]})
 
-    with patch('pandas.read_csv', side_effect=[qb_df, rb_df, wr_df]):
-        scoring = importlib.import_module('utility.scoring')
-    return scoring, rb_df, wr_df
+    monkeypatch.setattr(scoring, 'load_adv_stats', lambda season=None: (qb_df, rb_df, wr_df))
+    scoring.reset_adv_stats_cache()
+    yield scoring, rb_df, wr_df
+    scoring.reset_adv_stats_cache()
 
 
-def test_calculate_rb_wr_points_sample():
-    scoring, rb_df, wr_df = _load_scoring()
+def test_calculate_rb_wr_points_sample(adv_stats):
+    scoring, rb_df, wr_df = adv_stats
 
     row = pd.Series({
         'Name': 'Test Player',
@@ -70,8 +78,8 @@ def test_calculate_rb_wr_points_sample():
     assert result == pytest.approx(expected)
 
 
-def test_calculate_rb_wr_points_zero_line():
-    scoring, _, _ = _load_scoring()
+def test_calculate_rb_wr_points_zero_line(adv_stats):
+    scoring, _, _ = adv_stats
 
     row = pd.Series({
         'Name': 'Test Player',
@@ -86,8 +94,8 @@ def test_calculate_rb_wr_points_zero_line():
     assert scoring.calculate_rb_wr_points(row) == 0
 
 
-def test_calculate_prop_points_dispatch():
-    scoring, _, _ = _load_scoring()
+def test_calculate_prop_points_dispatch(adv_stats):
+    scoring, _, _ = adv_stats
 
     df = pd.DataFrame(
         [
@@ -126,9 +134,9 @@ def test_calculate_prop_points_dispatch():
         'TE': scoring.TE_SCORING_DEFAULT,
     }
 
-    with patch.object(scoring, 'calculate_qb_points', return_value=1) as qb_mock, \
-        patch.object(scoring, 'calculate_rb_wr_points', return_value=2) as rb_mock, \
-        patch.object(scoring, 'calculate_te_points', return_value=3) as te_mock:
+    with patch.object(scoring, 'score_qb_frame', return_value=[1]) as qb_mock, \
+        patch.object(scoring, 'score_rb_wr_frame', return_value=[2]) as rb_mock, \
+        patch.object(scoring, 'score_te_frame', return_value=[3]) as te_mock:
 
         result = scoring.calculate_prop_points(df, config)
 
@@ -138,8 +146,8 @@ def test_calculate_prop_points_dispatch():
         te_mock.assert_called_once()
 
 
-def test_rushing_bonus_breakaway_rate_scaling():
-    scoring, _, _ = _load_scoring()
+def test_rushing_bonus_breakaway_rate_scaling(adv_stats):
+    scoring, _, _ = adv_stats
 
     high = pd.Series(
         {
@@ -164,8 +172,8 @@ def test_rushing_bonus_breakaway_rate_scaling():
     assert scoring.rushing_bonus(1, high) > scoring.rushing_bonus(1, low)
 
 
-def test_receiving_bonus_breakaway_rate_scaling():
-    scoring, _, _ = _load_scoring()
+def test_receiving_bonus_breakaway_rate_scaling(adv_stats):
+    scoring, _, _ = adv_stats
 
     rec = 5
     rec_td = 1
@@ -200,3 +208,276 @@ def test_receiving_bonus_breakaway_rate_scaling():
     assert scoring.receiving_bonus(rec, rec_td, high) > scoring.receiving_bonus(
         rec, rec_td, low
     )
+
+
+def _sample_frame(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    names = ['Test Player', 'Other Player', 'Unknown Player']
+    return pd.DataFrame({
+        'Name': rng.choice(names, n),
+        'PassYds': rng.uniform(0, 700, n),
+        'PassTD': rng.uniform(0, 4, n),
+        'Int': rng.uniform(0, 2, n),
+        'RushYds': rng.uniform(0, 320, n),
+        'RushTD': rng.uniform(0, 2, n),
+        'Rec': rng.uniform(0, 16, n),
+        'RecYds': rng.uniform(0, 320, n),
+        'RecTD': rng.uniform(0, 2, n),
+        'Fum': rng.uniform(0, 1, n),
+    })
+
+
+def test_frame_scorers_match_row_reference(monkeypatch):
+    from utility import scoring
+
+    rb_df = pd.DataFrame({
+        'Player': ['Test Player', 'Other Player'],
+        'YBC/Att': [5, 2],
+        'YAC/Att': [3, 1],
+        'Att/Br': [10, 0],
+    })
+    wr_df = pd.DataFrame({
+        'Player': ['Test Player'],
+        'ADOT': [12],
+        'YAC/R': [6],
+        'Rec/Br': [8],
+    })
+    monkeypatch.setitem(
+        scoring._big_play_tables,
+        scoring.DEFAULT_ADV_STATS_SEASON,
+        scoring.build_big_play_table(rb_df, wr_df),
+    )
+
+    df = _sample_frame()
+    qb_cfg = json.loads(json.dumps(scoring.QB_SCORING_DEFAULT))
+
+    expected_qb = df.apply(lambda r: scoring.calculate_qb_points(r, qb_cfg), axis=1)
+    expected_rb = df.apply(scoring.calculate_rb_wr_points, axis=1)
+    expected_te = df.apply(scoring.calculate_te_points, axis=1)
+
+    np.testing.assert_allclose(scoring.score_qb_frame(df, qb_cfg), expected_qb)
+    np.testing.assert_allclose(scoring.score_rb_wr_frame(df), expected_rb)
+    np.testing.assert_allclose(scoring.score_te_frame(df), expected_te)
+    np.testing.assert_allclose(scoring.score_frame(df, 'wr'), expected_rb)
+    assert not scoring.score_frame(df, 'K').any()
+
+
+def test_big_play_table_normalizes_names_and_selects_season():
+    from utility import scoring
+
+    rb_df = pd.DataFrame({
+        'Player': ["D'Andre Swift*", 'Other Player'],
+        'YBC/Att': [4, 2],
+        'YAC/Att': [2, 1],
+        'Att/Br': [10, 20],
+    })
+    wr_df = pd.DataFrame({
+        'Player': ['Other Player'],
+        'ADOT': [10],
+        'YAC/R': [5],
+        'Rec/Br': [0],
+    })
+    table = scoring.build_big_play_table(rb_df, wr_df)
+
+    assert table.index.is_unique
+    assert table.loc['dandre swift', 'has_rus']
+    assert not table.loc['dandre swift', 'has_rec']
+    assert table.loc['other player', 'p() 20yd rec'] == pytest.approx(0.75)
+    assert scoring.normalize_player_name("D'Andre  Swift") == 'dandre swift'
+
+    seasons = {season: scoring.get_big_play_table(season) for season in (2023, 2024)}
+    assert not seasons[2023].equals(seasons[2024])
+
+    df = _sample_frame(n=20)
+    df['Name'] = 'Saquon Barkley'
+    expected = df.apply(lambda r: scoring.calculate_rb_wr_points(r, adv_season=2023), axis=1)
+    np.testing.assert_allclose(scoring.score_rb_wr_frame(df, adv_season=2023), expected)
+    assert not np.allclose(scoring.score_rb_wr_frame(df, adv_season=2024), expected)
+
+
+def test_import_does_not_read_adv_stats():
+    script = (
+        'import pandas as pd\n'
+        'calls = []\n'
+        'pd.read_csv = lambda *args, **kwargs: calls.append(args)\n'
+        'import utility.scoring\n'
+        'print(len(calls))\n'
+    )
+    root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=root, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == '0'
+
+
+def test_contribution_cache_recomputes_only_changed_stats():
+    from copy import deepcopy
+    from utility import scoring
+
+    df = _sample_frame()
+    cache = scoring.ContributionCache(df, 'TE')
+    config = deepcopy(scoring.SCORING_CONFIG_DEFAULT)
+
+    np.testing.assert_allclose(cache.points(config), scoring.score_frame(df, 'TE', config))
+    assert set(cache.recomputed) == {'RecYds', 'Rec', 'RecTD', 'Fum'}
+
+    config['TE']['Rec']['points_per'] = 1
+    np.testing.assert_allclose(cache.points(config), scoring.score_frame(df, 'TE', config))
+    assert cache.recomputed == ('Rec',)
+
+    cache.points(config)
+    assert cache.recomputed == ()
+
+
+def test_score_frame_batch_matches_individual_configs():
+    from copy import deepcopy
+    from utility import scoring
+
+    df = _sample_frame()
+    configs = []
+    for pass_td, bonuses in ((4, {}), (6, {'300': 2}), (6, {'250': 3, '400': 5})):
+        config = deepcopy(scoring.SCORING_CONFIG_DEFAULT)
+        config['QB']['PassTD']['points'] = pass_td
+        config['QB']['PassYds']['bonuses'] = bonuses
+        config['TE']['Rec'] = {'points': 1}
+        configs.append(config)
+
+    for pos in ('QB', 'TE', 'RB'):
+        batch = scoring.score_frame_batch(df, pos, configs)
+        assert batch.shape == (len(configs), len(df))
+        for row, config in zip(batch, configs):
+            np.testing.assert_allclose(row, scoring.score_frame(df, pos, config))
+
+
+def test_rb_wr_frame_honors_config(adv_stats):
+    from copy import deepcopy
+
+    scoring, _, _ = adv_stats
+    df = _sample_frame(n=50)
+    df['Name'] = 'Test Player'
+    probs = scoring._big_play_probabilities(df['Name'])
+    p = {dist: probs['rus', dist][0] for dist in (40, 60, 80)}
+    q = {dist: probs['rec', dist][0] for dist in (20, 40, 60, 80)}
+
+    config = deepcopy(scoring.RB_WR_SCORING_DEFAULT)
+    config['RushYds'] = {'points_per': 20, 'bonuses': {}}
+    config['Rec'] = {'points': 1}
+    config['Fum'] = {'points': -2}
+    config['BigRushTD'] = {'60': 4}
+    config['BigRec'] = {'40': 1}
+    config['BigRecTD'] = {}
+
+    expected = (
+        df['RushYds'] // 20
+        + df['RushTD'] * (6 + 4 * p[60])
+        + df['RecYds'] // 10
+        + 3 * (df['RecYds'] >= 100)
+        + 3 * (df['RecYds'] >= 200)
+        + 3 * (df['RecYds'] >= 300)
+        + df['RecTD'] * 6
+        + df['Rec'] * (1 + q[40])
+        + df['Fum'] * -2
+    )
+    np.testing.assert_allclose(scoring.score_rb_wr_frame(df, config), expected)
+
+    full = deepcopy(scoring.SCORING_CONFIG_DEFAULT)
+    full['WR'] = config
+    np.testing.assert_allclose(scoring.score_frame(df, 'WR', full), expected)
+    assert not np.allclose(scoring.score_frame(df, 'RB', full), expected)
+
+    with pytest.raises(ValueError):
+        scoring.compile_position_config({'BigRec': {'30': 1}}, 'RB')
+
+
+def test_rushing_twenty_yard_tier_pays_with_explicit_long_columns(monkeypatch):
+    from utility import scoring
+
+    rb_df = pd.DataFrame({
+        'Player': ['Depth Back', 'Explicit Back'],
+        'YBC/Att': [4, 2],
+        'YAC/Att': [2, 0],
+    })
+    explicit = pd.DataFrame({
+        'Player': ['Explicit Back'],
+        'p() 40yd rus': [0.05],
+        'p() 60yd rus': [0.02],
+        'p() 80yd rus': [0.01],
+    })
+    wr_df = pd.DataFrame({'Player': []})
+    table = scoring.build_big_play_table(rb_df, wr_df)
+    assert table.loc['depth back', 'p() 20yd rus'] == pytest.approx(0.3)
+    table = scoring.build_big_play_table(explicit, wr_df)
+    assert table.loc['explicit back', 'p() 20yd rus'] == pytest.approx(0.1)
+
+    monkeypatch.setattr(scoring, 'load_adv_stats', lambda season=None: (None, explicit, wr_df))
+    scoring.reset_adv_stats_cache()
+    try:
+        df = pd.DataFrame({'Name': ['Explicit Back'], 'RushTD': [2.0]})
+        with_tier = scoring.score_rb_wr_frame(df, {'BigRushTD': {'20': 1, '40': 2}})
+        without = scoring.score_rb_wr_frame(df, {'BigRushTD': {'40': 2}})
+    finally:
+        scoring.reset_adv_stats_cache()
+    # The 20-39 yard tier pays on p20 - p40.
+    np.testing.assert_allclose(with_tier - without, [2.0 * (0.1 - 0.05)])
+
+
+def _te_frame():
+    return pd.DataFrame({
+        'Name': ['A', 'B', 'C'],
+        'RecYds': [95.0, 40.0, 0.0],
+        'Rec': [7.0, 3.5, 0.0],
+        'RecTD': [0.8, 0.2, 0.0],
+        'Fum': [0.1, 0.0, 0.0],
+    })
+
+
+def test_simulate_points_matches_mean_for_linear_rules():
+    from utility import scoring, simulation
+
+    config = {'TE': {
+        'RecYds': {'points': 0.1},
+        'Rec': {'points': 1},
+        'RecTD': {'points': 6},
+        'Fum': {'points': -2},
+    }}
+    df = _te_frame()
+    result = simulation.simulate_points(df, 'TE', config, n_draws=20000, seed=1)
+    expected = scoring.score_frame(df, 'TE', config)
+    np.testing.assert_allclose(result['ExpectedPoints'], expected, rtol=0.03, atol=0.01)
+    assert (result['P10'] <= result['P50']).all()
+    assert (result['P50'] <= result['P90']).all()
+
+
+def test_simulate_points_prices_threshold_bonuses():
+    from utility import scoring, simulation
+
+    df = _te_frame()
+    result = simulation.simulate_points(df, 'TE', n_draws=20000, seed=2)
+
+    # Brute-force check for the 95-yard receiver: same lognormal model,
+    # scored element by element with the reference ladder.
+    cv = simulation.SIMULATION_CV['RecYds']
+    sigma2 = np.log(1 + cv ** 2)
+    rng = np.random.default_rng(3)
+    yards = 95.0 * np.exp(np.sqrt(sigma2) * rng.standard_normal(20000) - sigma2 / 2)
+    rule = scoring.compile_position_config({}, 'TE').rule('RecYds')
+    brute = rule.score(yards).mean()
+    deterministic = rule.score(np.array([95.0]))[0]
+
+    simulated_yardage = simulation.simulate_points(
+        df[['Name', 'RecYds']], 'TE', n_draws=20000, seed=2
+    )['ExpectedPoints'].iloc[0]
+    assert simulated_yardage == pytest.approx(brute, rel=0.03)
+    assert simulated_yardage > deterministic
+    assert result.loc[2].tolist() == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_simulate_points_is_seeded_and_chunk_independent():
+    from utility import simulation
+
+    df = _te_frame()
+    whole = simulation.simulate_points(df, 'TE', n_draws=2000, seed=5)
+    chunked = simulation.simulate_points(df, 'TE', n_draws=2000, seed=5, chunk_rows=1)
+    pd.testing.assert_frame_equal(whole, chunked)
+    other = simulation.simulate_points(df, 'TE', n_draws=2000, seed=6)
+    assert not whole.equals(other)
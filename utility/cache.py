@@ -0,0 +1,149 @@
+"""Bounded in-process cache for scored frames and auction values.
+
+Results are keyed on content rather than object identity: a digest of the
+compiled scoring plan plus a version string for the input data.  Two
+sessions or pages that ask for the same config against the same data share
+one entry, however their config dicts were built.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def data_version(obj) -> str:
+    """Return a digest identifying the contents of ``obj``.
+
+    DataFrames and Series are hashed row by row (values and index), so an
+    edited copy gets a new version while an identical reload keeps the old
+    one.  Object arrays are hashed by value, not by their pointers.
+    """
+
+    digest = hashlib.sha1()
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        if isinstance(obj, pd.DataFrame):
+            digest.update(repr(list(obj.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        digest.update(repr((obj.dtype.str, obj.shape)).encode())
+        if obj.dtype.hasobject:
+            digest.update(pd.util.hash_array(obj.ravel()).tobytes())
+        else:
+            digest.update(np.ascontiguousarray(obj).tobytes())
+    else:
+        digest.update(repr(obj).encode())
+    return digest.hexdigest()
+
+
+def _size_of(value) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, tuple):
+        return sum(_size_of(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def _copy(value):
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(item) for item in value)
+    return value
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by the approximate size of its values.
+
+    Values are copied on the way in and on the way out, so callers may
+    modify what they get back without corrupting the cached entry.
+
+    Parameters
+    ----------
+    max_bytes:
+        Memory budget.  Least recently used entries are evicted once the
+        total size of the cached values exceeds it; a value larger than the
+        whole budget is returned but not stored.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value, _ = self._entries[key]
+        return _copy(value)
+
+    def put(self, key, value) -> None:
+        value = _copy(value)
+        size = _size_of(value)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, calling ``compute()`` on a miss."""
+
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current usage."""
+
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+# Shared by the scoring, auction and modeling callers so the memory budget
+# covers every cached result in the process.
+results = ResultCache()
@@ -0,0 +1,90 @@
+"""Pooled SQLite connections.
+
+The helpers used to open and close a connection for every query.
+:func:`connection` instead checks one out of a small per-file pool and
+returns it afterwards, so the threads that serve requests reuse
+connections.  Each connection is configured once with :data:`PRAGMAS`.  The
+write-ahead log lets the History page read while the draft board writes.
+With WAL, ``synchronous=NORMAL`` is still crash-safe and only syncs at
+checkpoints.
+
+Writers use :func:`transaction`, which commits on success and rolls back on
+error.  A forked worker starts with empty pools rather than sharing its
+parent's connections.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -8192,  # KiB
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,  # ms
+}
+POOL_SIZE = 4
+
+_pools = {}
+_pid = os.getpid()
+_lock = threading.Lock()
+
+
+def _open(path: str) -> sqlite3.Connection:
+    # Pooled connections move between threads, one user at a time.
+    conn = sqlite3.connect(path, check_same_thread=False)
+    for name, value in PRAGMAS.items():
+        conn.execute(f'PRAGMA {name}={value}')
+    return conn
+
+
+@contextmanager
+def connection(path):
+    """Yield a pooled connection to the database at ``path``."""
+
+    global _pools, _pid
+    key = str(Path(path).resolve())
+    with _lock:
+        if _pid != os.getpid():
+            _pools, _pid = {}, os.getpid()
+        idle = _pools.setdefault(key, [])
+        conn = idle.pop() if idle else None
+    conn = conn or _open(key)
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        with _lock:
+            idle = _pools.get(key) if _pid == os.getpid() else None
+            if idle is not None and len(idle) < POOL_SIZE:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+
+
+@contextmanager
+def transaction(path):
+    """Yield a pooled connection inside a transaction on ``path``."""
+
+    with connection(path) as conn:
+        with conn:
+            yield conn
+
+
+def close_all() -> None:
+    """Close the idle connections of this process."""
+
+    with _lock:
+        idle = [conn for conns in _pools.values() for conn in conns] if _pid == os.getpid() else []
+        _pools.clear()
+    for conn in idle:
+        conn.close()
+
+
+atexit.register(close_all)
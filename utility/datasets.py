@@ -0,0 +1,195 @@
+"""Process-wide registry of the cleaned datasets.
+
+Pages, the auction model and the feature builders all read the same
+projections.  :data:`registry` builds each dataset once, on first use, and
+keeps a single cleaned copy whose arrays are marked read-only.  Callers get
+a shallow view: they may add, drop or rename columns on it, but writing into
+existing values raises ``ValueError`` instead of silently changing the data
+for everyone else.  Take ``.copy()`` first to edit values.
+
+With :meth:`DatasetRegistry.set_compact` the projection datasets are kept in
+the compact dtypes of :func:`utility.helpers.compact_frame` (categorical
+text, float32 stats, int8 weeks); :meth:`DatasetRegistry.memory_report`
+shows the difference.  Switch it on before the first dataset is used, since
+long-lived consumers such as the auction pipeline keep the views they got.
+
+Registered datasets:
+
+``offense``
+    Cleaned weekly projections for every position.
+``position:QB`` (``RB``, ``WR``, ``TE``)
+    Cleaned weekly projections for one position with ``ModelPoints`` and
+    ``Projection``.
+``schedule``
+    Long-format schedule with opponent defensive metrics.
+``defense``
+    Per-team defensive metrics.
+``props``
+    Sportsbook season-long prop projections.
+"""
+
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utility import cache, helpers
+
+POSITIONS = ['QB', 'RB', 'WR', 'TE']
+
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy ``df`` into one read-only array per column."""
+
+    columns = {}
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            codes = df[col].cat.codes.to_numpy().copy()
+            codes.flags.writeable = False
+            columns[col] = pd.Categorical.from_codes(codes, dtype=df[col].dtype)
+            continue
+        values = df[col].to_numpy(copy=True)
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+        columns[col] = values
+    return pd.DataFrame(columns, index=df.index.copy(), copy=False)
+
+
+def _nbytes(df: pd.DataFrame) -> int:
+    """Deep memory use of ``df``.
+
+    ``DataFrame.memory_usage(deep=True)`` cannot read read-only object
+    arrays, so string sizes are summed here.
+    """
+
+    total = int(df.index.memory_usage(deep=True))
+    for col in df.columns:
+        if df[col].dtype == object:
+            values = df[col].to_numpy()
+            total += values.nbytes + sum(map(sys.getsizeof, values))
+        else:
+            total += int(df[col].memory_usage(index=False, deep=True))
+    return total
+
+
+class DatasetRegistry:
+    """Lazily built, shared, read-only datasets.
+
+    Parameters
+    ----------
+    compact:
+        Store datasets registered with ``compactable`` in compact dtypes.
+    """
+
+    def __init__(self, compact: bool = False):
+        self.compact = compact
+        self._builders = {}
+        self._compactable = set()
+        self._frames = {}
+        self._versions = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, build, compactable: bool = False) -> None:
+        """Register ``build()`` as the source of dataset ``name``."""
+
+        with self._lock:
+            self._builders[name] = build
+            if compactable:
+                self._compactable.add(name)
+            else:
+                self._compactable.discard(name)
+            self.clear(name)
+
+    def set_compact(self, compact: bool = True) -> None:
+        """Switch compact dtypes on or off, dropping datasets built the other way."""
+
+        with self._lock:
+            if compact != self.compact:
+                self.compact = compact
+                for name in self._compactable:
+                    self.clear(name)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._builders)
+
+    def _frame(self, name: str) -> pd.DataFrame:
+        with self._lock:
+            if name not in self._frames:
+                if name not in self._builders:
+                    raise KeyError(f'unknown dataset {name!r}')
+                frame = self._builders[name]()
+                if self.compact and name in self._compactable:
+                    frame = helpers.compact_frame(frame)
+                self._frames[name] = _freeze(frame)
+            return self._frames[name]
+
+    def get(self, name: str) -> pd.DataFrame:
+        """Read-only view of dataset ``name``, building it on first use."""
+
+        return self._frame(name).copy(deep=False)
+
+    def version(self, name: str) -> str:
+        """:func:`utility.cache.data_version` of dataset ``name``."""
+
+        frame = self._frame(name)
+        with self._lock:
+            if name not in self._versions:
+                self._versions[name] = cache.data_version(frame)
+            return self._versions[name]
+
+    def clear(self, name: str | None = None) -> None:
+        """Drop one built dataset (or all of them) so the next use reloads it."""
+
+        with self._lock:
+            for key in [name] if name else list(self._frames):
+                self._frames.pop(key, None)
+                self._versions.pop(key, None)
+
+    def memory_report(self) -> pd.DataFrame:
+        """Rows, columns and deep memory use of every dataset built so far."""
+
+        with self._lock:
+            frames = dict(self._frames)
+        report = pd.DataFrame(
+            [
+                {
+                    'Dataset': name,
+                    'Rows': len(frame),
+                    'Columns': len(frame.columns),
+                    'Bytes': _nbytes(frame),
+                }
+                for name, frame in frames.items()
+            ],
+            columns=['Dataset', 'Rows', 'Columns', 'Bytes'],
+        )
+        return report.sort_values('Bytes', ascending=False, ignore_index=True)
+
+
+registry = DatasetRegistry()
+registry.register(
+    'offense',
+    lambda: helpers.clean_offense_data(helpers.get_offense_data()),
+    compactable=True,
+)
+for _pos in POSITIONS:
+    registry.register(
+        f'position:{_pos}',
+        lambda pos=_pos: helpers.clean_offense_data(helpers.get_position_data(pos), pos=pos),
+        compactable=True,
+    )
+registry.register('defense', helpers.get_defense_metrics)
+registry.register(
+    'schedule',
+    lambda: helpers.clean_schedule(helpers.get_schedule(), registry.get('defense')),
+)
+registry.register('props', helpers.get_sportsbook_props)
+
+
+def get(name: str) -> pd.DataFrame:
+    return registry.get(name)
+
+
+def position(pos: str) -> pd.DataFrame:
+    return registry.get(f'position:{pos.upper()}')
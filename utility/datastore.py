@@ -0,0 +1,130 @@
+"""Cached CSV loading.
+
+:func:`read_csv` is a drop-in for :func:`pandas.read_csv` on the files under
+``data/``.  A parsed frame is kept in two places:
+
+* in memory, for the life of the process, so the pages, the auction model
+  and the feature builders share one parse per file;
+* on disk as ``<name>.csv.feather`` (Arrow IPC) next to the source, so a
+  new process loads typed columns instead of re-parsing text.
+
+Both are keyed on the CSV's modification time and size plus the read
+options, and are rebuilt as soon as the CSV changes.  Without ``pyarrow``
+only the in-memory layer is used.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    pa = feather = None
+
+SUFFIX = '.feather'
+_METADATA_KEY = b'fantasy_football.source'
+
+_frames = {}
+_lock = threading.Lock()
+stats = {'memory': 0, 'disk': 0, 'parsed': 0}
+
+
+def cache_path(path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + SUFFIX)
+
+
+def _stamp(path: Path, options: dict) -> str:
+    info = path.stat()
+    return json.dumps(
+        {'mtime_ns': info.st_mtime_ns, 'size': info.st_size, 'options': repr(sorted(options.items()))},
+        sort_keys=True,
+    )
+
+
+def _read_disk(path: Path, stamp: str):
+    target = cache_path(path)
+    if feather is None or not target.exists():
+        return None
+    try:
+        table = feather.read_table(target)
+    except (OSError, pa.ArrowException):
+        return None
+    if (table.schema.metadata or {}).get(_METADATA_KEY, b'').decode() != stamp:
+        return None
+    return to_pandas(table)
+
+
+def to_pandas(table) -> pd.DataFrame:
+    """Convert an Arrow table to the frame :func:`pandas.read_csv` would give."""
+
+    # Arrow hands back missing text as None; read_csv gives NaN.
+    nullable = [
+        field.name for field, column in zip(table.schema, table.columns)
+        if column.null_count and not pa.types.is_floating(field.type)
+    ]
+    df = table.to_pandas()
+    for col in nullable:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+def _write_disk(path: Path, stamp: str, df: pd.DataFrame) -> None:
+    if feather is None:
+        return
+    target = cache_path(path)
+    tmp = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+    try:
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _METADATA_KEY: stamp.encode()})
+        feather.write_feather(table, tmp, compression='uncompressed')
+        os.replace(tmp, target)
+    except (OSError, TypeError, ValueError, pa.ArrowException):
+        # Mixed-type columns or a read-only data directory: keep serving
+        # from memory and re-parse in the next process.
+        tmp.unlink(missing_ok=True)
+
+
+def read_csv(path, **options) -> pd.DataFrame:
+    """Read ``path`` like :func:`pandas.read_csv`, via the caches.
+
+    Raises whatever :func:`pandas.read_csv` would for a missing or
+    unreadable file.  The caller gets its own copy of the frame.
+    """
+
+    path = Path(path).resolve()
+    stamp = _stamp(path, options)
+    key = (str(path), repr(sorted(options.items())))
+    with _lock:
+        cached = _frames.get(key)
+    if cached is not None and cached[0] == stamp:
+        stats['memory'] += 1
+        return cached[1].copy()
+
+    df = _read_disk(path, stamp)
+    if df is not None:
+        stats['disk'] += 1
+    else:
+        df = pd.read_csv(path, **options)
+        stats['parsed'] += 1
+        _write_disk(path, stamp, df)
+    with _lock:
+        _frames[key] = (stamp, df)
+    return df.copy()
+
+
+def clear(disk: bool = False, root=None) -> None:
+    """Drop the in-memory frames, and with ``disk`` the ``.feather`` files under ``root``."""
+
+    with _lock:
+        _frames.clear()
+    if disk:
+        for target in Path(root or Path(__file__).resolve().parents[1] / 'data').rglob(f'*.csv{SUFFIX}'):
+            target.unlink(missing_ok=True)
@@ -3,7 +3,6 @@ from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.styles import Font, Alignment, PatternFill
 import pandas as pd
 import numpy as np
-import sqlite3
 from utility import helpers
 
 positions = ['QB', 'RB', 'WR', 'TE']
@@ -84,8 +83,6 @@ def save_to_excel(position_dfs, filename='fantasy_football_auction_values.xlsx')
 
 
 def export_draft_history(filename='draft_history.xlsx'):
-    conn = sqlite3.connect(helpers.DB_FILE)
-    df = pd.read_sql_query('SELECT * FROM draft_picks', conn)
-    conn.close()
+    df = helpers.get_draft_history()
     df.to_excel(filename, index=False)
     print(f"Draft history exported to {filename}")
@@ -1,40 +1,103 @@
+import threading
+import numpy as np
 import pandas as pd
 from typing import Optional
-import sqlite3
 from datetime import datetime
 from pathlib import Path
-from utility import scoring
+from utility import database, datastore, projection_store, scoring
 from modeling.predict import predict_position
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DB_FILE = str(BASE_DIR / 'data' / 'draft_history.db')
 CURRENT_SEASON = datetime.now().year
 
+# Full team names of the advanced stats, as abbreviated on the schedule.
+TEAM_ABBREVIATIONS = {
+    'Arizona Cardinals': 'ARI', 'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL',
+    'Buffalo Bills': 'BUF', 'Carolina Panthers': 'CAR', 'Chicago Bears': 'CHI',
+    'Cincinnati Bengals': 'CIN', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
+    'Denver Broncos': 'DEN', 'Detroit Lions': 'DET', 'Green Bay Packers': 'GB',
+    'Houston Texans': 'HOU', 'Indianapolis Colts': 'IND', 'Jacksonville Jaguars': 'JAX',
+    'Kansas City Chiefs': 'KC', 'Las Vegas Raiders': 'LV', 'Los Angeles Chargers': 'LAC',
+    'Los Angeles Rams': 'LAR', 'Miami Dolphins': 'MIA', 'Minnesota Vikings': 'MIN',
+    'New England Patriots': 'NE', 'New Orleans Saints': 'NO', 'New York Giants': 'NYG',
+    'New York Jets': 'NYJ', 'Philadelphia Eagles': 'PHI', 'Pittsburgh Steelers': 'PIT',
+    'San Francisco 49ers': 'SF', 'Seattle Seahawks': 'SEA', 'Tampa Bay Buccaneers': 'TB',
+    'Tennessee Titans': 'TEN', 'Washington Commanders': 'WSH',
+}
+
 
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS draft_picks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            season INTEGER NOT NULL,
-            player TEXT,
-            position TEXT,
-            team TEXT,
-            owner TEXT,
-            price REAL
+    with database.transaction(DB_FILE) as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS draft_picks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                player TEXT,
+                position TEXT,
+                team TEXT,
+                owner TEXT,
+                price REAL
+            )
+            """
         )
-        """
-    )
-    conn.commit()
-    conn.close()
+
+
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+
+def _ensure_schema():
+    '''Create and migrate the draft tables of ``DB_FILE`` on its first use in this process.'''
+    path = str(Path(DB_FILE).resolve())
+    if path in _schema_ready:
+        return
+    with _schema_lock:
+        if path not in _schema_ready:
+            init_db()
+            migrate_db()
+            _schema_ready.add(path)
+
+
+_DUPLICATE_PICKS = (
+    'SELECT * FROM draft_picks WHERE player IS NOT NULL AND id NOT IN '
+    '(SELECT MAX(id) FROM draft_picks GROUP BY season, player)'
+)
+
+
+def migrate_db() -> int:
+    """Add the unique ``(season, player)`` index that :func:`log_draft_picks` upserts on.
+
+    Run by the first read or write of each database; later calls do
+    nothing.  Players
+    logged more than once for a season keep their latest pick, and the
+    older rows are moved to ``draft_picks_duplicates`` rather than deleted.
+    Returns the number of rows moved.
+    """
+
+    with database.transaction(DB_FILE) as conn:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='index' AND name='draft_picks_season_player'"
+        ).fetchone()
+        if exists:
+            return 0
+        duplicates = conn.execute(_DUPLICATE_PICKS).fetchall()
+        if duplicates:
+            conn.execute(f'CREATE TABLE IF NOT EXISTS draft_picks_duplicates AS {_DUPLICATE_PICKS} LIMIT 0')
+            conn.execute(f'INSERT INTO draft_picks_duplicates {_DUPLICATE_PICKS}')
+            conn.execute(f'DELETE FROM draft_picks WHERE id IN (SELECT id FROM ({_DUPLICATE_PICKS}))')
+            for _, _, season, player, _, _, owner, price in duplicates:
+                print(f"moved duplicate {season} pick of {player} ({owner}, ${price}) to draft_picks_duplicates")
+        conn.execute('CREATE UNIQUE INDEX draft_picks_season_player ON draft_picks(season, player)')
+    return len(duplicates)
+
 
 def get_schedule():
     file_path = Path(__file__).resolve().parents[1] / 'data' / 'schedule_2025.csv'
     try:
-        df = pd.read_csv(file_path)
+        df = datastore.read_csv(file_path)
     except Exception:
         print("schedule not found")
         df = pd.DataFrame()
@@ -56,7 +119,7 @@ def get_season_long_projections():
         / 'season_long_proj_table.csv'
     )
     try:
-        df = pd.read_csv(file_path)
+        df = datastore.read_csv(file_path)
     except Exception:
         df = pd.DataFrame()
     return df
@@ -79,7 +142,7 @@ def get_sportsbook_props():
     )
 
     try:
-        df = pd.read_csv(file_path)
+        df = datastore.read_csv(file_path)
     except Exception:
         return pd.DataFrame()
 
@@ -110,38 +173,57 @@ def get_defense_metrics():
     lightweight proxy for defensive DVOA while ``Yds`` is used as a simple
     estimate for fantasy points allowed.  If the file is not found an empty
     :class:`~pandas.DataFrame` is returned so downstream code can handle the
-    absence gracefully.
+    absence gracefully.  Teams are keyed by their schedule abbreviation
+    (see :data:`TEAM_ABBREVIATIONS`) so the metrics join the schedule.
     """
 
     file_path = 'data/2024_adv_stats/Pressure_by_team.csv'
     try:
-        df = pd.read_csv(file_path)
+        df = datastore.read_csv(file_path)
         df.rename(
             columns={'Tm': 'TEAM', 'Prss%': 'DVOA', 'Yds': 'FantasyPointsAllowed'},
             inplace=True,
         )
         if 'DVOA' in df.columns:
             df['DVOA'] = df['DVOA'].astype(str).str.replace('%', '').astype(float)
+        df['TEAM'] = df['TEAM'].replace(TEAM_ABBREVIATIONS)
         df = df[['TEAM', 'DVOA', 'FantasyPointsAllowed']]
     except Exception:
         print("defensive metrics not found")
         df = pd.DataFrame()
     return df
 
+def _clean_text(s: pd.Series, na: str = '') -> pd.Series:
+    '''Stripped strings of ``s`` with missing values as ``na``.
+
+    Each distinct value is cleaned once and mapped back by its code.
+    '''
+    codes, uniques = pd.factorize(s)
+    cleaned = pd.Index(uniques, dtype=object).astype(str).str.strip().append(pd.Index([na]))
+    return pd.Series(cleaned.to_numpy(dtype=object)[codes], index=s.index, name=s.name)
+
 def clean_schedule(df: pd.DataFrame, def_metrics: Optional[pd.DataFrame] = None):
+    '''
+    Long-format schedule: one row per ``TEAM`` and ``Week`` with ``Opponent``,
+    ``Location`` (Home/Away) and ``Game_Type`` (Game/BYE).  Blank cells count
+    as byes.
+    '''
     # Melt the DataFrame to long format
     df_long = pd.melt(df, id_vars=['TEAM'], var_name='Week', value_name='Opponent')
 
-    # Fix non-integer weeks
-    df_long['Week'] = df_long['Week'].apply(lambda x: int(x) if x else x)
+    week = pd.to_numeric(df_long['Week'], errors='coerce')
+    df_long['Week'] = week.astype('int64') if week.notna().all() else week.astype('Int64')
 
-    # Extract the location (home/away) and opponent team
-    df_long['Location'] = df_long['Opponent'].apply(lambda x: 'Away' if '@' in x else 'Home')
-    df_long['Opponent'] = df_long['Opponent'].str.replace('@', '').str.strip()
+    # '@XX' is an away game at XX; work on the distinct cells only
+    codes, cells = pd.factorize(df_long['Opponent'])
+    cells = pd.Index(cells, dtype=object).astype(str).str.strip().append(pd.Index(['BYE']))
+    away = cells.str.startswith('@')
+    opponent = cells.str.lstrip('@').str.strip()
+    bye = opponent == 'BYE'
 
-    # Handle BYE weeks
-    df_long['Game_Type'] = df_long['Opponent'].apply(lambda x: 'BYE' if x == 'BYE' else 'Game')
-    df_long['Opponent'] = df_long['Opponent'].replace('BYE', 'None')
+    df_long['Location'] = np.where(away, 'Away', 'Home')[codes]
+    df_long['Opponent'] = np.where(bye, 'None', opponent)[codes]
+    df_long['Game_Type'] = np.where(bye, 'BYE', 'Game')[codes]
 
     # Sort by team and week
     df_long = df_long.sort_values(by=['TEAM', 'Week'])
@@ -163,15 +245,39 @@ def clean_schedule(df: pd.DataFrame, def_metrics: Optional[pd.DataFrame] = None)
 def get_offense_data():
     file_path = Path(__file__).resolve().parents[1] / 'data' / '2025_weekly_proj' / 'off.csv'
     try:
-        df = pd.read_csv(file_path, index_col=0, header=0)
+        df = datastore.read_csv(file_path, index_col=0, header=0)
     except :
         print("no data")
         df = pd.DataFrame()
     return df
 
-def clean_offense_data(df: pd.DataFrame, pos: str = None):
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with compact dtypes.
+
+    Text columns become categoricals, float columns float32 and a
+    whole-numbered ``Week`` int8.  Values are unchanged apart from float32
+    rounding.
+    """
+
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if col == 'Week' and pd.api.types.is_numeric_dtype(values) and values.notna().all() \
+                and (values % 1 == 0).all() and values.abs().max() < 128:
+            values = values.astype(np.int8)
+        elif values.dtype == object or pd.api.types.is_string_dtype(values):
+            values = values.astype('category')
+        elif pd.api.types.is_float_dtype(values):
+            values = values.astype(np.float32)
+        columns[col] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def clean_offense_data(df: pd.DataFrame, pos: str = None, compact: bool = False):
     '''
     Player,Opp,PassYds,PassTD,Int,RushYds,RushTD,Rec,RecYds,RecTD,RetTD,FumTD,TwoPt,Lost,Points,Week,Name,_position,_team
+
+    With ``compact`` the result goes through :func:`compact_frame`.
     '''
     main_cols = ['Name', 'Position', 'Team', 'Opp', 'Week']
     # Rename columns for clarity
@@ -186,54 +292,36 @@ def clean_offense_data(df: pd.DataFrame, pos: str = None):
         #'TD.2':'RecTD',
         'Lost':'Fum'
     }
-    df.rename(columns=rename_map, inplace=True)
-
-    df.drop(columns=['FumTD', 'TwoPt'], inplace=True)
+    df = df.rename(columns=rename_map).drop(columns=['FumTD', 'TwoPt'], errors='ignore')
 
     ordered_cols = main_cols + [col for col in df.columns if col not in main_cols+['Player']]
 
-    df = df[ordered_cols]
-
-    str_cols = ['Name', 'Position', 'Team', 'Opp']
-    for c in df.columns:
-        #print(str(c))
-        if c not in str_cols:
-            df[c].fillna(float(0))
-            df[c] = df[c].astype(float)
-        else:
-            df[c].fillna('')
-            df[c] = df[c].astype(str)
-            df[c] = df[c].apply(lambda x: x.strip() if x is str else x)
-
-
     if pos:
         pos = pos.upper()
         if pos == 'QB':
-            cols = main_cols + ['PassYds', 'PassTD', 'Int', 'RushYds', 'RushTD', 'Fum']
+            ordered_cols = main_cols + ['PassYds', 'PassTD', 'Int', 'RushYds', 'RushTD', 'Fum']
         elif pos in ('RB', 'WR'):
-            cols = main_cols + ['RushYds', 'RushTD', 'Rec', 'RecYds', 'RecTD', 'Fum']
+            ordered_cols = main_cols + ['RushYds', 'RushTD', 'Rec', 'RecYds', 'RecTD', 'Fum']
         elif pos == 'TE':
-            cols = main_cols + ['Rec', 'RecYds', 'RecTD', 'Fum']
-        else: cols = df.columns
-        df = df[cols]
+            ordered_cols = main_cols + ['Rec', 'RecYds', 'RecTD', 'Fum']
 
-    if pos:
-        pos = pos.upper()
-        if pos == 'QB':
-            df['ModelPoints'] = df.apply(scoring.calculate_qb_points, axis=1)
-        elif pos in ('RB', 'WR'):
-            df['ModelPoints'] = df.apply(scoring.calculate_rb_wr_points, axis=1)
-        elif pos == 'TE':
-            df['ModelPoints'] = df.apply(scoring.calculate_te_points, axis=1)
-        else:
-            df['ModelPoints'] = 0.0
+    df = df[ordered_cols]
+
+    # Missing stats are zero, missing text is ''
+    str_cols = ['Name', 'Position', 'Team', 'Opp']
+    num_cols = [c for c in df.columns if c not in str_cols]
+    text = {c: _clean_text(df[c]) for c in str_cols}
+    df = df[num_cols].astype(float).fillna(0.0).assign(**text)[ordered_cols]
 
     if pos:
+        df['ModelPoints'] = scoring.score_frame(df, pos)
         try:
             df['Projection'] = predict_position(df, pos)
         except Exception:
             df['Projection'] = 0.0
 
+    if compact:
+        df = compact_frame(df)
     return df
 
 def get_board():
@@ -242,8 +330,9 @@ def get_board():
         board_df = pd.read_csv(file_path)
     except :
         print("no board")
-        off_data = get_offense_data()
-        off_data = clean_offense_data(off_data)
+        from utility import datasets
+
+        off_data = datasets.get('offense')
         board_df = pd.DataFrame()
         board_df = off_data.loc[:, ['Name', 'Position', 'Team']].copy(deep=True)
         board_df['Owner'] = pd.NA
@@ -268,55 +357,63 @@ def save_board(df):
             return False
     return False
 
-def get_position_data(pos: str):
+def get_position_data(pos: str, season: int = None):
+    '''Weekly projections for ``pos`` from the projection store, latest season by default.'''
     pos = pos.upper()
     if pos not in ['QB', 'RB', 'WR', 'TE', 'K']: return pd.DataFrame()
-    file_path = Path(__file__).resolve().parents[1] / 'data' / '2025_weekly_proj' / f'{pos}.csv'
-    try:
-        df = pd.read_csv(file_path, header=0)
-    except :
+    season = season or max(projection_store.seasons(pos), default=None)
+    df = projection_store.load(seasons=season, positions=pos) if season else pd.DataFrame()
+    if df.empty:
         print("no data")
-        df = pd.DataFrame()
-    return df
+        return pd.DataFrame()
+    return df.drop(columns='Season')
 
 
-def log_draft_picks(df: pd.DataFrame, season: int = CURRENT_SEASON):
-    conn = sqlite3.connect(DB_FILE)
-    cur = conn.cursor()
-    for _, row in df.iterrows():
-        owner = str(row.get('Owner', '')).strip()
-        if owner:
-            cur.execute(
-                'SELECT 1 FROM draft_picks WHERE season=? AND player=?',
-                (season, row['Name'])
-            )
-            if not cur.fetchone():
-                cur.execute(
-                    'INSERT INTO draft_picks(timestamp, season, player, position, team, owner, price) VALUES (?, ?, ?, ?, ?, ?, ?)',
-                    (
-                        datetime.utcnow().isoformat(),
-                        season,
-                        row['Name'],
-                        row.get('Position'),
-                        row.get('Team'),
-                        owner,
-                        float(row.get('Price', 0))
-                    )
-                )
-    conn.commit()
-    conn.close()
+_PICK_COLUMNS = ['Name', 'Position', 'Team', 'Owner', 'Price']
+_UPSERT_PICK = """
+    INSERT INTO draft_picks(timestamp, season, player, position, team, owner, price)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(season, player) DO UPDATE SET
+        timestamp=excluded.timestamp, position=excluded.position, team=excluded.team,
+        owner=excluded.owner, price=excluded.price
+    WHERE (position, team, owner, price) IS NOT
+        (excluded.position, excluded.team, excluded.owner, excluded.price)
+"""
+
+
+def log_draft_picks(df: pd.DataFrame, season: int = CURRENT_SEASON) -> int:
+    """Upsert the drafted rows of a draft board; return how many were written.
+
+    Rows with an owner are compared with the picks stored for ``season`` and
+    only new or changed ones are written, so re-saving an unchanged board
+    touches no rows.
+    """
+
+    picks = df.reindex(columns=_PICK_COLUMNS)
+    owner = picks['Owner'].fillna('').astype(str).str.strip()
+    picks = picks.assign(Owner=owner, Price=pd.to_numeric(picks['Price'], errors='coerce').fillna(0.0))
+    picks = picks[~owner.isin(['', 'nan', 'None']) & picks['Name'].notna()].drop_duplicates('Name')
+    if picks.empty:
+        return 0
+    rows = picks.astype(object).where(picks.notna(), None).itertuples(index=False, name=None)
+    _ensure_schema()
+    with database.transaction(DB_FILE) as conn:
+        stored = set(conn.execute(
+            'SELECT player, position, team, owner, price FROM draft_picks WHERE season=?', (season,)
+        ))
+        timestamp = datetime.utcnow().isoformat()
+        changed = [(timestamp, season, *row) for row in rows if row not in stored]
+        if changed:
+            conn.executemany(_UPSERT_PICK, changed)
+    return len(changed)
 
 
 def get_draft_history(season: int = None):
-    conn = sqlite3.connect(DB_FILE)
     query = 'SELECT * FROM draft_picks'
     params = ()
     if season is not None:
         query += ' WHERE season=?'
         params = (season,)
-    df = pd.read_sql_query(query, conn, params=params)
-    conn.close()
-    return df
-
-
-init_db()
+    _ensure_schema()
+    with database.connection(DB_FILE) as conn:
+        return pd.read_sql_query(query, conn, params=params)
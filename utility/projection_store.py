@@ -0,0 +1,280 @@
+"""Partitioned store of the weekly projections.
+
+The ``data/<season>_weekly_proj/<POS>.csv`` exports are copied into a store
+partitioned by position and season, one Arrow IPC (Feather) file per
+partition with one record batch per week::
+
+    data/projections/position=QB/season=2025/part-0.feather
+
+:func:`load` takes season, position, week-range and column filters: it
+opens only the matching position and season files, memory-maps them and
+reads only the batches of the requested weeks and columns, so adding a
+season does not slow down loads of the others.  :func:`sync` rewrites a
+position when one of its CSVs is added, removed or changed (tracked by
+modification time and size in ``manifest.json``).  Loads only stat the
+season directories and the manifest, and run :func:`sync` when those change
+or :data:`SYNC_INTERVAL` seconds after the last one, which picks up CSVs
+rewritten in place.
+
+The 2024 exports repeat the ``Yds``/``TD`` headers; those are renamed to
+the 2025 names on the way in so every season of a position shares one
+schema.  Without ``pyarrow``, or with a read-only data directory,
+:func:`load` reads and filters the CSVs directly.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from utility import datastore
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = ipc = None
+
+DATA_DIR = Path(__file__).resolve().parents[1] / 'data'
+STORE_NAME = 'projections'
+MANIFEST = 'manifest.json'
+PART = 'part-0.feather'
+_WEEKS_KEY = b'fantasy_football.weeks'
+SYNC_INTERVAL = 5.0  # seconds
+
+# pandas' names for the repeated headers of the 2024 exports.
+LEGACY_COLUMNS = {
+    'Yds': 'PassYds',
+    'TD': 'PassTD',
+    'Yds.1': 'RushYds',
+    'TD.1': 'RushTD',
+    'Yds.2': 'RecYds',
+    'TD.2': 'RecTD',
+    'TD.3': 'RetTD',
+    '2PT': 'TwoPt',
+}
+
+_SEASON_DIR = re.compile(r'(\d{4})_weekly_proj')
+_lock = threading.Lock()
+_synced = {}
+
+
+def sources(data_dir=None) -> dict[str, dict[int, Path]]:
+    """``{position: {season: csv}}`` for every weekly projection export."""
+
+    found = {}
+    for path in sorted(Path(data_dir or DATA_DIR).resolve().glob('*_weekly_proj/*.csv')):
+        match = _SEASON_DIR.fullmatch(path.parent.name)
+        if match and path.stem != 'off':
+            found.setdefault(path.stem.upper(), {})[int(match.group(1))] = path
+    return found
+
+
+def seasons(position: str | None = None, data_dir=None) -> list[int]:
+    """Seasons with projections, for one position or any."""
+
+    found = sources(data_dir)
+    if position:
+        return sorted(found.get(position.upper(), {}))
+    return sorted({season for paths in found.values() for season in paths})
+
+
+def version(position: str, seasons=None, data_dir=None) -> str:
+    """Digest of the source CSVs behind ``position`` (optionally some seasons)."""
+
+    wanted = {int(season) for season in _as_list(seasons)}
+    paths = sources(data_dir).get(position.upper(), {})
+    stamp = _stamp({s: p for s, p in paths.items() if not wanted or s in wanted})
+    return hashlib.sha1(json.dumps(stamp, sort_keys=True).encode()).hexdigest()
+
+
+def _read_source(path: Path, season: int) -> pd.DataFrame:
+    df = datastore.read_csv(path)
+    if 'Yds.1' in df.columns:
+        df = df.rename(columns=LEGACY_COLUMNS)
+    return df.assign(season=season)
+
+
+def _stamp(paths: dict) -> dict:
+    stamp = {}
+    for season, path in paths.items():
+        info = path.stat()
+        stamp[str(season)] = [str(path), info.st_mtime_ns, info.st_size]
+    return stamp
+
+
+def _write_position(target: Path, frames: list[pd.DataFrame]) -> None:
+    frame = pd.concat(frames, ignore_index=True)
+    # One schema for every season of the position.
+    schema = pa.Schema.from_pandas(frame.drop(columns='season'), preserve_index=False)
+    tmp = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+    shutil.rmtree(tmp, ignore_errors=True)
+    for season, part in frame.groupby('season', sort=True):
+        path = tmp / f'season={season}' / PART
+        path.parent.mkdir(parents=True)
+        weeks = part.drop(columns='season').groupby('Week', sort=True)
+        # The footer lists the week of each batch so loads can skip the rest.
+        indexed = schema.with_metadata({**(schema.metadata or {}), _WEEKS_KEY: json.dumps([int(w) for w in weeks.groups]).encode()})
+        with ipc.new_file(path, indexed) as writer:
+            for _, week in weeks:
+                writer.write_table(pa.Table.from_pandas(week, schema=indexed, preserve_index=False))
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(tmp, target)
+
+
+def _read_partition(path: Path, season: int, weeks, columns):
+    reader = ipc.open_file(pa.memory_map(str(path)))
+    batch_weeks = json.loads(reader.schema.metadata[_WEEKS_KEY])
+    wanted = [i for i, week in enumerate(batch_weeks) if not weeks or weeks[0] <= week <= weeks[1]]
+    if not wanted:
+        return None
+    table = pa.Table.from_batches([reader.get_batch(i) for i in wanted], reader.schema)
+    names = [c for c in columns if c in table.column_names] if columns else table.column_names
+    table = table.select(names)
+    return table.append_column('season', pa.array([season] * table.num_rows, pa.int64()))
+
+
+def _read_manifest(root: Path) -> dict:
+    try:
+        return json.loads((root / MANIFEST).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def sync(data_dir=None, root=None) -> list[str]:
+    """Bring the store up to date with the CSVs; return the rewritten positions."""
+
+    data_dir = Path(data_dir or DATA_DIR).resolve()
+    root = Path(root or data_dir / STORE_NAME)
+    found = sources(data_dir)
+    changed = []
+    with _lock:
+        manifest = _read_manifest(root)
+        for pos, paths in found.items():
+            stamp = _stamp(paths)
+            target = root / f'position={pos}'
+            if manifest.get(pos) == stamp and target.is_dir():
+                continue
+            root.mkdir(parents=True, exist_ok=True)
+            _write_position(target, [_read_source(path, season) for season, path in paths.items()])
+            manifest[pos] = stamp
+            changed.append(pos)
+        for pos in set(manifest) - set(found):
+            shutil.rmtree(root / f'position={pos}', ignore_errors=True)
+            del manifest[pos]
+            changed.append(pos)
+        if changed:
+            tmp = root / f'{MANIFEST}.{os.getpid()}.tmp'
+            tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+            os.replace(tmp, root / MANIFEST)
+    return changed
+
+
+def _dir_stamp(data_dir: Path, root: Path) -> list:
+    stamp = []
+    for path in [data_dir, *sorted(data_dir.glob('*_weekly_proj')), root / MANIFEST]:
+        try:
+            info = path.stat()
+        except OSError:
+            continue
+        stamp.append([str(path), info.st_mtime_ns, info.st_size])
+    return stamp
+
+
+def _sync_if_stale(data_dir: Path, root: Path) -> None:
+    key = (data_dir, root)
+    last = _synced.get(key)
+    if last and last[0] == _dir_stamp(data_dir, root) and time.monotonic() - last[1] < SYNC_INTERVAL:
+        return
+    sync(data_dir, root)
+    _synced[key] = (_dir_stamp(data_dir, root), time.monotonic())
+
+
+def _as_list(value) -> list:
+    if value is None:
+        return []
+    if isinstance(value, (str, int)):
+        return [value]
+    return list(value)
+
+
+def _finish(frames: list[pd.DataFrame], columns) -> pd.DataFrame:
+    if not frames:
+        return pd.DataFrame(columns=list(columns or []) + ['Season'])
+    df = pd.concat(frames, ignore_index=True)
+    df = df[[c for c in df.columns if c != 'season'] + ['season']]
+    return df.rename(columns={'season': 'Season'}).astype({'Season': 'int64'})
+
+
+def _load_csv(found, seasons, positions, weeks, columns) -> pd.DataFrame:
+    frames = []
+    for pos in positions or sorted(found):
+        for season, path in sorted(found.get(pos, {}).items()):
+            if seasons and season not in seasons:
+                continue
+            df = _read_source(path, season).sort_values('Week', kind='stable')
+            if weeks:
+                df = df[df['Week'].between(*weeks)]
+            names = [c for c in columns if c in df.columns] if columns else list(df.columns)
+            frames.append(df[[c for c in names if c != 'season'] + ['season']])
+    return _finish(frames, columns)
+
+
+def load(
+    seasons=None,
+    positions=None,
+    weeks=None,
+    columns=None,
+    data_dir=None,
+    root=None,
+) -> pd.DataFrame:
+    """Weekly projections matching the filters, one row per player-week.
+
+    Parameters
+    ----------
+    seasons, positions:
+        One value or a list; ``None`` for all.
+    weeks:
+        One week or an inclusive ``(first, last)`` range; ``None`` for all.
+    columns:
+        Columns to read, skipping any a position does not have; ``None``
+        for all.  A ``Season`` column is always added.
+
+    Rows come back by season and week, in CSV order within a week.
+    """
+
+    seasons = [int(season) for season in _as_list(seasons)]
+    positions = [pos.upper() for pos in _as_list(positions)]
+    if isinstance(weeks, int):
+        weeks = (weeks, weeks)
+    data_dir = Path(data_dir or DATA_DIR).resolve()
+    root = Path(root or data_dir / STORE_NAME)
+
+    if pa is None:
+        return _load_csv(sources(data_dir), seasons, positions, weeks, columns)
+    try:
+        _sync_if_stale(data_dir, root)
+    except OSError:
+        return _load_csv(sources(data_dir), seasons, positions, weeks, columns)
+
+    available = sorted(path.name.split('=', 1)[1] for path in root.glob('position=*'))
+    frames = []
+    for pos in positions or available:
+        tables = []
+        for path in sorted((root / f'position={pos}').glob(f'season=*/{PART}')):
+            season = int(path.parent.name.split('=', 1)[1])
+            if seasons and season not in seasons:
+                continue
+            table = _read_partition(path, season, weeks, columns)
+            if table is not None:
+                tables.append(table)
+        # Seasons of a position share a schema; positions are joined in pandas.
+        if tables:
+            frames.append(datastore.to_pandas(pa.concat_tables(tables)))
+    return _finish(frames, columns)
@@ -0,0 +1,197 @@
+"""Schedule and opponent metrics as dense team × week arrays.
+
+:class:`ScheduleMatrix` compiles the long-format schedule of
+:func:`utility.helpers.clean_schedule` once into NumPy arrays indexed by
+``(team code, week)``.  Opponent lookups and the schedule adjustment for any
+number of player-weeks are then array gathers instead of a merge and a
+row-wise apply.
+
+The adjustment multiplier for one game is::
+
+    1 - Opp_DVOA / 100 + Opp_FantasyPointsAllowed / 1000
+
+with missing metrics (byes, unknown teams) counting as 0, so a neutral week
+multiplies by 1.  Strength of schedule (SOS) from a given week is the mean
+multiplier over the remaining games.
+
+:func:`matrix`, :func:`player_sos` and :func:`position_sos` build from the
+shared datasets of :mod:`utility.datasets` and keep their results until the
+data version changes, so repeated queries are dictionary lookups.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+METRICS = ['Opp_DVOA', 'Opp_FantasyPointsAllowed']
+
+# Projection sources that spell a team differently from the schedule.
+TEAM_ALIASES = {'WAS': 'WSH'}
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values.flags.writeable = False
+    return values
+
+
+class ScheduleMatrix:
+    """Team × week opponent table.
+
+    Arrays have one row per team in :attr:`teams` and one column per week
+    number, so ``opponent[code, week]`` needs no offset; column 0 and byes
+    hold ``-1`` / neutral values.
+
+    Parameters
+    ----------
+    schedule:
+        Long-format schedule with ``TEAM``, ``Week``, ``Opponent`` and
+        ``Location`` and optionally the :data:`METRICS` columns.
+    """
+
+    def __init__(self, schedule: pd.DataFrame):
+        self.teams = pd.Index(sorted(schedule['TEAM'].unique()))
+        self.n_weeks = int(schedule['Week'].max()) if len(schedule) else 0
+        shape = (len(self.teams), self.n_weeks + 1)
+
+        rows = self.teams.get_indexer(schedule['TEAM'])
+        weeks = schedule['Week'].to_numpy(dtype=np.int64)
+        opponents = self.teams.get_indexer(schedule['Opponent'])
+
+        self.opponent = np.full(shape, -1, dtype=np.int16)
+        self.opponent[rows, weeks] = opponents
+        self.away = np.zeros(shape, dtype=bool)
+        self.away[rows, weeks] = (schedule['Location'] == 'Away').to_numpy()
+
+        self.metrics = {}
+        for name in METRICS:
+            values = np.zeros(shape)
+            if name in schedule.columns:
+                values[rows, weeks] = schedule[name].fillna(0).to_numpy(dtype=float)
+            self.metrics[name] = _read_only(values)
+
+        multiplier = 1 - self.metrics['Opp_DVOA'] / 100
+        multiplier += self.metrics['Opp_FantasyPointsAllowed'] / 1000
+        self.multiplier = _read_only(multiplier)
+
+        # Suffix sums over weeks: column w covers weeks w..n_weeks.
+        games = self.opponent >= 0
+        self._rest_games = np.cumsum(games[:, ::-1], axis=1)[:, ::-1]
+        self._rest_total = np.cumsum(np.where(games, multiplier, 0.0)[:, ::-1], axis=1)[:, ::-1]
+        _read_only(self.opponent)
+        _read_only(self.away)
+
+        codes = {team: i for i, team in enumerate(self.teams)}
+        codes.update({alias: codes[team] for alias, team in TEAM_ALIASES.items() if team in codes})
+        self._codes = pd.Series(codes, dtype=np.int64)
+
+    def codes(self, teams) -> np.ndarray:
+        """Row of each team in ``teams``; ``-1`` for unknown teams."""
+
+        return self._codes.reindex(np.asarray(teams, dtype=object)).fillna(-1).to_numpy(dtype=np.int64)
+
+    def _gather(self, table: np.ndarray, teams, weeks, fill) -> np.ndarray:
+        rows = self.codes(teams)
+        cols = np.asarray(weeks, dtype=np.int64)
+        valid = (rows >= 0) & (cols >= 0) & (cols <= self.n_weeks)
+        out = np.full(len(rows), fill, dtype=table.dtype)
+        out[valid] = table[rows[valid], cols[valid]]
+        return out
+
+    def opponents(self, teams, weeks) -> np.ndarray:
+        """Opponent abbreviation per team-week, ``'None'`` for byes and unknowns."""
+
+        codes = self._gather(self.opponent, teams, weeks, -1)
+        names = np.append(self.teams.to_numpy(dtype=object), 'None')
+        return names[codes]
+
+    def metric(self, name: str, teams, weeks) -> np.ndarray:
+        """Opponent metric ``name`` per team-week, 0 where missing."""
+
+        return self._gather(self.metrics[name], teams, weeks, 0.0)
+
+    def adjustment(self, teams, weeks) -> np.ndarray:
+        """Schedule multiplier per team-week, 1 where there is no game."""
+
+        return self._gather(self.multiplier, teams, weeks, 1.0)
+
+    def remaining_sos(self, from_week: int = 1) -> pd.Series:
+        """Mean multiplier of each team's games from ``from_week`` on."""
+
+        week = min(max(int(from_week), 0), self.n_weeks + 1)
+        if week > self.n_weeks:
+            return pd.Series(1.0, index=self.teams)
+        games = self._rest_games[:, week]
+        total = self._rest_total[:, week]
+        sos = np.divide(total, games, out=np.ones(len(self.teams)), where=games > 0)
+        return pd.Series(sos, index=self.teams)
+
+
+_lock = threading.Lock()
+_matrix = {}
+_queries = {}
+
+
+def matrix() -> ScheduleMatrix:
+    """:class:`ScheduleMatrix` of the shared ``schedule`` dataset."""
+
+    from utility import datasets
+
+    version = datasets.registry.version('schedule')
+    with _lock:
+        if version not in _matrix:
+            _matrix.clear()
+            _queries.clear()
+            _matrix[version] = ScheduleMatrix(datasets.get('schedule'))
+        return _matrix[version]
+
+
+def _cached(key, build) -> pd.Series:
+    from utility import datasets
+
+    key = (datasets.registry.version('schedule'), datasets.registry.version('offense')) + key
+    with _lock:
+        series = _queries.get(key)
+    if series is None:
+        series = build()
+        _read_only(series.to_numpy())
+        with _lock:
+            _queries[key] = series
+    return series.copy(deep=False)
+
+
+def _players(from_week: int, pos: str | None = None) -> tuple[pd.DataFrame, np.ndarray]:
+    from utility import datasets
+
+    players = datasets.get('offense')
+    if pos:
+        players = players[players['Position'] == pos.upper()]
+    players = players.drop_duplicates('Name')
+    table = matrix()
+    sos = np.append(table.remaining_sos(from_week).to_numpy(), 1.0)[table.codes(players['Team'])]
+    return players, sos
+
+
+def player_sos(from_week: int = 1, pos: str | None = None) -> pd.Series:
+    """Rest-of-season SOS per player name, optionally for one position.
+
+    Players whose team is not on the schedule get the neutral 1.0.
+    """
+
+    def build():
+        players, sos = _players(from_week, pos)
+        return pd.Series(sos, index=pd.Index(players['Name'].astype(object), name='Name'), name='SOS')
+
+    return _cached(('player', int(from_week), pos.upper() if pos else None), build)
+
+
+def position_sos(from_week: int = 1) -> pd.Series:
+    """Mean rest-of-season SOS of the players at each position."""
+
+    def build():
+        players, sos = _players(from_week)
+        positions = players['Position'].astype(object).to_numpy()
+        keep = positions != ''
+        return pd.Series(sos[keep], name='SOS').groupby(positions[keep]).mean().rename_axis('Position')
+
+    return _cached(('position', int(from_week)), build)
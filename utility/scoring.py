@@ -1,21 +1,111 @@
+import hashlib
 import json
+import threading
+from collections.abc import Mapping
 from copy import deepcopy
+from dataclasses import dataclass
+from functools import cached_property
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
-DATA_DIR = Path(__file__).resolve().parents[1] / 'data' / '2024_adv_stats'
-qb_adv_stats = pd.read_csv(DATA_DIR / 'AirYards_by_team.csv')
-rb_adv_stats = pd.read_csv(DATA_DIR / 'RB_by_player.csv')
-wr_adv_stats = pd.read_csv(DATA_DIR / 'WR_by_player.csv')
+from utility import cache, datastore
 
-for df in (qb_adv_stats, rb_adv_stats, wr_adv_stats):
-    if 'Player' in df.columns:
-        df['Player'] = df['Player'].str.replace(r'[^\w\s]', '', regex=True)
+DATA_ROOT = Path(__file__).resolve().parents[1] / 'data'
+DEFAULT_ADV_STATS_SEASON = 2024
+
+
+def adv_stats_dir(season: int) -> Path:
+    """Return the directory holding advanced stats for ``season``."""
+
+    return DATA_ROOT / f'{season}_adv_stats'
+
+
+def normalize_player_name(name) -> str:
+    """Return the lookup key used to join projections to advanced stats.
+
+    Punctuation (including the ``*``/``+`` award markers in older exports) is
+    dropped, whitespace is collapsed and the result is lower-cased so that
+    ``"Ja'Marr Chase"`` and ``"JaMarr Chase"`` resolve to the same player.
+    """
+
+    if not isinstance(name, str):
+        return ''
+    return _normalize_names(pd.Series([name])).iloc[0]
+
+
+def _normalize_names(names: pd.Series) -> pd.Series:
+    return (
+        names.astype('string')
+        .str.replace(r'[^\w\s]', '', regex=True)
+        .str.split()
+        .str.join(' ')
+        .str.lower()
+        .fillna('')
+        .astype(object)
+    )
+
+
+def load_adv_stats(season: int = DEFAULT_ADV_STATS_SEASON):
+    """Read the QB, RB and WR advanced-stat tables for ``season``."""
+
+    data_dir = adv_stats_dir(season)
+    qb_stats = datastore.read_csv(data_dir / 'AirYards_by_team.csv')
+    rb_stats = datastore.read_csv(data_dir / 'RB_by_player.csv')
+    wr_stats = datastore.read_csv(data_dir / 'WR_by_player.csv')
+
+    for df in (qb_stats, rb_stats, wr_stats):
+        if 'Player' in df.columns:
+            df['Player'] = df['Player'].str.replace(r'[^\w\s]', '', regex=True)
+    return qb_stats, rb_stats, wr_stats
+
+
+_adv_stats_cache: dict[int, tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]] = {}
+
+
+def get_adv_stats(season: int | None = None):
+    """Return the cached ``(qb, rb, wr)`` advanced-stat tables for ``season``.
+
+    Nothing is read at import time; each season's CSVs are loaded on first
+    use and reused afterwards.  Call :func:`reset_adv_stats_cache` to force a
+    reload.
+    """
+
+    season = season or DEFAULT_ADV_STATS_SEASON
+    if season not in _adv_stats_cache:
+        _adv_stats_cache[season] = load_adv_stats(season)
+    return _adv_stats_cache[season]
+
+
+def reset_adv_stats_cache() -> None:
+    """Forget loaded advanced stats and the big-play tables derived from them."""
+
+    _adv_stats_cache.clear()
+    _big_play_tables.clear()
+
+# Roster slots per team.  Starting slots set replacement level; the bench
+# only counts toward roster size (one minimum bid is reserved per slot).
+ROSTER_SLOTS_DEFAULT = {
+    'QB': 1,
+    'RB': 2,
+    'WR': 2,
+    'TE': 1,
+    'FLEX': 1,
+    'SUPERFLEX': 0,
+    'BENCH': 10,
+}
+
+# Positions each flexible starting slot can hold, in the order they are filled.
+FLEX_ELIGIBILITY = {
+    'FLEX': ('RB', 'WR', 'TE'),
+    'SUPERFLEX': ('QB', 'RB', 'WR', 'TE'),
+}
 
 LEAGUE_SETTINGS_DEFAULT = {
     'num_teams': 12,
     'initial_budget': 200,
     'team_names': [f'Team {i}' for i in range(1, 13)],
+    'roster_slots': ROSTER_SLOTS_DEFAULT,
 }
 
 QB_SCORING_DEFAULT = {
@@ -68,6 +158,8 @@ def _apply_yardage(value, config):
     return points
 
 def calculate_qb_points(row, config=QB_SCORING_DEFAULT):
+    if isinstance(config, PositionPlan):
+        config = config.to_dict()
     score = 0
     score += _apply_yardage(row['PassYds'], config['PassYds'])
     score += row['PassTD'] * config['PassTD']['points']
@@ -187,55 +279,49 @@ def receiving_bonus(rec, rec_td, wr_player_stats):
     return rec_bonus + td_bonus_80 + td_bonus_60 + td_bonus_40
 
 
-def calculate_rb_wr_points(row):
+def calculate_rb_wr_points(row, adv_season=None):
     """Calculate fantasy points for running backs and wide receivers."""
     rushing = rushing_points(row)
     receiving = receiving_points(row)
     fumbles = row['Fum'] * -3
 
-    # Look up the player's advanced rushing metrics.  If the player isn't
-    # found, assume no bonus points.  The CSVs loaded at module import contain
-    # a ``Player`` column, while ``row`` may use ``Name`` or ``Player`` – handle
-    # both for robustness.
+    # Look up the player's precomputed big-play inputs.  If the player isn't
+    # found, assume no bonus points.  ``row`` may use ``Name`` or ``Player``
+    # – handle both for robustness.
     player_name = row.get('Name') or row.get('Player')
+    table = get_big_play_table(adv_season)
+    key = normalize_player_name(player_name)
+    stats = table.loc[key] if key in table.index else None
 
-    rb_player_stats = rb_adv_stats.loc[rb_adv_stats['Player'] == player_name]
-    if rb_player_stats.empty:
+    if stats is None or not stats['has_rus']:
         rush_td_bonus = 0
     else:
-        rb_player_stats = rb_player_stats.iloc[0].copy()
-        att_per_br = rb_player_stats.get('Att/Br')
-        rb_player_stats['breakaway_rate'] = (
-            1 / att_per_br if att_per_br and att_per_br > 0 else 0
-        )
-        if 'p() 40yd rus' not in rb_player_stats:
-            p20 = (rb_player_stats.get('YBC/Att', 0) + rb_player_stats.get('YAC/Att', 0)) / 20
-            rb_player_stats['p() 40yd rus'] = p20 / 2
-            rb_player_stats['p() 60yd rus'] = p20 / 3
-            rb_player_stats['p() 80yd rus'] = p20 / 4
+        rb_player_stats = pd.Series({
+            'breakaway_rate': stats['rus_breakaway_rate'],
+            'p() 40yd rus': stats['p() 40yd rus'],
+            'p() 60yd rus': stats['p() 60yd rus'],
+            'p() 80yd rus': stats['p() 80yd rus'],
+        })
         rush_td_bonus = rushing_bonus(row['RushTD'], rb_player_stats)
 
-    wr_player_stats = wr_adv_stats.loc[wr_adv_stats['Player'] == player_name]
-    if wr_player_stats.empty:
+    if stats is None or not stats['has_rec']:
         receiving_td_bonus = 0
     else:
-        wr_player_stats = wr_player_stats.iloc[0].copy()
-        rec_per_br = wr_player_stats.get('Rec/Br')
-        wr_player_stats['breakaway_rate'] = (
-            1 / rec_per_br if rec_per_br and rec_per_br > 0 else 0
-        )
-        if 'p() 20yd rec' not in wr_player_stats:
-            p20 = (wr_player_stats.get('ADOT', 0) + wr_player_stats.get('YAC/R', 0)) / 20
-            wr_player_stats['p() 20yd rec'] = p20
-            wr_player_stats['p() 40yd rec'] = p20 / 2
-            wr_player_stats['p() 60yd rec'] = p20 / 3
-            wr_player_stats['p() 80yd rec'] = p20 / 4
+        wr_player_stats = pd.Series({
+            'breakaway_rate': stats['rec_breakaway_rate'],
+            'p() 20yd rec': stats['p() 20yd rec'],
+            'p() 40yd rec': stats['p() 40yd rec'],
+            'p() 60yd rec': stats['p() 60yd rec'],
+            'p() 80yd rec': stats['p() 80yd rec'],
+        })
         receiving_td_bonus = receiving_bonus(row['Rec'], row['RecTD'], wr_player_stats)
 
     score = rushing + receiving + fumbles + rush_td_bonus + receiving_td_bonus
     return score
 
 def calculate_te_points(row, config=TE_SCORING_DEFAULT):
+    if isinstance(config, PositionPlan):
+        config = config.to_dict()
     score = 0
     score += _apply_yardage(row['RecYds'], config['RecYds'])
     score += _apply_yardage(row['Rec'], config['Rec'])
@@ -244,6 +330,207 @@ def calculate_te_points(row, config=TE_SCORING_DEFAULT):
     return score
 
 
+def _stat_array(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Return ``df[col]`` as a float64 array, treating a missing column as zeros.
+
+    Compact (float32) columns are widened here, so scores are computed in
+    full precision whatever the storage dtype.
+    """
+
+    if col not in df.columns:
+        return np.zeros(len(df))
+    values = df[col]
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values, errors='coerce')
+    return values.to_numpy(dtype=float)
+
+
+def _score_rules(df: pd.DataFrame, position_plan: 'PositionPlan') -> np.ndarray:
+    """Sum the yardage and count rules of ``position_plan`` over ``df``."""
+
+    score = np.zeros(len(df))
+    for rule in position_plan.rules:
+        if rule.kind != 'ladder':
+            score = score + rule.score(_stat_array(df, rule.stat))
+    return score
+
+
+def score_qb_frame(df: pd.DataFrame, config=QB_SCORING_DEFAULT) -> np.ndarray:
+    """Score every row of a QB frame in one pass.
+
+    ``config`` is either the QB block of a league configuration or its
+    compiled :class:`PositionPlan`.  Produces the same values as applying
+    :func:`calculate_qb_points` row by row.
+    """
+
+    return _score_rules(df, compile_position_config(config, 'QB'))
+
+
+def score_te_frame(df: pd.DataFrame, config=TE_SCORING_DEFAULT) -> np.ndarray:
+    """Score every row of a TE frame in one pass.
+
+    ``config`` is either the TE block of a league configuration or its
+    compiled :class:`PositionPlan`.  Produces the same values as applying
+    :func:`calculate_te_points` row by row.
+    """
+
+    return _score_rules(df, compile_position_config(config, 'TE'))
+
+
+def _player_names(df: pd.DataFrame) -> pd.Series:
+    """Return the player name column used for advanced-stat lookups."""
+
+    if 'Name' in df.columns:
+        return df['Name']
+    if 'Player' in df.columns:
+        return df['Player']
+    return pd.Series([None] * len(df), index=df.index)
+
+
+def _breakaway_rate(per_breakaway: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(per_breakaway > 0, 1 / per_breakaway, 0)
+
+
+def _big_play_columns(stats: pd.DataFrame, kind: str, per_br: str, depth_cols) -> pd.DataFrame:
+    """Breakaway rate and long-play probabilities for one stat table.
+
+    Explicit ``p() Nyd`` columns are used when present; otherwise the 20-yard
+    probability is estimated from the two depth columns and the longer
+    distances decay from it.  Tables with explicit 40+ yard columns but no
+    20-yard one (rushing tables never carry it) get the depth estimate, or
+    twice the 40-yard probability without depth columns.
+    """
+
+    stats = stats.assign(_key=_normalize_names(stats['Player']))
+    stats = stats[stats['_key'] != ''].drop_duplicates('_key').set_index('_key')
+    columns = {f'{kind}_breakaway_rate': _breakaway_rate(_stat_array(stats, per_br))}
+    has_depth = all(col in stats.columns for col in depth_cols)
+    p20 = sum(_stat_array(stats, col) for col in depth_cols) / 20 if has_depth else None
+    if f'p() 40yd {kind}' in stats.columns:
+        for dist in (40, 60, 80):
+            columns[f'p() {dist}yd {kind}'] = _stat_array(stats, f'p() {dist}yd {kind}')
+        if f'p() 20yd {kind}' in stats.columns:
+            p20 = _stat_array(stats, f'p() 20yd {kind}')
+        elif p20 is None:
+            p20 = columns[f'p() 40yd {kind}'] * 2
+    else:
+        if p20 is None:
+            p20 = np.zeros(len(stats))
+        for dist, divisor in ((40, 2), (60, 3), (80, 4)):
+            columns[f'p() {dist}yd {kind}'] = p20 / divisor
+    columns[f'p() 20yd {kind}'] = p20
+    columns[f'has_{kind}'] = np.ones(len(stats), dtype=bool)
+    return pd.DataFrame(columns, index=stats.index)
+
+
+def build_big_play_table(rb_stats: pd.DataFrame, wr_stats: pd.DataFrame) -> pd.DataFrame:
+    """Precompute per-player big-play inputs keyed by normalized name.
+
+    The result holds one row per player with the rushing (``rus``) and
+    receiving (``rec``) breakaway rates and 20/40/60/80-yard probabilities.
+    ``has_rus``/``has_rec`` record which source table the player appeared in
+    so that unmatched players earn no bonus.
+    """
+
+    rush = _big_play_columns(rb_stats, 'rus', 'Att/Br', ('YBC/Att', 'YAC/Att'))
+    rec = _big_play_columns(wr_stats, 'rec', 'Rec/Br', ('ADOT', 'YAC/R'))
+    table = rush.join(rec, how='outer')
+    for flag in ('has_rus', 'has_rec'):
+        table[flag] = table[flag].eq(True)
+    return table
+
+
+_big_play_tables: dict[int, pd.DataFrame] = {}
+
+
+def get_big_play_table(season: int | None = None) -> pd.DataFrame:
+    """Return the cached big-play table for an advanced-stats season."""
+
+    season = season or DEFAULT_ADV_STATS_SEASON
+    if season not in _big_play_tables:
+        _, rb_stats, wr_stats = get_adv_stats(season)
+        _big_play_tables[season] = build_big_play_table(rb_stats, wr_stats)
+    return _big_play_tables[season]
+
+
+BIG_PLAY_DISTANCES = (20, 40, 60, 80)
+
+# Ladder stat -> (counted stat, probability kind, whether tiers are exclusive).
+# Touchdown ladders pay each tier on the probability of landing in that tier
+# alone; the reception ladder pays every tier the catch reaches.
+BIG_PLAY_RULES = {
+    'BigRushTD': ('RushTD', 'rus', True),
+    'BigRec': ('Rec', 'rec', False),
+    'BigRecTD': ('RecTD', 'rec', True),
+}
+
+
+def _big_play_probabilities(names: pd.Series, season: int | None = None) -> dict:
+    """Breakaway-adjusted long-play probabilities for each name.
+
+    The names are joined to the big-play table with a single hash lookup on
+    the normalized name.  Players missing from a source table get zero
+    probability for that kind.
+    """
+
+    rows = get_big_play_table(season).reindex(_normalize_names(names))
+    probs = {}
+    for kind in ('rus', 'rec'):
+        found = rows[f'has_{kind}'].eq(True).to_numpy()
+        adj = 1 + rows[f'{kind}_breakaway_rate'].to_numpy(dtype=float)
+        for dist in BIG_PLAY_DISTANCES:
+            p = rows[f'p() {dist}yd {kind}'].to_numpy(dtype=float) * adj
+            probs[kind, dist] = np.where(found, p, 0.0)
+    return probs
+
+
+def _big_play_per_unit(rule: 'StatRule', probs: dict, n: int) -> np.ndarray:
+    """Expected bonus per counted play (TD or reception) under one ladder."""
+
+    _, kind, exclusive = BIG_PLAY_RULES[rule.stat]
+    per_unit = np.zeros(n)
+    longer = np.zeros(n)
+    for threshold, bonus in sorted(zip(rule.thresholds, rule.bonuses), reverse=True):
+        p = probs[kind, int(threshold)]
+        per_unit = per_unit + bonus * ((p - longer) if exclusive else p)
+        longer = longer + p
+    return per_unit
+
+
+def _big_play_bonus(df: pd.DataFrame, rule: 'StatRule', probs: dict) -> np.ndarray:
+    """Expected points from one big-play ladder for every row of ``df``."""
+
+    stat = BIG_PLAY_RULES[rule.stat][0]
+    return _stat_array(df, stat) * _big_play_per_unit(rule, probs, len(df))
+
+
+def score_rb_wr_frame(
+    df: pd.DataFrame,
+    config=RB_WR_SCORING_DEFAULT,
+    adv_season: int | None = None,
+) -> np.ndarray:
+    """Score every row of an RB/WR frame in one pass.
+
+    ``config`` is either the RB/WR block of a league configuration or its
+    compiled :class:`PositionPlan`; yardage, reception, touchdown and fumble
+    rules as well as the ``BigRushTD``/``BigRec``/``BigRecTD`` ladders are
+    all taken from it.  Big-play probabilities come from
+    :func:`get_big_play_table` for ``adv_season``.  Under the default
+    configuration this matches applying :func:`calculate_rb_wr_points` row
+    by row.
+    """
+
+    position_plan = compile_position_config(config, 'RB')
+    score = _score_rules(df, position_plan)
+    ladders = [rule for rule in position_plan.rules if rule.stat in BIG_PLAY_RULES]
+    if ladders:
+        probs = _big_play_probabilities(_player_names(df), adv_season)
+        for rule in ladders:
+            score = score + _big_play_bonus(df, rule, probs)
+    return score
+
+
 SCORING_CONFIG_DEFAULT = {
     'league': LEAGUE_SETTINGS_DEFAULT,
     'QB': QB_SCORING_DEFAULT,
@@ -252,6 +539,441 @@ SCORING_CONFIG_DEFAULT = {
     'TE': TE_SCORING_DEFAULT,
 }
 
+POSITION_SCORING_DEFAULTS = {
+    'QB': QB_SCORING_DEFAULT,
+    'RB': RB_WR_SCORING_DEFAULT,
+    'WR': RB_WR_SCORING_DEFAULT,
+    'TE': TE_SCORING_DEFAULT,
+}
+
+
+@dataclass(frozen=True)
+class StatRule:
+    """Compiled scoring rule for a single stat.
+
+    ``kind`` is ``'per'`` for floor-divided stats (``points_per`` units per
+    point), ``'count'`` for a flat number of ``points`` per unit and
+    ``'ladder'`` for distance tiers such as ``BigRushTD``.  Thresholds are
+    numeric and sorted ascending with ``bonuses`` aligned to them.
+    """
+
+    stat: str
+    kind: str
+    points: float = 0.0
+    points_per: float = 1.0
+    thresholds: tuple[float, ...] = ()
+    bonuses: tuple[float, ...] = ()
+
+    @cached_property
+    def _bonus_steps(self):
+        thresholds = np.asarray(self.thresholds, dtype=float)
+        cumulative = np.concatenate([[0.0], np.cumsum(self.bonuses)])
+        return thresholds, cumulative
+
+    def threshold_bonus(self, values: np.ndarray) -> np.ndarray:
+        """Total bonus earned by each value across all thresholds."""
+
+        if not self.thresholds:
+            return np.zeros(len(values))
+        thresholds, cumulative = self._bonus_steps
+        return cumulative[np.searchsorted(thresholds, values, side='right')]
+
+    def score(self, values: np.ndarray) -> np.ndarray:
+        """Points earned by a column of ``values`` under this rule."""
+
+        if self.kind == 'per':
+            return values // self.points_per + self.threshold_bonus(values)
+        if self.kind == 'count':
+            return values * self.points
+        return np.zeros(len(values))
+
+    def to_dict(self) -> dict:
+        if self.kind == 'per':
+            return {
+                'points_per': self.points_per,
+                'bonuses': dict(zip(self.thresholds, self.bonuses)),
+            }
+        if self.kind == 'count':
+            return {'points': self.points}
+        return dict(zip(self.thresholds, self.bonuses))
+
+
+@dataclass(frozen=True)
+class PositionPlan:
+    """Immutable, hashable set of :class:`StatRule` objects for a position."""
+
+    position: str
+    rules: tuple[StatRule, ...]
+
+    def rule(self, stat: str) -> StatRule | None:
+        return next((r for r in self.rules if r.stat == stat), None)
+
+    def to_dict(self) -> dict:
+        """Return the plan as a position config block with numeric keys."""
+
+        return {rule.stat: rule.to_dict() for rule in self.rules}
+
+
+@dataclass(frozen=True)
+class ScoringPlan:
+    """Validated league configuration ready for the scoring kernels.
+
+    Plans are immutable and hashable so they can be used as cache keys.
+    Build them with :func:`compile_scoring_config`.
+    """
+
+    num_teams: int
+    initial_budget: float
+    adv_stats_season: int | None
+    positions: tuple[PositionPlan, ...]
+    roster_slots: tuple[tuple[str, int], ...] = tuple(ROSTER_SLOTS_DEFAULT.items())
+
+    @property
+    def slots(self) -> dict:
+        return dict(self.roster_slots)
+
+    @property
+    def roster_size(self) -> int:
+        return sum(count for _, count in self.roster_slots)
+
+    @cached_property
+    def digest(self) -> str:
+        """Stable content hash, equal for plans compiled from equal configs."""
+
+        return hashlib.sha1(repr(self).encode()).hexdigest()
+
+    def position(self, pos: str) -> PositionPlan:
+        pos = pos.upper()
+        for plan in self.positions:
+            if plan.position == pos:
+                return plan
+        raise KeyError(pos)
+
+
+def _as_number(value, where: str) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f'{where}: expected a number, got {value!r}')
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{where}: expected a number, got {value!r}') from None
+    if not np.isfinite(number):
+        raise ValueError(f'{where}: expected a finite number, got {value!r}')
+    return number
+
+
+def _compile_thresholds(mapping, where: str):
+    if not isinstance(mapping, Mapping):
+        raise ValueError(f'{where}: expected a mapping of threshold to points')
+    pairs = sorted(
+        (_as_number(threshold, f'{where} threshold'), _as_number(bonus, f'{where}[{threshold!r}]'))
+        for threshold, bonus in mapping.items()
+    )
+    return tuple(t for t, _ in pairs), tuple(b for _, b in pairs)
+
+
+def _compile_rule(stat: str, entry, where: str) -> StatRule:
+    if not isinstance(entry, Mapping):
+        raise ValueError(f'{where}: expected a mapping, got {entry!r}')
+    if 'points_per' in entry:
+        points_per = _as_number(entry['points_per'], f'{where}.points_per')
+        if points_per <= 0:
+            raise ValueError(f'{where}.points_per: must be positive, got {points_per!r}')
+        thresholds, bonuses = _compile_thresholds(entry.get('bonuses', {}), f'{where}.bonuses')
+        return StatRule(stat, 'per', points_per=points_per, thresholds=thresholds, bonuses=bonuses)
+    if 'points' in entry:
+        return StatRule(stat, 'count', points=_as_number(entry['points'], f'{where}.points'))
+    thresholds, bonuses = _compile_thresholds(entry, where)
+    if stat in BIG_PLAY_RULES:
+        unknown = [t for t in thresholds if t not in BIG_PLAY_DISTANCES]
+        if unknown:
+            raise ValueError(
+                f'{where}: distances must be among {BIG_PLAY_DISTANCES}, got {unknown}'
+            )
+    return StatRule(stat, 'ladder', thresholds=thresholds, bonuses=bonuses)
+
+
+def compile_position_config(config, pos: str) -> PositionPlan:
+    """Compile one position block, filling missing stats from the defaults.
+
+    Already compiled :class:`PositionPlan` objects are returned unchanged.
+    """
+
+    if isinstance(config, PositionPlan):
+        return config
+    pos = pos.upper()
+    if config is None:
+        config = {}
+    if not isinstance(config, Mapping):
+        raise ValueError(f'{pos}: expected a mapping, got {config!r}')
+    merged = {**POSITION_SCORING_DEFAULTS.get(pos, {}), **config}
+    rules = tuple(
+        _compile_rule(str(stat), entry, f'{pos}.{stat}') for stat, entry in merged.items()
+    )
+    return PositionPlan(pos, rules)
+
+
+def _compile_roster_slots(slots) -> tuple[tuple[str, int], ...]:
+    slots = slots or {}
+    if not isinstance(slots, Mapping):
+        raise ValueError(f'league.roster_slots: expected a mapping, got {slots!r}')
+    unknown = set(slots) - set(ROSTER_SLOTS_DEFAULT)
+    if unknown:
+        raise ValueError(f'league.roster_slots: unknown slot {sorted(unknown)[0]!r}')
+    compiled = []
+    for slot, default in ROSTER_SLOTS_DEFAULT.items():
+        count = _as_number(slots.get(slot, default), f'league.roster_slots.{slot}')
+        if count < 0 or count != int(count):
+            raise ValueError(
+                f'league.roster_slots.{slot}: expected a non-negative integer, got {count!r}'
+            )
+        compiled.append((slot, int(count)))
+    if not any(count for slot, count in compiled if slot != 'BENCH'):
+        raise ValueError('league.roster_slots: at least one starting slot is required')
+    return tuple(compiled)
+
+
+def compile_scoring_config(config) -> ScoringPlan:
+    """Validate a league configuration and compile it into a :class:`ScoringPlan`.
+
+    String thresholds from JSON round-trips are converted to sorted numbers
+    once here instead of on every scored row.  Missing positions and stats
+    fall back to the defaults, while malformed values raise ``ValueError``
+    naming the offending setting.
+    """
+
+    if isinstance(config, ScoringPlan):
+        return config
+    config = config or SCORING_CONFIG_DEFAULT
+    if not isinstance(config, Mapping):
+        raise ValueError(f'scoring config: expected a mapping, got {config!r}')
+
+    league = config.get('league') or {}
+    if not isinstance(league, Mapping):
+        raise ValueError(f'league: expected a mapping, got {league!r}')
+    num_teams = _as_number(
+        league.get('num_teams', LEAGUE_SETTINGS_DEFAULT['num_teams']), 'league.num_teams'
+    )
+    if num_teams < 1 or num_teams != int(num_teams):
+        raise ValueError(f'league.num_teams: expected a positive integer, got {num_teams!r}')
+    initial_budget = _as_number(
+        league.get('initial_budget', LEAGUE_SETTINGS_DEFAULT['initial_budget']),
+        'league.initial_budget',
+    )
+    if initial_budget <= 0:
+        raise ValueError(f'league.initial_budget: must be positive, got {initial_budget!r}')
+    season = league.get('adv_stats_season')
+    if season is not None:
+        season = int(_as_number(season, 'league.adv_stats_season'))
+
+    positions = tuple(
+        compile_position_config(config.get(pos), pos) for pos in POSITION_SCORING_DEFAULTS
+    )
+    roster_slots = _compile_roster_slots(league.get('roster_slots'))
+    return ScoringPlan(int(num_teams), initial_budget, season, positions, roster_slots)
+
+
+
+def score_frame(
+    df: pd.DataFrame,
+    pos: str,
+    config: dict | None = None,
+    adv_season: int | None = None,
+) -> np.ndarray:
+    """Return fantasy points for every row of a single-position frame.
+
+    Parameters
+    ----------
+    df:
+        Frame holding the statistical columns for one position.
+    pos:
+        Position code (``QB``, ``RB``, ``WR`` or ``TE``).  Other positions
+        score zero.
+    config:
+        Optional league configuration or compiled :class:`ScoringPlan`.  If
+        omitted, :data:`SCORING_CONFIG_DEFAULT` is used.
+    adv_season:
+        Advanced-stats season used for RB/WR big-play bonuses.  Defaults to
+        the plan's ``adv_stats_season``.
+    """
+
+    plan = compile_scoring_config(config)
+    pos = pos.upper()
+    if pos == 'QB':
+        return score_qb_frame(df, plan.position('QB'))
+    if pos in ('RB', 'WR'):
+        season = adv_season or plan.adv_stats_season
+        return score_rb_wr_frame(df, plan.position(pos), season)
+    if pos == 'TE':
+        return score_te_frame(df, plan.position('TE'))
+    return np.zeros(len(df))
+
+
+def _batch_rule_points(values: np.ndarray, rules) -> np.ndarray:
+    """Points for one stat column under ``N`` rules at once.
+
+    ``rules`` holds one :class:`StatRule` (or ``None`` when a plan does not
+    score the stat) per configuration.  Rule parameters are packed into
+    arrays so each configuration becomes a row of an ``N x rows`` result via
+    broadcasting; threshold ladders of different lengths are padded with
+    ``inf`` thresholds worth zero points.
+    """
+
+    n = len(rules)
+    is_per = np.array([r is not None and r.kind == 'per' for r in rules])
+    is_count = np.array([r is not None and r.kind == 'count' for r in rules])
+    points_per = np.array([r.points_per if r is not None and r.kind == 'per' else 1.0 for r in rules])
+    points = np.array([r.points if r is not None and r.kind == 'count' else 0.0 for r in rules])
+
+    out = np.where(is_per[:, None], values[None, :] // points_per[:, None], 0.0)
+    out = out + np.where(is_count[:, None], points[:, None] * values[None, :], 0.0)
+
+    width = max((len(r.thresholds) for r in rules if r is not None and r.kind == 'per'), default=0)
+    if width:
+        thresholds = np.full((n, width), np.inf)
+        bonuses = np.zeros((n, width))
+        for i, rule in enumerate(rules):
+            if is_per[i]:
+                thresholds[i, :len(rule.thresholds)] = rule.thresholds
+                bonuses[i, :len(rule.bonuses)] = rule.bonuses
+        hits = values[None, None, :] >= thresholds[:, :, None]
+        out = out + (hits * bonuses[:, :, None]).sum(axis=1)
+    return out
+
+
+def score_frame_batch(
+    df: pd.DataFrame,
+    pos: str,
+    configs,
+    adv_season: int | None = None,
+) -> np.ndarray:
+    """Score a single-position frame under many configurations in one pass.
+
+    Parameters
+    ----------
+    df:
+        Frame holding the statistical columns for one position.
+    pos:
+        Position code (``QB``, ``RB``, ``WR`` or ``TE``).
+    configs:
+        Sequence of ``N`` league configurations or compiled plans.
+    adv_season:
+        Advanced-stats season used for RB/WR big-play bonuses.  Defaults to
+        each plan's ``adv_stats_season``.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``N x len(df)`` matrix whose row ``i`` equals
+        ``score_frame(df, pos, configs[i])``.
+    """
+
+    plans = [compile_scoring_config(config) for config in configs]
+    pos = pos.upper()
+    out = np.zeros((len(plans), len(df)))
+    if pos not in POSITION_SCORING_DEFAULTS:
+        return out
+
+    position_plans = [plan.position(pos) for plan in plans]
+    stats = dict.fromkeys(
+        rule.stat for plan in position_plans for rule in plan.rules if rule.kind != 'ladder'
+    )
+    for stat in stats:
+        rules = [plan.rule(stat) for plan in position_plans]
+        out = out + _batch_rule_points(_stat_array(df, stat), rules)
+
+    # Big-play ladders scale a per-player probability, so they are added per
+    # configuration with the probabilities looked up once per season.
+    probs_by_season = {}
+    for i, (plan, position_plan) in enumerate(zip(plans, position_plans)):
+        for rule in position_plan.rules:
+            if rule.stat not in BIG_PLAY_RULES:
+                continue
+            season = adv_season or plan.adv_stats_season
+            if season not in probs_by_season:
+                probs_by_season[season] = _big_play_probabilities(_player_names(df), season)
+            out[i] = out[i] + _big_play_bonus(df, rule, probs_by_season[season])
+    return out
+
+
+class ContributionCache:
+    """Per-stat point contributions for one position frame.
+
+    Fantasy points are a sum of independent per-stat terms, so when the
+    configuration changes only the terms whose compiled :class:`StatRule`
+    differs are recomputed before the columns are re-summed.  Editing a
+    single setting therefore costs one array operation instead of a full
+    rescore.
+
+    Parameters
+    ----------
+    df:
+        Frame holding the statistical columns for one position.  It is
+        treated as read-only for the lifetime of the cache.
+    pos:
+        Position code of ``df``.
+    """
+
+    def __init__(self, df: pd.DataFrame, pos: str):
+        self.pos = pos.upper()
+        self._df = df
+        self._signatures: dict[str, object] = {}
+        self._columns: dict[str, np.ndarray] = {}
+        self._probs: dict[int | None, dict] = {}
+        self._lock = threading.Lock()
+        self.recomputed: tuple[str, ...] = ()
+
+    def _terms(self, plan: ScoringPlan, adv_season: int | None):
+        """Map each term to a signature and a function computing its column."""
+
+        df = self._df
+        if self.pos not in POSITION_SCORING_DEFAULTS:
+            return {}
+        season = adv_season or plan.adv_stats_season
+        terms = {}
+        for rule in plan.position(self.pos).rules:
+            if rule.kind != 'ladder':
+                terms[rule.stat] = (
+                    rule,
+                    lambda rule=rule: rule.score(_stat_array(df, rule.stat)),
+                )
+            elif rule.stat in BIG_PLAY_RULES:
+                terms[rule.stat] = (
+                    (rule, season),
+                    lambda rule=rule: _big_play_bonus(df, rule, self._probabilities(season)),
+                )
+        return terms
+
+    def _probabilities(self, season: int | None) -> dict:
+        if season not in self._probs:
+            self._probs[season] = _big_play_probabilities(_player_names(self._df), season)
+        return self._probs[season]
+
+    def points(self, config=None, adv_season: int | None = None) -> np.ndarray:
+        """Return total points under ``config``, reusing unchanged terms.
+
+        The names of the terms that had to be recomputed are recorded in
+        :attr:`recomputed`.
+        """
+
+        plan = compile_scoring_config(config)
+        terms = self._terms(plan, adv_season)
+        with self._lock:
+            recomputed = []
+            for key, (signature, compute) in terms.items():
+                if key not in self._columns or self._signatures[key] != signature:
+                    self._columns[key] = compute()
+                    self._signatures[key] = signature
+                    recomputed.append(key)
+            for key in set(self._columns) - set(terms):
+                del self._columns[key]
+                del self._signatures[key]
+            self.recomputed = tuple(recomputed)
+            total = np.zeros(len(self._df))
+            for column in self._columns.values():
+                total = total + column
+        return total
+
 
 def save_config(path: str | Path, config: dict) -> None:
     """Serialize a scoring configuration to JSON.
@@ -274,7 +996,9 @@ def load_config(path: str | Path) -> dict:
     """Load a scoring configuration from JSON.
 
     If the file does not exist or cannot be parsed, a deep copy of
-    :data:`SCORING_CONFIG_DEFAULT` is returned.
+    :data:`SCORING_CONFIG_DEFAULT` is returned.  A file that parses but holds
+    malformed settings raises ``ValueError`` from
+    :func:`compile_scoring_config` rather than silently skipping bonuses.
     """
 
     path = Path(path)
@@ -283,14 +1007,22 @@ def load_config(path: str | Path) -> dict:
     try:
         with path.open(encoding='utf-8') as f:
             data = json.load(f)
-        if isinstance(data, dict):
-            return data
     except Exception:
-        pass
-    return deepcopy(SCORING_CONFIG_DEFAULT)
+        data = None
+    if not isinstance(data, dict):
+        return deepcopy(SCORING_CONFIG_DEFAULT)
+    try:
+        compile_scoring_config(data)
+    except ValueError as exc:
+        raise ValueError(f'{path}: {exc}') from exc
+    return data
 
 
-def calculate_prop_points(df: pd.DataFrame, config: dict | None = None) -> pd.DataFrame:
+def calculate_prop_points(
+    df: pd.DataFrame,
+    config: dict | None = None,
+    adv_season: int | None = None,
+) -> pd.DataFrame:
     """Calculate fantasy points for each player based on position.
 
     Parameters
@@ -299,36 +1031,46 @@ def calculate_prop_points(df: pd.DataFrame, config: dict | None = None) -> pd.Da
         DataFrame containing at least ``Pos`` and the statistical columns used
         by the scoring functions.
     config:
-        Optional mapping of position to scoring configuration.  If omitted,
-        :data:`SCORING_CONFIG_DEFAULT` is used.
+        Optional league configuration or compiled :class:`ScoringPlan`.  If
+        omitted, :data:`SCORING_CONFIG_DEFAULT` is used.
+    adv_season:
+        Advanced-stats season used for RB/WR big-play bonuses.  Defaults to
+        the plan's ``adv_stats_season``.
+
+    Results are cached in :data:`utility.cache.results` by plan digest and
+    the contents of ``df``, so repeated calls with an equivalent config
+    return a copy of the earlier result.
     """
 
     if df is None or df.empty:
         return df
 
-    config = config or SCORING_CONFIG_DEFAULT
+    plan = compile_scoring_config(config)
+    adv_season = adv_season or plan.adv_stats_season
+    key = ('prop_points', plan.digest, adv_season, cache.data_version(df))
+    return cache.results.get_or_compute(
+        key, lambda: _score_props(df, plan, adv_season)
+    )
+
+
+def _score_props(df: pd.DataFrame, plan: ScoringPlan, adv_season: int) -> pd.DataFrame:
     df = df.copy()
     df['Pos'] = df['Pos'].str.upper()
 
     qb_mask = df['Pos'] == 'QB'
     if qb_mask.any():
-        qb_cfg = config.get('QB', QB_SCORING_DEFAULT)
-        df.loc[qb_mask, 'ModelPoints'] = df.loc[qb_mask].apply(
-            lambda row: calculate_qb_points(row, qb_cfg), axis=1
-        )
+        df.loc[qb_mask, 'ModelPoints'] = score_qb_frame(df.loc[qb_mask], plan.position('QB'))
 
-    rb_wr_mask = df['Pos'].isin(['RB', 'WR'])
-    if rb_wr_mask.any():
-        df.loc[rb_wr_mask, 'ModelPoints'] = df.loc[rb_wr_mask].apply(
-            calculate_rb_wr_points, axis=1
-        )
+    for pos in ('RB', 'WR'):
+        pos_mask = df['Pos'] == pos
+        if pos_mask.any():
+            df.loc[pos_mask, 'ModelPoints'] = score_rb_wr_frame(
+                df.loc[pos_mask], plan.position(pos), adv_season
+            )
 
     te_mask = df['Pos'] == 'TE'
     if te_mask.any():
-        te_cfg = config.get('TE', TE_SCORING_DEFAULT)
-        df.loc[te_mask, 'ModelPoints'] = df.loc[te_mask].apply(
-            lambda row: calculate_te_points(row, te_cfg), axis=1
-        )
+        df.loc[te_mask, 'ModelPoints'] = score_te_frame(df.loc[te_mask], plan.position('TE'))
 
     df['ModelPoints'] = pd.to_numeric(df['ModelPoints'], errors='coerce').fillna(0)
     return df
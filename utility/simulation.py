@@ -0,0 +1,242 @@
+"""Distributional (Monte Carlo) weekly scoring.
+
+Threshold bonuses and floor-divided yardage are non-linear, so scoring a
+mean projection misprices players whose outcomes straddle a threshold: a
+back projected for 95 rushing yards never earns a 100-yard bonus, even
+though he clears it in a large share of weeks.  :func:`simulate_points`
+instead samples each stat around its projection and reports expected points
+and percentiles per player-week.
+
+Yardage stats are drawn from a lognormal distribution with the projection
+as its mean and a per-stat coefficient of variation (:data:`SIMULATION_CV`);
+every other stat is treated as a Poisson count.  Stats are sampled
+independently of one another.
+
+Two observations keep the simulation fast.  Only per-row results are
+reported, so one set of standard draws per stat can be shared by every row
+without changing any row's distribution.  And with the draws sorted, each
+stat's score is a step function of the draw, so a row's scores for all draws
+come from placing that row's step points with ``searchsorted`` and taking a
+single cumulative sum, regardless of how many thresholds the rule has.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utility import helpers, scoring
+
+SIMULATION_CV = {'PassYds': 0.3, 'RushYds': 0.6, 'RecYds': 0.6}
+DEFAULT_DRAWS = 10_000
+# Upper bound on the number of float32 cells per working matrix (~64 MB).
+CHUNK_CELLS = 1 << 24
+
+
+def _stat_rules(position_plan):
+    """Group a position's rules by the stat column they score.
+
+    Returns a mapping of stat to ``(rule, ladders)`` where ``rule`` scores the
+    stat directly (or is ``None``) and ``ladders`` are big-play rules whose
+    expected bonus scales with the same count.
+    """
+
+    stats = {}
+    for rule in position_plan.rules:
+        if rule.kind != 'ladder':
+            stats.setdefault(rule.stat, [None, []])[0] = rule
+        elif rule.stat in scoring.BIG_PLAY_RULES:
+            stat = scoring.BIG_PLAY_RULES[rule.stat][0]
+            stats.setdefault(stat, [None, []])[1].append(rule)
+    return stats
+
+
+def _add_steps(total, marks, cuts, weights, sorted_draws, ranks, side):
+    """Add per-row step functions evaluated at every draw to ``total``.
+
+    ``cuts`` and ``weights`` are ``rows x K``: row ``r`` gains ``weights[r, k]``
+    at every draw beyond ``cuts[r, k]``.  ``marks`` is a ``rows x (n + 1)``
+    scratch buffer.  ``ranks`` maps each draw to its sorted position; ``None``
+    adds the values in sorted order, which is fine for the first stat because
+    only the pairing of draws across stats matters.
+    """
+
+    rows, width = cuts.shape
+    starts = np.searchsorted(sorted_draws, cuts.ravel(), side=side)
+    marks.fill(0)
+    np.add.at(marks, (np.repeat(np.arange(rows), width), starts), weights.ravel())
+    np.cumsum(marks, axis=1, out=marks)
+    if ranks is None:
+        total += marks[:, :-1]
+    else:
+        total += np.take(marks, ranks, axis=1)
+
+
+def _poisson_steps(mean, table_for):
+    """Step points of Poisson-distributed counts in uniform-draw space.
+
+    ``table_for(k)`` returns the ``rows x len(k)`` score of ``k`` events.
+    Returns the score of zero events and the ``(cuts, weights)`` steps.
+    """
+
+    lam = np.clip(mean, 0, None)
+    lam_max = float(lam.max()) if len(lam) else 0.0
+    k = np.arange(int(np.ceil(lam_max + 8 * np.sqrt(lam_max) + 8)))
+    log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, len(k))))])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_pmf = k * np.log(lam)[:, None] - lam[:, None] - log_fact
+    pmf = np.exp(log_pmf)
+    pmf[lam == 0] = (k == 0)
+    cdf = np.cumsum(pmf, axis=1)[:, :-1]
+    table = table_for(k)
+    return table[:, 0], cdf, np.diff(table, axis=1)
+
+
+def _lognormal_steps(mean, rule, top_multiplier):
+    """Step points of a floor-divided yardage rule in multiplier space.
+
+    A row's outcome is ``mean * multiplier``, so a yardage step at ``y``
+    falls at multiplier ``y / mean``.
+    """
+
+    top = mean.max(initial=0) * top_multiplier
+    steps = np.arange(1, int(top // rule.points_per) + 1) * rule.points_per
+    values = np.concatenate([steps, rule.thresholds])
+    bonus = np.concatenate([np.ones(len(steps)), rule.bonuses])
+    with np.errstate(divide='ignore'):
+        cuts = values[None, :] / mean[:, None]
+    cuts[mean <= 0] = np.inf
+    return cuts, np.broadcast_to(bonus, cuts.shape)
+
+
+def simulate_points(
+    df: pd.DataFrame,
+    pos: str,
+    config=None,
+    n_draws: int = DEFAULT_DRAWS,
+    seed: int | None = 0,
+    percentiles=(10, 50, 90),
+    cv: dict | None = None,
+    chunk_rows: int | None = None,
+    adv_season: int | None = None,
+) -> pd.DataFrame:
+    """Simulate weekly fantasy points for every row of a position frame.
+
+    Parameters
+    ----------
+    df:
+        Frame of mean weekly projections for one position.
+    pos:
+        Position code (``QB``, ``RB``, ``WR`` or ``TE``).
+    config:
+        League configuration or compiled :class:`~utility.scoring.ScoringPlan`.
+    n_draws:
+        Number of simulated weeks per row.
+    seed:
+        Seed for the random generator; results do not depend on
+        ``chunk_rows``.
+    percentiles:
+        Percentiles of the simulated points to report.
+    cv:
+        Overrides for :data:`SIMULATION_CV`.
+    chunk_rows:
+        Rows simulated at a time.  Defaults to a size that keeps each working
+        matrix under :data:`CHUNK_CELLS` cells.
+    adv_season:
+        Advanced-stats season used for RB/WR big-play bonuses.
+
+    Returns
+    -------
+    pandas.DataFrame
+        ``ExpectedPoints`` plus one ``P{q}`` column per percentile, indexed
+        like ``df``.
+    """
+
+    plan = scoring.compile_scoring_config(config)
+    pos = pos.upper()
+    columns = ['ExpectedPoints'] + [f'P{q:g}' for q in percentiles]
+    if pos not in scoring.POSITION_SCORING_DEFAULTS or df.empty:
+        return pd.DataFrame(0.0, index=df.index, columns=columns)
+
+    cv = {**SIMULATION_CV, **(cv or {})}
+    stats = _stat_rules(plan.position(pos))
+    per_unit = {}
+    if any(ladders for _, ladders in stats.values()):
+        season = adv_season or plan.adv_stats_season
+        probs = scoring._big_play_probabilities(scoring._player_names(df), season)
+        for stat, (_, ladders) in stats.items():
+            per_unit[stat] = sum(
+                scoring._big_play_per_unit(rule, probs, len(df)) for rule in ladders
+            )
+
+    # One set of sorted draws per stat, shared by every row and every chunk.
+    rng = np.random.default_rng(seed)
+    draws = {}
+    for i, stat in enumerate(stats):
+        if stat in cv:
+            sigma2 = np.log1p(cv[stat] ** 2)
+            values = np.exp(np.sqrt(sigma2) * rng.standard_normal(n_draws) - sigma2 / 2)
+        else:
+            values = rng.random(n_draws)
+        order = np.argsort(values)
+        ranks = None
+        if i:
+            ranks = np.empty_like(order)
+            ranks[order] = np.arange(n_draws)
+        draws[stat] = (values[order], ranks)
+
+    chunk_rows = chunk_rows or max(1, CHUNK_CELLS // n_draws)
+    q_index = np.clip(np.round(np.asarray(percentiles) / 100 * (n_draws - 1)).astype(int), 0, n_draws - 1)
+    result = np.empty((len(df), len(columns)))
+    total = np.empty((min(chunk_rows, len(df)), n_draws), dtype=np.float32)
+    marks = np.empty((len(total), n_draws + 1), dtype=np.float32)
+
+    for start in range(0, len(df), chunk_rows):
+        part = df.iloc[start:start + chunk_rows]
+        rows = slice(start, start + len(part))
+        n = len(part)
+        total[:n] = 0
+        for stat, (rule, ladders) in stats.items():
+            mean = np.nan_to_num(scoring._stat_array(part, stat))
+            sorted_draws, ranks = draws[stat]
+            if stat in cv and not ladders:
+                if rule.kind == 'count':
+                    # Linear in the draw; no steps needed.
+                    total[:n] += np.outer(mean * rule.points, sorted_draws[ranks] if ranks is not None else sorted_draws)
+                elif rule.kind == 'per':
+                    cuts, weights = _lognormal_steps(mean, rule, sorted_draws[-1])
+                    _add_steps(total[:n], marks[:n], cuts, weights, sorted_draws, ranks, 'left')
+                continue
+            unit = np.nan_to_num(per_unit[stat][rows]) if ladders else np.zeros(n)
+
+            def table_for(k, rule=rule, unit=unit):
+                base = rule.score(k.astype(float)) if rule is not None else np.zeros(len(k))
+                return base[None, :] + unit[:, None] * k[None, :]
+
+            base, cuts, weights = _poisson_steps(mean, table_for)
+            total[:n] += base[:, None]
+            _add_steps(total[:n], marks[:n], cuts, weights, sorted_draws, ranks, 'right')
+
+        block = total[:n]
+        result[rows, 0] = block.mean(axis=1)
+        block.partition(q_index, axis=1)
+        result[rows, 1:] = block[:, q_index]
+
+    return pd.DataFrame(result, index=df.index, columns=columns)
+
+
+def simulate_weekly_projections(config=None, n_draws: int = DEFAULT_DRAWS, seed: int | None = 0, **kwargs) -> pd.DataFrame:
+    """Simulate every QB/RB/WR/TE player-week in the 2025 weekly projections.
+
+    Extra keyword arguments are passed to :func:`simulate_points`.  Returns
+    one row per player-week with ``Name``, ``Position``, ``Team`` and
+    ``Week`` alongside the simulated columns.
+    """
+
+    df = helpers.get_offense_data().rename(
+        columns={'_position': 'Position', '_team': 'Team', 'Lost': 'Fum'}
+    )
+    df = df[df['Position'].isin(list(scoring.POSITION_SCORING_DEFAULTS))].reset_index(drop=True)
+    parts = [
+        simulate_points(frame, pos, config, n_draws=n_draws, seed=seed, **kwargs)
+        for pos, frame in df.groupby('Position', observed=True)
+    ]
+    return df[['Name', 'Position', 'Team', 'Week']].join(pd.concat(parts))